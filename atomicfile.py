@@ -0,0 +1,59 @@
+"""Write files so that readers never see them half written
+
+Every writer in the build (stages running in parallel threads,
+extract-tikz.py's worker processes, serve.py reading docs/ meanwhile)
+writes to a temporary file next to the target and renames it over the
+target, which is atomic. The temporary name carries the process and
+thread, so concurrent writers never share one; a run that is killed can
+leave one behind, which is why compress.py, precache.py and budget.py
+skip names containing TMP_MARKER.
+"""
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+
+TMP_MARKER = '.tmp-'
+
+@contextmanager
+def replacing(path):
+    """Yield a temporary path to write; it replaces path when the body
+    completes and is removed if the body fails. path's directory is created."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}{TMP_MARKER}{os.getpid()}-{threading.get_ident()}'
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def write_text(path, text):
+    with replacing(path) as tmp:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+def write_bytes(path, data):
+    with replacing(path) as tmp:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+
+def copy(src, dest):
+    with replacing(dest) as tmp:
+        shutil.copyfile(src, tmp)
+
+def read_json(path):
+    """The JSON object in path, or {} if it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_json(path, data, **options):
+    """json.dump() with indent=2 and sort_keys=True unless options say otherwise"""
+    options = {'indent': 2, 'sort_keys': True, **options}
+    with replacing(path) as tmp:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **options)
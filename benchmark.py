@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""Benchmark the build on synthetic theses of growing size
+
+Generates LaTeX documents with a given number of chapters, each with
+tikzcd diagrams, inline and display formulas and theorem environments,
+and times the parts of the build that depend on the thesis:
+
+- extract-tikz.py with an empty cache, and again with everything cached
+- the pandoc conversion with tikzcd-filter.lua
+- the HTML post-processing (htmlpost.py)
+- prerender-math.py on the thesis's formulas as pandoc leaves them
+
+--scale runs the same document at several sizes (1,2,4 = 1x, 2x and 4x the
+chapters), so the report shows throughput (diagrams/s, formulas/s) and how
+each phase grows with the document. Every size runs in its own directory
+under build/bench/, so the repository's caches and docs/ are not touched.
+
+--stand-in replaces pdflatex and dvisvgm with small scripts that produce
+plausible DVI/SVG files instantly, for machines without TeX; the numbers
+then measure the build's own overhead (processes, caching, SVG
+optimisation), not TeX. The pandoc phases are skipped when pandoc is not
+installed.
+
+Results are written to bench-results/ and compared with the previous run:
+
+    python3 benchmark.py [--chapters 4] [--scale 1,2,4,8] [--jobs N] [--repeat N]
+                         [--stand-in] [--label NAME] [--compare FILE]
+"""
+import argparse
+import glob
+import html
+import json
+import math
+import os
+import platform
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+import buildtrace
+import htmlpost
+import toolchain
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = 'build/bench'
+RESULTS_DIR = 'bench-results'
+
+# Per chapter
+DIAGRAMS = 6
+INLINE_FORMULAS = 40
+DISPLAY_FORMULAS = 10
+THEOREMS = 8
+
+# Slower than this against the previous run is flagged
+REGRESSION = 1.10
+
+PREAMBLE = r"""\documentclass[11pt]{book}
+\usepackage[utf8]{inputenc}
+\usepackage{amsmath,amssymb,amsthm}
+\usepackage{tikz-cd}
+\newtheorem{theorem}{Theorem}[chapter]
+\newtheorem{lemma}[theorem]{Lemma}
+\newtheorem{proposition}[theorem]{Proposition}
+\theoremstyle{definition}
+\newtheorem{definition}[theorem]{Definition}
+\begin{document}
+"""
+
+# ---------------------------------------------------------------------------
+# Synthetic thesis
+
+OBJECTS = ['A', 'B', 'C', 'M', 'N', 'X', 'Y', 'G', 'H', 'K']
+MORPHISMS = ['f', 'g', 'h', 'u', 'v', r'\varphi', r'\psi', r'\alpha', r'\iota', r'\pi']
+THEOREM_KINDS = ['theorem', 'lemma', 'proposition', 'definition']
+
+def inline_formula(rng):
+    a, b = rng.sample(OBJECTS, 2)
+    f = rng.choice(MORPHISMS)
+    return rng.choice([
+        rf'${f}\colon {a}_{{{rng.randint(1, 9)}}} \to {b}$',
+        rf'$\ker {f} \subseteq {a} \oplus {b}$',
+        rf'$\operatorname{{Hom}}({a}, {b}) \cong {b}^{{{rng.randint(2, 5)}}}$',
+        rf'$\sum_{{i=1}}^{{n}} {a}_i \otimes {b}_i$',
+        rf'${a}/{f}({b}) \simeq \mathbb{{Z}}_{{{rng.randint(2, 12)}}}$',
+    ])
+
+def display_formula(rng):
+    a, b, c = rng.sample(OBJECTS, 3)
+    n = rng.randint(1, 6)
+    return rng.choice([
+        rf'\[ 0 \to {a} \xrightarrow{{f}} {b} \xrightarrow{{g}} {c} \to 0 \]',
+        rf'\begin{{equation}} \operatorname{{Ext}}^{{{n}}}({a}, {b}) \cong \varinjlim_{{i}} H^{{{n}}}({c}_i) \end{{equation}}',
+        rf'\[ \dim_k {a} = \sum_{{j=0}}^{{{n}}} (-1)^j \dim_k {b}_j \]',
+        rf'\begin{{align}} {a} \otimes_R {b} &\cong {b} \otimes_R {a} \\ ({a} \otimes {b}) \otimes {c} &\cong {a} \otimes ({b} \otimes {c}) \end{{align}}',
+    ])
+
+def diagram(rng, index):
+    """A commutative square or triangle; index makes every body unique"""
+    a, b, c, d = rng.sample(OBJECTS, 4)
+    f, g, h, u = rng.sample(MORPHISMS, 4)
+    if rng.random() < 0.6:
+        body = (rf'{a}_{{{index}}} \arrow[r, "{f}"] \arrow[d, "{g}"\'] & {b} \arrow[d, "{h}"] \\' '\n'
+                rf'{c} \arrow[r, "{u}"\'] & {d}')
+    else:
+        body = (rf'{a}_{{{index}}} \arrow[r, "{f}"] \arrow[dr, "{h}"\'] & {b} \arrow[d, "{g}"] \\' '\n'
+                rf'& {c}')
+    return '\\[\n\\begin{tikzcd}\n' + body + '\n\\end{tikzcd}\n\\]'
+
+def paragraph(rng, formulas):
+    words = ['Let', 'the', 'module', 'be', 'finitely', 'generated', 'and', 'consider', 'its',
+             'image', 'under', 'the', 'functor', 'so', 'that', 'every', 'object', 'is', 'exact']
+    sentences = []
+    for _ in range(formulas):
+        sentences.append(' '.join(rng.choice(words) for _ in range(rng.randint(6, 14)))
+                         + ' ' + inline_formula(rng) + '.')
+    return ' '.join(sentences)
+
+def spread(total, parts):
+    """total split into parts as evenly as possible"""
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+def synthetic_thesis(chapters, diagrams=DIAGRAMS, inline=INLINE_FORMULAS,
+                     display=DISPLAY_FORMULAS, theorems=THEOREMS, seed=0):
+    """(LaTeX source, counts) of a document with that much per chapter"""
+    rng = random.Random(seed)
+    parts = [PREAMBLE]
+    diagram_index = 0
+    sections = 3
+    for chapter in range(1, chapters + 1):
+        parts.append(f'\\chapter{{Chapter {chapter}}}\n')
+        for section, (n_inline, n_display, n_diagrams, n_theorems) in enumerate(
+                zip(spread(inline, sections), spread(display, sections),
+                    spread(diagrams, sections), spread(theorems, sections)), 1):
+            parts.append(f'\\section{{Section {chapter}.{section}}}\n')
+            for _ in range(n_theorems):
+                kind = rng.choice(THEOREM_KINDS)
+                parts.append(f'\\begin{{{kind}}}\n{paragraph(rng, 1)}\n\\end{{{kind}}}\n')
+                if kind != 'definition':
+                    parts.append(f'\\begin{{proof}}\n{paragraph(rng, 1)}\n\\end{{proof}}\n')
+            remaining = n_inline - n_theorems * 2
+            parts.append(paragraph(rng, max(remaining, 0)) + '\n')
+            for _ in range(n_display):
+                parts.append(display_formula(rng) + '\n')
+            for _ in range(n_diagrams):
+                parts.append(diagram(rng, diagram_index) + '\n')
+                diagram_index += 1
+            parts.append('\n')
+    parts.append('\\end{document}\n')
+    source = '\n'.join(parts)
+    counts = {
+        'chapters': chapters,
+        'diagrams': diagram_index,
+        'inline_formulas': len(re.findall(r'(?<!\\)\$[^$]+\$', source)),
+        'display_formulas': source.count('\\[') - diagram_index + source.count('\\begin{equation}')
+                            + source.count('\\begin{align}'),
+        'theorems': sum(source.count(f'\\begin{{{kind}}}') for kind in THEOREM_KINDS),
+        'bytes': len(source.encode('utf-8')),
+    }
+    counts['formulas'] = counts['inline_formulas'] + counts['display_formulas']
+    return source, counts
+
+INLINE_MATH_RE = re.compile(r'(?<!\\)\$([^$]+)\$')
+DISPLAY_MATH_RE = re.compile(r'\\\[(.*?)\\\]|(\\begin\{(equation|align)\}.*?\\end\{\3\})', re.DOTALL)
+
+def math_page(source):
+    """An HTML page with the source's formulas the way pandoc writes them,
+    for prerender-math.py without pandoc"""
+    spans = []
+    for tex in INLINE_MATH_RE.findall(source):
+        spans.append(f'<span class="math inline">\\({html.escape(tex, quote=False)}\\)</span>')
+    for tex, environment, _ in DISPLAY_MATH_RE.findall(source):
+        if 'tikzcd' not in tex:
+            tex = (tex or environment).strip()
+            spans.append(f'<span class="math display">\\[{html.escape(tex, quote=False)}\\]</span>')
+    return ('<!DOCTYPE html>\n<html>\n<head>\n'
+            '  <script src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-chtml-full.js" '
+            'type="text/javascript"></script>\n</head>\n<body>\n'
+            + ''.join(f'<p>{span}</p>\n' for span in spans) + '</body>\n</html>\n')
+
+SVG_ID_RE = re.compile(r'\bid=(["\'])(.+?)\1')
+SVG_REF_RE = re.compile(r'(?:href=["\']|url\()#([^"\')]+)')
+
+def svg_problems(text):
+    """Ids defined twice and references to ids that don't exist, in an SVG
+    or a page of inlined SVGs"""
+    ids = [ident for _, ident in SVG_ID_RE.findall(text)]
+    problems = sorted({f'duplicate id {ident}' for ident in ids if ids.count(ident) > 1})
+    problems += sorted({f'missing #{ident}' for ident in SVG_REF_RE.findall(text)} - {f'missing #{i}' for i in ids})
+    return problems
+
+# ---------------------------------------------------------------------------
+# Stand-in TeX
+
+TIKZCD_RE = re.compile(r'\\begin\{tikzcd\}(.*?)\\end\{tikzcd\}', re.DOTALL)
+PREVIEW_RE = re.compile(r'\\begin\{preview\}(.*?)\\end\{preview\}', re.DOTALL)
+
+# One glyph outline, scaled per character
+GLYPH = [('M', 4.578125, -3.1875), ('C', 4.578125, -3.984375, 4.53125, -4.78125, 4.1875, -5.515625),
+         ('C', 3.734375, -6.484375, 2.90625, -6.640625, 2.5, -6.640625),
+         ('C', 1.890625, -6.640625, 1.171875, -6.375, 0.75, -5.453125),
+         ('C', 0.4375, -4.765625, 0.390625, -3.984375, 0.390625, -3.1875),
+         ('C', 0.390625, -2.4375, 0.421875, -1.546875, 0.84375, -0.78125), ('Z',)]
+
+def dvisvgm_number(value):
+    """A number the way dvisvgm writes it: no trailing zeros, no leading 0"""
+    text = f'{value:.6f}'.rstrip('0').rstrip('.')
+    return re.sub(r'^(-?)0\.', r'\1.', text) or '0'
+
+def dvisvgm_path(commands, scale=1.0):
+    """Path data run together like dvisvgm's: M4.578-3.188C.4375.39..."""
+    out = ''
+    for command, *values in commands:
+        out += command
+        for n, value in enumerate(values):
+            text = dvisvgm_number(value * scale)
+            out += text if n == 0 or text[0] in '-.' else ' ' + text
+    return out
+
+def stand_in_svg(body, outlines):
+    """An SVG shaped like dvisvgm output (' quotes, numbers run together, page
+    group): with --no-fonts glyph paths g<font>-<char> in <defs> placed with
+    <use>, otherwise an embedded font and <text>; a path per arrow"""
+    rows = [row.split('&') for row in body.split('\\\\')]
+    letters = sorted(set(re.findall(r'[A-Za-z]', body)))
+    width, height = 40.0 * max(len(row) for row in rows) + 20.7109375, 36.0 * len(rows) + 12.3984375
+    out = ["<?xml version='1.0' encoding='UTF-8'?>",
+           '<!-- This file was generated by dvisvgm stand-in (benchmark.py) -->',
+           "<svg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' "
+           f"width='{dvisvgm_number(width)}pt' height='{dvisvgm_number(height)}pt' "
+           f"viewBox='-72 -72 {dvisvgm_number(width)} {dvisvgm_number(height)}'>"]
+    if outlines:
+        out.append('<defs>')
+        for letter in letters:
+            path = dvisvgm_path(GLYPH, 0.8 + (ord(letter) % 7) / 10)
+            out.append(f"<path id='g0-{ord(letter)}' d='{path}'/>")
+        out.append('</defs>')
+    else:
+        out += ["<style type='text/css'>",
+                "<![CDATA[@font-face{font-family:cmmi10;src:url(data:application/x-font-woff2;base64,"
+                "d09GMgABAAAAAAKMAA4AAAAABXQAAAI0AAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGhYbIBwaBmAAPBEICoIA)"
+                " format('woff2');}",
+                'text.f0 {font-family:cmmi10;font-size:9.96264px}', ']]>', '</style>']
+    out.append("<g id='page1'>")
+    for y, row in enumerate(rows):
+        for x, cell in enumerate(row):
+            for k, letter in enumerate(re.findall(r'[A-Za-z]', cell.split('\\arrow')[0])):
+                position = (f"x='{dvisvgm_number(-62 + 40 * x + 5.1171875 * k)}' "
+                            f"y='{dvisvgm_number(-52.0 + 36 * y)}'")
+                if outlines:
+                    out.append(f"<use {position} xlink:href='#g0-{ord(letter)}'/>")
+                else:
+                    out.append(f"<text class='f0' {position}>{letter}</text>")
+    for n in range(body.count('\\arrow')):
+        start = dvisvgm_path([('M', -55.796875 + 7 * n, -53.40625 + 3 * n), ('H', -19.203125 + 7 * n)])
+        out.append(f"<path d='{start}' stroke='#000' fill='none' stroke-width='.3985' stroke-miterlimit='10'/>")
+    out += ['</g>', '</svg>']
+    return '\n'.join(out) + '\n'
+
+def stand_in_pdflatex(args):
+    if '--version' in args:
+        print('pdfTeX stand-in (benchmark.py)')
+        return 0
+    options = dict(arg.lstrip('-').split('=', 1) for arg in args if arg.startswith('-') and '=' in arg)
+    out_dir = options.get('output-directory', '.')
+    files = [arg for arg in args if not arg.startswith(('-', '&')) and arg.endswith('.tex')]
+    if not files:
+        return 1
+    if '-ini' in args:
+        with open(os.path.join(out_dir, options['jobname'] + '.fmt'), 'w') as f:
+            f.write('stand-in format\n')
+        return 0
+    base = os.path.splitext(os.path.basename(files[-1]))[0]
+    ext = options.get('output-format', 'pdf')
+    shutil.copyfile(files[-1], os.path.join(out_dir, f'{base}.{ext}'))
+    with open(os.path.join(out_dir, f'{base}.log'), 'w') as f:
+        f.write('This is pdfTeX stand-in (benchmark.py)\n')
+    return 0
+
+def stand_in_dvisvgm(args):
+    if '--version' in args:
+        print('dvisvgm stand-in (benchmark.py)')
+        return 0
+    pattern = args[args.index('-o') + 1]
+    with open(args[-1], 'r', encoding='utf-8') as f:
+        source = f.read()
+    # Diagrams, or formulas from prerender-math.py (one preview per page)
+    bodies = TIKZCD_RE.findall(source) or PREVIEW_RE.findall(source)
+    if '--page=1-' not in args:
+        bodies = bodies[:1]
+    for page, body in enumerate(bodies, 1):
+        with open(pattern.replace('%p', str(page)), 'w', encoding='utf-8') as f:
+            f.write(stand_in_svg(body, '--no-fonts' in args))
+        if '--bbox=preview' in args:
+            print(f"  width=40.5pt, height=6.94pt, depth={1.94 + page % 3}pt")
+    return 0 if bodies else 1
+
+STAND_INS = {'pdflatex': stand_in_pdflatex, 'dvisvgm': stand_in_dvisvgm}
+
+def install_stand_ins(bin_dir):
+    """Write the stand-in commands to bin_dir; returns {tool: path}"""
+    os.makedirs(bin_dir, exist_ok=True)
+    paths = {}
+    for tool in STAND_INS:
+        path = os.path.join(bin_dir, tool)
+        with open(path, 'w') as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{os.path.abspath(__file__)}" '
+                    f'--stand-in {tool} "$@"\n')
+        os.chmod(path, 0o755)
+        paths[tool] = path
+    return paths
+
+# ---------------------------------------------------------------------------
+# Measuring
+
+def child_cpu():
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+@contextmanager
+def measure(result):
+    """Fill result with the wall time and the CPU time of this process and its children"""
+    begin, cpu = time.perf_counter(), time.process_time() + child_cpu()
+    yield result
+    result['wall_s'] = round(time.perf_counter() - begin, 4)
+    result['cpu_s'] = round(time.process_time() + child_cpu() - cpu, 4)
+
+def run_phases(case_dir, source, counts, tools, jobs):
+    """Run every phase once in case_dir; returns {phase: {wall_s, cpu_s, ok}}"""
+    phases = {}
+    env = dict(os.environ, DIAGRAM_EMBED='img',
+               PDFLATEX_PATH=tools['pdflatex'], DVISVGM_PATH=tools['dvisvgm'] or '')
+    extract = [sys.executable, os.path.join(REPO_DIR, 'extract-tikz.py'), 'main.tex',
+               tools['pdflatex'], '--jobs', str(jobs)]
+
+    for phase in ['extract', 'extract_cached']:
+        with measure(phases.setdefault(phase, {})) as result:
+            done = buildtrace.run(extract, name=f'benchmark {phase}', cwd=case_dir, env=env,
+                                  capture_output=True, text=True)
+        svgs = glob.glob(os.path.join(case_dir, 'docs', 'diagrams', 'diagram_*.svg'))
+        result['ok'] = done.returncode == 0 and len(svgs) == counts['diagrams']
+        if not result['ok']:
+            result['error'] = (done.stdout + done.stderr).strip().splitlines()[-1:]
+        for svg in svgs:
+            with open(svg, 'r', encoding='utf-8') as f:
+                problems = svg_problems(f.read())
+            if problems:
+                result.update(ok=False, error=[f'{os.path.basename(svg)}: {problems[0]}'])
+                break
+
+    page = os.path.join(case_dir, 'math.html')
+    with open(page, 'w', encoding='utf-8') as f:
+        f.write(math_page(source))
+    with measure(phases.setdefault('prerender', {})) as result:
+        done = buildtrace.run([sys.executable, os.path.join(REPO_DIR, 'prerender-math.py'), page],
+                              name='benchmark prerender', cwd=case_dir, env=env,
+                              capture_output=True, text=True)
+    with open(page, 'r', encoding='utf-8') as f:
+        prerendered = f.read()
+    problems = svg_problems(prerendered)
+    if '<span class="math inline">\\(' in prerendered or '<span class="math display">\\[' in prerendered:
+        problems.append('formulas left to MathJax')
+    if re.search(r'<svg[^>]*\b(?:width|height)=["\'][\d.]+pt', prerendered):
+        problems.append('sizes left in pt')
+    result['ok'] = done.returncode == 0 and not problems
+    if not result['ok']:
+        result['error'] = problems[:1] or (done.stdout + done.stderr).strip().splitlines()[-1:]
+
+    if not tools['pandoc']:
+        return phases
+    pandoc_page = os.path.join(case_dir, 'pandoc.html')
+    with measure(phases.setdefault('pandoc', {})) as result:
+        done = buildtrace.run([tools['pandoc'], 'main.tex', '--standalone', '--mathjax',
+                               '--toc', '--toc-depth=2', '--css=style.css',
+                               f"--lua-filter={os.path.join(REPO_DIR, 'tikzcd-filter.lua')}",
+                               '-o', pandoc_page],
+                              name='benchmark pandoc', cwd=case_dir, env=env,
+                              capture_output=True, text=True)
+    if done.returncode != 0 or not os.path.exists(pandoc_page):
+        result.update(ok=False, error=done.stderr.strip().splitlines()[-1:])
+        return phases
+    with open(pandoc_page, 'r', encoding='utf-8') as f:
+        html = f.read()
+    result['ok'] = html.count('src="diagrams/diagram_') == counts['diagrams']
+
+    with measure(phases.setdefault('postprocess', {})) as result:
+        htmlpost.process(pandoc_page, os.path.join(case_dir, 'index.html'), htmlpost.default_rules())
+    result['ok'] = os.path.exists(os.path.join(case_dir, 'index.html'))
+    return phases
+
+def benchmark_case(counts_source, scale, tools, jobs, repeat):
+    """Best of repeat runs of every phase for one document size"""
+    source, counts = counts_source
+    case_dir = os.path.abspath(os.path.join(BENCH_DIR, f'x{scale}'))
+    best = {}
+    for _ in range(repeat):
+        shutil.rmtree(case_dir, ignore_errors=True)
+        os.makedirs(case_dir)
+        with open(os.path.join(case_dir, 'main.tex'), 'w', encoding='utf-8') as f:
+            f.write(source)
+        buildtrace.start(os.path.join(case_dir, 'trace'))
+        for phase, result in run_phases(case_dir, source, counts, tools, jobs).items():
+            if phase not in best or result['wall_s'] < best[phase]['wall_s']:
+                best[phase] = result
+    buildtrace.write_reports(os.path.join(case_dir, 'trace'))
+
+    for phase, result in best.items():
+        seconds = max(result['wall_s'], 1e-6)
+        if phase.startswith('extract'):
+            result['diagrams_per_s'] = round(counts['diagrams'] / seconds, 2)
+        else:
+            result['formulas_per_s'] = round(counts['formulas'] / seconds, 1)
+            result['kb_per_s'] = round(counts['bytes'] / 1024 / seconds, 1)
+    return {'scale': scale, 'counts': counts, 'phases': best,
+            'trace': os.path.relpath(os.path.join(case_dir, 'trace', 'trace.json'))}
+
+def scaling_exponent(points):
+    """Least-squares slope of log(time) against log(size): 1.0 is linear"""
+    points = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / var, 2)
+
+# ---------------------------------------------------------------------------
+# Reporting
+
+def phase_names(runs):
+    names = []
+    for run in runs:
+        names += [name for name in run['phases'] if name not in names]
+    return names
+
+def print_results(results):
+    runs = results['runs']
+    print()
+    print(f"{'size':>6} {'diagrams':>8} {'formulas':>8}  {'phase':<15} {'wall':>8} {'cpu':>8}  throughput")
+    for run in runs:
+        counts = run['counts']
+        for phase, result in run['phases'].items():
+            if 'diagrams_per_s' in result:
+                rate = f"{result['diagrams_per_s']:.1f} diagrams/s"
+            else:
+                rate = f"{result['formulas_per_s']:.0f} formulas/s, {result['kb_per_s']:.0f} KB/s"
+            flag = '' if result.get('ok') else '  ⚠️  ' + (result.get('error') or ['output incomplete'])[0]
+            print(f"{'x' + str(run['scale']):>6} {counts['diagrams']:>8} {counts['formulas']:>8}  "
+                  f"{phase:<15} {result['wall_s']:>7.3f}s {result['cpu_s']:>7.3f}s  {rate}{flag}")
+    if len(runs) > 1:
+        print()
+        print("Scaling (time ~ size^k, 1.0 is linear):")
+        for phase, k in results['scaling'].items():
+            print(f"  {phase:<15} k = {k}" if k is not None else f"  {phase:<15} -")
+
+def compare(results, previous, name):
+    """Print the wall time change of every phase against an earlier result"""
+    print()
+    print(f"Compared with {name}:")
+    earlier = {run['scale']: run for run in previous.get('runs', [])}
+    if previous.get('config') != results['config']:
+        print("  (different settings, numbers are only indicative)")
+    found = False
+    for run in results['runs']:
+        old_run = earlier.get(run['scale'])
+        if not old_run:
+            continue
+        for phase, result in run['phases'].items():
+            old = old_run['phases'].get(phase)
+            if not old or not old['wall_s']:
+                continue
+            found = True
+            ratio = result['wall_s'] / old['wall_s']
+            flag = '  ⚠️  slower' if ratio > REGRESSION else ''
+            print(f"  x{run['scale']:<5} {phase:<15} {old['wall_s']:>7.3f}s -> "
+                  f"{result['wall_s']:>7.3f}s ({ratio - 1:+.0%}){flag}")
+    if not found:
+        print("  no matching sizes")
+
+def previous_result():
+    files = sorted(glob.glob(os.path.join(RESULTS_DIR, '*.json')))
+    return files[-1] if files else None
+
+def environment(tools, stand_in):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=REPO_DIR).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'stand_in': stand_in,
+        'versions': {name: toolchain.probe_version(path) for name, path in tools.items() if path},
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the build on synthetic theses")
+    parser.add_argument('--chapters', type=int, default=4, help="chapters at scale 1 (default: %(default)s)")
+    parser.add_argument('--scale', default='1,2,4',
+                        help="comma-separated size multipliers (default: %(default)s)")
+    parser.add_argument('--diagrams', type=int, default=DIAGRAMS, help="diagrams per chapter")
+    parser.add_argument('--inline', type=int, default=INLINE_FORMULAS, help="inline formulas per chapter")
+    parser.add_argument('--display', type=int, default=DISPLAY_FORMULAS, help="display formulas per chapter")
+    parser.add_argument('--theorems', type=int, default=THEOREMS, help="theorem environments per chapter")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="extract-tikz.py --jobs (default: CPU count)")
+    parser.add_argument('--repeat', type=int, default=1, help="keep the best of N runs")
+    parser.add_argument('--stand-in', action='store_true',
+                        help="use stand-in pdflatex and dvisvgm instead of TeX")
+    parser.add_argument('--label', help="appended to the results file name")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="earlier results to compare with (default: the latest in bench-results/)")
+    parser.add_argument('--no-save', action='store_true', help="do not write bench-results/")
+    return parser.parse_args()
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--stand-in' and sys.argv[2] in STAND_INS:
+        sys.exit(STAND_INS[sys.argv[2]](sys.argv[3:]))
+    args = parse_args()
+
+    if args.stand_in:
+        tools = install_stand_ins(os.path.abspath(os.path.join(BENCH_DIR, 'bin')))
+    else:
+        toolset = toolchain.resolve()
+        tools = {name: toolchain.path(name, toolset) for name in ['pdflatex', 'dvisvgm']}
+        if not tools['pdflatex'] or not tools['dvisvgm']:
+            print("❌ Error: pdflatex and dvisvgm are needed (or run with --stand-in). "
+                  f"Install with: {toolchain.INSTALL_HINTS['pdflatex']}")
+            sys.exit(1)
+    tools['pandoc'] = toolchain.find('pandoc')
+    if not tools['pandoc']:
+        print(f"⚠️  Warning: pandoc not found, skipping the pandoc and post-processing phases "
+              f"({toolchain.INSTALL_HINTS['pandoc']})")
+
+    scales = [int(s) for s in args.scale.split(',') if s.strip()]
+    config = {'chapters': args.chapters, 'scales': scales, 'diagrams': args.diagrams,
+              'inline': args.inline, 'display': args.display, 'theorems': args.theorems,
+              'seed': args.seed, 'jobs': args.jobs, 'stand_in': args.stand_in}
+    runs = []
+    for scale in scales:
+        document = synthetic_thesis(args.chapters * scale, args.diagrams, args.inline,
+                                    args.display, args.theorems, args.seed)
+        counts = document[1]
+        print(f"x{scale}: {counts['chapters']} chapters, {counts['diagrams']} diagrams, "
+              f"{counts['formulas']} formulas, {counts['theorems']} theorems, "
+              f"{counts['bytes'] // 1024} KB...", flush=True)
+        runs.append(benchmark_case(document, scale, tools, args.jobs, max(1, args.repeat)))
+
+    scaling = {phase: scaling_exponent([(run['counts']['chapters'], run['phases'][phase]['wall_s'])
+                                        for run in runs if phase in run['phases']])
+               for phase in phase_names(runs)}
+    results = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'config': config,
+               'environment': environment({k: tools[k] for k in ['pdflatex', 'dvisvgm', 'pandoc']},
+                                          args.stand_in),
+               'runs': runs, 'scaling': scaling}
+    print_results(results)
+
+    earlier = args.compare or previous_result()
+    if earlier:
+        with open(earlier, 'r', encoding='utf-8') as f:
+            compare(results, json.load(f), earlier)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = time.strftime('%Y%m%d-%H%M%S') + (f'-{args.label}' if args.label else '')
+        path = os.path.join(RESULTS_DIR, name + '.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print()
+        print(f"Results: {path}")
+
+if __name__ == '__main__':
+    main()
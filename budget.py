@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Check the weight of the built site against the budgets in budget.json
+
+Walks what a browser fetches for docs/index.html: stylesheets and what
+they import, scripts (local or from a CDN), diagram images and objects,
+the icons in the web manifest and the service worker with its precache
+manifest. Every file is measured raw and as it is transferred (its .br or
+.gz sibling from compress.py, else gzipped here). The report gives:
+
+- critical path: the page, its stylesheets and blocking scripts
+- page load: every request the page makes, external ones counted but not sized
+- precache: what the service worker downloads when it installs
+- deploy: everything in docs/, and which files the site never loads or
+  links to
+
+Budgets (budget.json, all optional):
+
+    critical_transfer_kb    compressed bytes on the critical path
+    page_transfer_kb        compressed bytes of the page load
+    page_requests           requests of the page load
+    precache_transfer_kb    compressed bytes the service worker precaches
+    largest_asset_kb        any file the site references
+    unreferenced_file_kb    any deployed file the site does not reference
+    deploy_kb               everything in docs/
+    missing_files           referenced files that do not exist
+
+    python3 budget.py [DOCS_DIR] [--budget budget.json] [--top 10] [--json FILE]
+
+Exits with status 1 when a budget is exceeded.
+"""
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+import urllib.parse
+from html.parser import HTMLParser
+
+import atomicfile
+import compress
+import fingerprint
+
+BUDGET_FILE = 'budget.json'
+ENTRY_PAGE = 'index.html'
+
+# Not part of what is served
+IGNORED = ('_headers', '_redirects')
+
+CSS_URL_RE = re.compile(r'''url\(\s*['"]?([^'")]+)['"]?\s*\)|@import\s+['"]([^'"]+)['"]''')
+SVG_REF_RE = re.compile(r'''(?:xlink:)?href=["']([^"'#]+)''')
+SW_REGISTER_RE = re.compile(r'''serviceWorker\.register\(\s*['"]([^'"]+)['"]''')
+PRECACHE_RE = re.compile(r'PRECACHE_MANIFEST\s*=\s*(\[.*?\]);', re.DOTALL)
+
+class PageParser(HTMLParser):
+    """References of an HTML page as (url, kind, critical)"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refs = []
+        self.in_head = True
+        self.in_script = False
+        self.inline_scripts = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+        rel = attrs.get('rel', '').lower().split()
+        if tag == 'body':
+            self.in_head = False
+        elif tag == 'link' and attrs.get('href'):
+            if 'stylesheet' in rel:
+                self.refs.append((attrs['href'], 'css', attrs.get('media', 'all') != 'print'))
+            elif 'manifest' in rel:
+                self.refs.append((attrs['href'], 'manifest', False))
+            elif rel and set(rel) & {'icon', 'apple-touch-icon', 'preload', 'modulepreload'}:
+                self.refs.append((attrs['href'], 'icon' if 'icon' in attrs['rel'] else 'preload', False))
+        elif tag == 'script':
+            if attrs.get('src'):
+                blocking = self.in_head and 'async' not in attrs and 'defer' not in attrs \
+                    and attrs.get('type') != 'module'
+                self.refs.append((attrs['src'], 'script', blocking))
+            else:
+                self.in_script = True
+                self.inline_scripts.append('')
+        elif tag in ('img', 'source', 'video', 'audio', 'iframe') and attrs.get('src'):
+            self.refs.append((attrs['src'], 'image' if tag in ('img', 'source') else tag, False))
+        elif tag == 'object' and attrs.get('data'):
+            self.refs.append((attrs['data'], 'image', False))
+        elif tag == 'a' and attrs.get('href'):
+            self.refs.append((attrs['href'], 'link', False))
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+        elif tag == 'script':
+            self.in_script = False
+
+    def handle_data(self, data):
+        if self.in_script:
+            self.inline_scripts[-1] += data
+
+def resolve(url, referrer):
+    """Path relative to the docs directory, 'external' or None (data:, fragments)"""
+    parts = urllib.parse.urlsplit(url.strip())
+    if parts.scheme in ('http', 'https') or url.startswith('//'):
+        return 'external'
+    if parts.scheme or not parts.path:
+        return None
+    path = urllib.parse.unquote(parts.path)
+    if not path.startswith('/'):
+        path = posixpath.join(posixpath.dirname(referrer), path)
+    path = posixpath.normpath(path).lstrip('/')
+    return None if path.startswith('..') else path
+
+def transfer_size(file_path, size):
+    """(bytes sent, encoding): the smallest precompressed sibling, else gzip"""
+    if not file_path.endswith(compress.COMPRESSIBLE):
+        return size, 'identity'
+    for ext, encoding in [('.br', 'br'), ('.gz', 'gzip')]:
+        if os.path.isfile(file_path + ext):
+            return min(os.path.getsize(file_path + ext), size), encoding
+    with open(file_path, 'rb') as f:
+        return min(len(compress.gzip_bytes(f.read())), size), 'gzip'
+
+def references(docs_dir, path, kind):
+    """(url, kind, critical) referenced by the file at path"""
+    file_path = os.path.join(docs_dir, path)
+    if kind not in ('page', 'css', 'manifest', 'image', 'sw') or not path.endswith(
+            ('.html', '.css', '.json', '.webmanifest', '.svg', '.js')):
+        return []
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    if kind == 'page':
+        parser = PageParser()
+        parser.feed(text)
+        refs = list(parser.refs)
+        for script in parser.inline_scripts:
+            refs += [(url, 'sw', False) for url in SW_REGISTER_RE.findall(script)]
+        return refs
+    if kind == 'css':
+        return [(url or imported, 'css' if imported else 'asset', bool(imported))
+                for url, imported in CSS_URL_RE.findall(text)]
+    if kind == 'manifest':
+        try:
+            manifest = json.loads(text)
+        except ValueError:
+            return []
+        return [(icon['src'], 'icon', False) for key in ('icons', 'screenshots')
+                for icon in manifest.get(key, []) if isinstance(icon, dict) and icon.get('src')]
+    if kind == 'sw':
+        match = PRECACHE_RE.search(text)
+        try:
+            entries = json.loads(match.group(1)) if match else []
+        except ValueError:
+            entries = []
+        return [(entry['url'] if isinstance(entry, dict) else entry, 'precache', False)
+                for entry in entries]
+    if path.endswith('.svg'):
+        return [(url, 'image', False) for url in SVG_REF_RE.findall(text)]
+    return []
+
+def analyse(docs_dir='docs', entry=ENTRY_PAGE):
+    """Walk the page's dependencies; returns the report as a dict"""
+    files = {}
+    external = set()
+    missing = {}
+
+    def visit(path, kind, critical, group, referrer):
+        if not os.path.isfile(os.path.join(docs_dir, path)):
+            missing.setdefault(path, referrer)
+            return False
+        node = files.get(path)
+        if node is None:
+            file_path = os.path.join(docs_dir, path)
+            size = os.path.getsize(file_path)
+            transfer, encoding = transfer_size(file_path, size)
+            node = files[path] = {'path': path, 'kind': kind, 'bytes': size, 'transfer': transfer,
+                                  'encoding': encoding, 'critical': False, 'groups': [],
+                                  'referrer': referrer}
+        new_group = group not in node['groups']
+        if new_group:
+            node['groups'].append(group)
+        if critical and not node['critical']:
+            node['critical'] = new_group = True
+        return new_group
+
+    # Groups: 'page' is what loading the page fetches, 'precache' what the
+    # service worker downloads (not followed further) and 'link' what the
+    # page only links to (the PDF, chapter pages and what they load)
+    queue = [(entry, 'page', True, 'page', None)]
+    while queue:
+        path, kind, critical, group, referrer = queue.pop(0)
+        if not visit(path, kind, critical, group, referrer) or group == 'precache':
+            continue
+        for url, ref_kind, ref_critical in references(docs_dir, path, kind):
+            target = resolve(url, path)
+            if target == 'external':
+                if group == 'page' and ref_kind != 'link':
+                    external.add(url)
+                continue
+            if target is None or target == path:
+                continue
+            if ref_kind == 'precache':
+                ref_group, ref_kind = 'precache', kind_of(target)
+            elif ref_kind == 'link':
+                ref_group, ref_kind = 'link', kind_of(target)
+            else:
+                ref_group = group
+            queue.append((target, ref_kind, critical and ref_critical, ref_group, path))
+
+    # The originals of fingerprinted assets stay in docs/ next to their copies
+    deployed = deployed_files(docs_dir)
+    superseded = set(fingerprint.read_manifest(docs_dir)) | {fingerprint.MANIFEST_NAME}
+    unreferenced = [{'path': path, 'bytes': size} for path, size in sorted(deployed.items())
+                    if path not in files and path not in superseded]
+
+    def totals(nodes):
+        nodes = list(nodes)
+        return {'files': len(nodes), 'bytes': sum(n['bytes'] for n in nodes),
+                'transfer': sum(n['transfer'] for n in nodes)}
+
+    page = totals(n for n in files.values() if 'page' in n['groups'])
+    page['requests'] = page['files'] + len(external)
+    page['external'] = sorted(external)
+    return {
+        'entry': entry,
+        'critical': totals(n for n in files.values() if n['critical']),
+        'page': page,
+        'precache': totals(n for n in files.values() if 'precache' in n['groups']),
+        'deploy': {'files': len(deployed), 'bytes': sum(deployed.values()),
+                   'unreferenced': unreferenced},
+        'files': sorted(files.values(), key=lambda n: -n['bytes']),
+        'missing': [{'path': path, 'referrer': referrer} for path, referrer in sorted(missing.items())],
+    }
+
+def kind_of(path):
+    ext = os.path.splitext(path)[1]
+    return {'.html': 'page', '.css': 'css', '.js': 'script', '.json': 'manifest',
+            '.webmanifest': 'manifest', '.svg': 'image'}.get(ext, 'asset')
+
+def deployed_files(docs_dir):
+    """{path: bytes} of everything that gets served, without compressed variants"""
+    deployed = {}
+    for root, dirs, names in os.walk(docs_dir):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for name in names:
+            if name.startswith('.') or name in IGNORED or atomicfile.TMP_MARKER in name \
+                    or name.endswith(compress.VARIANTS):
+                continue
+            path = os.path.join(root, name)
+            deployed[os.path.relpath(path, docs_dir).replace(os.sep, '/')] = os.path.getsize(path)
+    return deployed
+
+def read_budget(path=BUDGET_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def check(report, budget):
+    """[(budget name, measured, limit, detail)] for every budget that is exceeded"""
+    kb = lambda n: n / 1024
+    measured = {
+        'critical_transfer_kb': [(kb(report['critical']['transfer']), report['entry'])],
+        'page_transfer_kb': [(kb(report['page']['transfer']), report['entry'])],
+        'page_requests': [(report['page']['requests'], report['entry'])],
+        'precache_transfer_kb': [(kb(report['precache']['transfer']), 'sw.js')],
+        'largest_asset_kb': [(kb(n['bytes']), n['path']) for n in report['files']],
+        'unreferenced_file_kb': [(kb(n['bytes']), n['path']) for n in report['deploy']['unreferenced']],
+        'deploy_kb': [(kb(report['deploy']['bytes']), 'docs/')],
+        'missing_files': [(len(report['missing']), ', '.join(m['path'] for m in report['missing']))],
+    }
+    exceeded = []
+    for name, limit in budget.items():
+        for value, detail in measured.get(name, []):
+            if value > limit:
+                exceeded.append((name, value, limit, detail))
+    return exceeded
+
+def format_kb(n):
+    return f"{n / 1024:.1f} KB"
+
+def summary_lines(report, top=10):
+    critical, page, precache, deploy = (report[k] for k in ('critical', 'page', 'precache', 'deploy'))
+    lines = [
+        f"Critical path: {critical['files']} requests, {format_kb(critical['bytes'])} "
+        f"({format_kb(critical['transfer'])} compressed)",
+        f"Page load:     {page['requests']} requests ({len(page['external'])} external), "
+        f"{format_kb(page['bytes'])} ({format_kb(page['transfer'])} compressed)",
+        f"Precache:      {precache['files']} files, {format_kb(precache['bytes'])} "
+        f"({format_kb(precache['transfer'])} compressed)",
+        f"Deploy:        {deploy['files']} files, {format_kb(deploy['bytes'])}; "
+        f"{len(deploy['unreferenced'])} not referenced by the site "
+        f"({format_kb(sum(n['bytes'] for n in deploy['unreferenced']))})",
+    ]
+    if report['files']:
+        lines.append("Largest assets:")
+        for node in report['files'][:top]:
+            where = '+'.join(node['groups']) + (', critical' if node['critical'] else '')
+            lines.append(f"  {format_kb(node['bytes']):>10} -> {format_kb(node['transfer']):>10} "
+                         f"{node['encoding']:<8} {node['path']} ({where})")
+    for url in page['external']:
+        lines.append(f"  {'external':>10}    {'':>10} {'':<8} {url}")
+    for entry in report['missing']:
+        lines.append(f"⚠️  Missing: {entry['path']} (referenced by {entry['referrer']})")
+    return lines
+
+def violation_lines(exceeded):
+    lines = []
+    for name, value, limit, detail in exceeded:
+        unit = '' if name in ('page_requests', 'missing_files') else ' KB'
+        shown = f"{value:.1f}" if unit else f"{value}"
+        lines.append(f"❌ {name}: {detail} is {shown}{unit}, budget {limit}{unit}")
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the built site against performance budgets")
+    parser.add_argument('docs_dir', nargs='?', default='docs')
+    parser.add_argument('--budget', default=BUDGET_FILE)
+    parser.add_argument('--top', type=int, default=10, help="largest assets to list")
+    parser.add_argument('--json', metavar='FILE', help="also write the full report as JSON")
+    args = parser.parse_args()
+
+    if not os.path.isfile(os.path.join(args.docs_dir, ENTRY_PAGE)):
+        print(f"❌ Error: {args.docs_dir}/{ENTRY_PAGE} not found. Build the website first.")
+        sys.exit(1)
+    report = analyse(args.docs_dir)
+    print('\n'.join(summary_lines(report, args.top)))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    exceeded = check(report, read_budget(args.budget))
+    if exceeded:
+        print('\n'.join(violation_lines(exceeded)))
+        sys.exit(1)
+    print(f"✅ Within budget ({args.budget})")
+
+if __name__ == '__main__':
+    main()
@@ -1,134 +1,8 @@
 #!/bin/bash
 # Build script for LaTeX to Website conversion
+#
+# The stages (diagrams, PDF, HTML) are scheduled by build.py, which runs
+# independent ones at the same time. Options are passed through, and the
+# FORCE, SPLIT_CHAPTERS, PRERENDER_MATH and DIAGRAM_EMBED variables still work.
 
-set -e  # Exit on error
-
-# Path to the LaTeX source
-LATEX_SOURCE="../antiques-roadshow-algebra-ro/main.tex"
-
-echo "================================================"
-echo "  LaTeX to Website Builder"
-echo "================================================"
-echo ""
-
-# Check if LaTeX source exists
-if [ ! -f "$LATEX_SOURCE" ]; then
-  echo "❌ Error: LaTeX source not found at $LATEX_SOURCE"
-  exit 1
-fi
-
-# Check for required tools
-echo "Checking dependencies..."
-
-# Try to find pandoc in common locations
-PANDOC_PATH=""
-if command -v pandoc >/dev/null 2>&1; then
-  PANDOC_PATH="pandoc"
-elif [ -f /usr/local/bin/pandoc ]; then
-  PANDOC_PATH="/usr/local/bin/pandoc"
-elif [ -f /opt/homebrew/bin/pandoc ]; then
-  PANDOC_PATH="/opt/homebrew/bin/pandoc"
-else
-  echo "❌ Error: pandoc is not installed."
-  echo "   Install with: brew install pandoc"
-  exit 1
-fi
-
-# Try to find pdflatex in common locations
-PDFLATEX_PATH=""
-if command -v pdflatex >/dev/null 2>&1; then
-  PDFLATEX_PATH="pdflatex"
-elif [ -f /usr/local/texlive/2025/bin/universal-darwin/pdflatex ]; then
-  PDFLATEX_PATH="/usr/local/texlive/2025/bin/universal-darwin/pdflatex"
-elif [ -f /Library/TeX/texbin/pdflatex ]; then
-  PDFLATEX_PATH="/Library/TeX/texbin/pdflatex"
-else
-  echo "❌ Error: pdflatex is not installed."
-  echo "   Install with: brew install --cask mactex"
-  exit 1
-fi
-
-echo "✅ All dependencies found"
-echo ""
-
-# Create docs directory
-echo "Creating output directory..."
-mkdir -p docs
-echo "✅ Directory created"
-echo ""
-
-# Extract and compile TikZ diagrams to SVG
-echo "Extracting TikZ diagrams..."
-python3 extract-tikz.py "$LATEX_SOURCE" "$PDFLATEX_PATH"
-echo ""
-
-# Compile PDF (in the source directory)
-echo "Compiling LaTeX to PDF..."
-cd ../antiques-roadshow-algebra-ro
-$PDFLATEX_PATH -interaction=nonstopmode main.tex > /dev/null 2>&1
-$PDFLATEX_PATH -interaction=nonstopmode main.tex > /dev/null 2>&1  # Second pass for references
-cd - > /dev/null
-
-if [ -f ../antiques-roadshow-algebra-ro/main.pdf ]; then
-  cp ../antiques-roadshow-algebra-ro/main.pdf docs/thesis.pdf
-  echo "✅ PDF generated: docs/thesis.pdf"
-else
-  echo "⚠️  Warning: PDF generation may have failed"
-fi
-echo ""
-
-# Convert to HTML
-echo "Converting LaTeX to HTML with pandoc..."
-
-$PANDOC_PATH "$LATEX_SOURCE" \
-  --standalone \
-  --mathjax \
-  --toc \
-  --toc-depth=2 \
-  --css=style.css \
-  --lua-filter=tikzcd-filter.lua \
-  -o docs/index.html
-
-# Add favicon and PWA meta tags to HTML with cache busting
-echo "Adding favicon and PWA support with cache busting..."
-BUILD_TIMESTAMP=$(date +%s)
-
-sed -i.bak "s|</head>|  <!-- Cache Control -->\n  <meta http-equiv=\"Cache-Control\" content=\"no-cache, no-store, must-revalidate\">\n  <meta http-equiv=\"Pragma\" content=\"no-cache\">\n  <meta http-equiv=\"Expires\" content=\"0\">\n  <meta name=\"build-timestamp\" content=\"${BUILD_TIMESTAMP}\">\n  \n  <!-- PWA and Favicon -->\n  <link rel=\"icon\" type=\"image/svg+xml\" href=\"favicon.svg\">\n  <link rel=\"manifest\" href=\"manifest.json?v=${BUILD_TIMESTAMP}\">\n  <meta name=\"theme-color\" content=\"#2c3e50\">\n  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n  <meta name=\"apple-mobile-web-app-capable\" content=\"yes\">\n  <meta name=\"apple-mobile-web-app-status-bar-style\" content=\"default\">\n  <meta name=\"apple-mobile-web-app-title\" content=\"Fosile Algebrice\">\n  <link rel=\"apple-touch-icon\" href=\"icon-192.png\">\n</head>|" docs/index.html
-
-# Version the CSS file reference
-sed -i.bak "s|href=\"style.css\"|href=\"style.css?v=${BUILD_TIMESTAMP}\"|g" docs/index.html
-
-# Add service worker registration script before closing body tag
-sed -i.bak "s|</body>|  <script>\n    if (\"serviceWorker\" in navigator) {\n      navigator.serviceWorker.register(\"/sw.js?v=${BUILD_TIMESTAMP}\").then(registration => {\n        console.log(\"Service Worker registered:\", registration);\n      }).catch(error => {\n        console.log(\"Service Worker registration failed:\", error);\n      });\n    }\n  </script>\n</body>|" docs/index.html
-
-rm docs/index.html.bak
-
-# Add PDF download link after header
-echo "Adding PDF download link..."
-sed -i.bak 's|</header>|</header>\n<div style="text-align: center; margin: 2em 0; padding: 1em; background-color: #f0f0f0; border-radius: 8px;">\n  <a href="thesis.pdf" download style="display: inline-block; padding: 0.75em 1.5em; background-color: #2c3e50; color: white; text-decoration: none; border-radius: 4px; font-weight: bold; transition: background-color 0.3s;">\n    📥 Descarcă PDF (Download PDF)\n  </a>\n</div>|' docs/index.html
-rm docs/index.html.bak
-
-echo "✅ HTML generated with PWA support: docs/index.html"
-echo ""
-
-# Clean up auxiliary files in the LaTeX source directory
-echo "Cleaning up LaTeX auxiliary files..."
-cd ../antiques-roadshow-algebra-ro
-rm -f *.aux *.log *.toc *.out
-cd - > /dev/null
-echo "✅ Cleanup complete"
-echo ""
-
-echo "================================================"
-echo "  ✅ Website build complete!"
-echo "================================================"
-echo ""
-echo "Output location: docs/"
-echo "  • HTML: docs/index.html"
-echo "  • PDF:  docs/thesis.pdf"
-echo ""
-echo "To preview locally, run:"
-echo "  cd docs && python3 -m http.server 8000"
-echo ""
-echo "Then open: http://localhost:8000"
-echo ""
+exec python3 "$(dirname "$0")/build.py" "$@"
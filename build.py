@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""Build the website: diagrams, PDF and HTML as a graph of stages
+
+Each stage names the stages whose outputs it needs. Stages whose
+dependencies are done run concurrently (at most --jobs at a time), so
+diagram extraction, the PDF compile and the pandoc conversion overlap and
+a full build takes about as long as its slowest path:
+
+    diagrams ─────────────────────┐
+    pdf ──────────────────────────┤
+    pandoc ──> postprocess ───────┴──> publish ──> compress ──> budget
+
+Every stage is skipped when its stamp (see stamps.py) shows that its
+inputs, tools and options are unchanged. The HTML is assembled in build/
+and only copied into docs/ by the publish stage. The build fails when the
+result exceeds a budget in budget.json (see budget.py).
+
+    python3 build.py [--jobs N] [--force] [--max-passes N] [--split] [--prerender-math]
+                     [--diagram-embed img|object] [--profile] [--stage NAME ...]
+
+--stage builds only the named stages and those they need, e.g. --stage pdf
+for the PDF alone (make pdf).
+
+Every stage and command is timed (wall time, CPU time, peak memory) into
+build/trace/report.json and build/trace/trace.json; --profile prints the
+slowest.
+
+The options default to the FORCE, SPLIT_CHAPTERS, PRERENDER_MATH and
+DIAGRAM_EMBED environment variables used by earlier versions of the build.
+"""
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import atomicfile
+import budget
+import buildtrace
+import compress
+import fingerprint
+import htmlpost
+import precache
+import stamps
+import toolchain
+
+LATEX_SOURCE = '../antiques-roadshow-algebra-ro/main.tex'
+BUILD_DIR = 'build'
+PANDOC_PAGE = os.path.join(BUILD_DIR, 'pandoc', 'index.html')
+SITE_PAGE = os.path.join(BUILD_DIR, 'site', 'index.html')
+# pdflatex writes here instead of the (read-only) thesis directory; the
+# auxiliary files are kept so a warm build usually needs a single pass
+LATEX_BUILD_DIR = os.path.join(BUILD_DIR, 'latex')
+# Timings of the last build (see buildtrace.py)
+TRACE_DIR = os.path.join(BUILD_DIR, 'trace')
+
+# Files through which one pdflatex pass hands state to the next
+AUX_EXTENSIONS = ['.aux', '.toc', '.out', '.lof', '.lot']
+RERUN_RE = re.compile(r'Rerun to get|Label\(s\) may have changed|Please \(?re\)?run|Rerun LaTeX')
+MAX_LATEX_PASSES = 5
+LATEX_INPUT_EXTENSIONS = ('.tex', '.bib', '.sty', '.cls')
+# What every stage's stamp depends on besides its own inputs: the code
+# that decides whether a stage is current
+STAMP_INPUTS = ['stamps.py', 'toolchain.py']
+
+print_lock = threading.Lock()
+
+class StageFailed(Exception):
+    def __init__(self, message, log):
+        super().__init__(message)
+        self.log = log
+
+class Stage:
+    """A build step: what it needs, what it reads and writes, and how to run it
+
+    `run(log)` appends its output to `log` and returns False when the stage
+    finished without producing everything (its stamp is then not recorded,
+    but dependent stages still run). `inputs` may be a function, for files
+    that only exist once the stages before have run.
+    """
+    def __init__(self, name, run, deps=(), inputs=(), outputs=(), tools=(), options=None):
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self._inputs = inputs
+        self.outputs = list(outputs)
+        self.tools = list(tools)
+        self.options = dict(options or {})
+
+    @property
+    def inputs(self):
+        inputs = list(self._inputs() if callable(self._inputs) else self._inputs)
+        return inputs + [path for path in STAMP_INPUTS if path not in inputs]
+
+def sh(log, cmd, cwd=None, env=None, check=True, name=None):
+    """Run a command, appending its combined output to log"""
+    result = buildtrace.run(cmd, name=name, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True)
+    log.extend(result.stdout.splitlines())
+    if check and result.returncode != 0:
+        raise StageFailed(f"{os.path.basename(cmd[0])} exited with status {result.returncode}", log)
+    return result.returncode
+
+def say(line):
+    with print_lock:
+        print(line, flush=True)
+
+def aux_state(base):
+    """{extension: sha256 or None} of the auxiliary files next to base"""
+    state = {}
+    for ext in AUX_EXTENSIONS:
+        try:
+            with open(base + ext, 'rb') as f:
+                state[ext] = hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            state[ext] = None
+    return state
+
+def read_text(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+def latex_until_converged(log, pdflatex, main_tex, cwd, out_dir, max_passes):
+    """Run pdflatex until the auxiliary files stop changing and the log
+    asks for no rerun, at most max_passes times; returns the pass count"""
+    base = os.path.join(out_dir, os.path.splitext(main_tex)[0])
+    command = [pdflatex, '-interaction=nonstopmode', f'-output-directory={os.path.abspath(out_dir)}', main_tex]
+    for n in range(1, max_passes + 1):
+        before = aux_state(base)
+        sh([], command, cwd=cwd, check=False, name=f'pdflatex pass {n}')
+        tex_log = read_text(base + '.log')
+        errors = [line for line in tex_log.splitlines() if line.startswith('!')]
+        log.extend(f"   pass {n}: {line}" for line in errors[:5])
+        changed = [ext for ext, digest in aux_state(base).items() if before[ext] != digest]
+        rerun = RERUN_RE.search(tex_log)
+        if not changed and not rerun:
+            log.append(f"   converged after {n} pass{'es' if n > 1 else ''}")
+            return n
+        reason = f"{', '.join(changed)} changed" if changed else f'log says "{rerun.group(0)}"'
+        log.append(f"   pass {n}: {reason}")
+    log.append(f"⚠️  Warning: references did not settle after {max_passes} passes")
+    return max_passes
+
+def latex_tree(src):
+    """os.walk() over the thesis, without hidden directories or our build/"""
+    build_dir = os.path.abspath(BUILD_DIR)
+    for root, dirs, files in os.walk(src):
+        dirs[:] = [d for d in dirs if not d.startswith('.')
+                   and os.path.abspath(os.path.join(root, d)) != build_dir]
+        yield root, files
+
+def latex_inputs(src):
+    """The thesis's sources, including chapters in subdirectories"""
+    return sorted(os.path.join(root, name) for root, files in latex_tree(src)
+                  for name in files if name.endswith(LATEX_INPUT_EXTENSIONS))
+
+def mirror_dirs(src, dest):
+    """Recreate src's subdirectories under dest, where pdflatex writes the
+    .aux files of chapters included from them"""
+    for root, _ in latex_tree(src):
+        os.makedirs(os.path.join(dest, os.path.relpath(root, src)), exist_ok=True)
+
+def diagram_stage(args, tools):
+    flags = ['--batch']
+    if args.diagram_embed == 'object':
+        flags.append('--shared-glyphs')
+
+    def run(log):
+        sh(log, [sys.executable, 'extract-tikz.py', args.latex_source, tools['pdflatex']] + flags)
+        return True
+
+    return Stage('diagrams', run,
+                 inputs=[args.latex_source, 'build.py', 'extract-tikz.py', 'svgopt.py', 'texformat.py',
+                         'buildtrace.py'],
+                 outputs=['docs/diagrams'], tools=['pdflatex', 'pdf2svg', 'dvisvgm'],
+                 options={'flags': ' '.join(flags)})
+
+def pdf_stage(args, tools, sources):
+    latex_dir = os.path.dirname(args.latex_source) or '.'
+    main_tex = os.path.basename(args.latex_source)
+    main_pdf = os.path.join(LATEX_BUILD_DIR, os.path.splitext(main_tex)[0] + '.pdf')
+
+    def run(log):
+        mirror_dirs(latex_dir, LATEX_BUILD_DIR)
+        # A PDF left by an earlier build must not pass for this one
+        if os.path.exists(main_pdf):
+            os.remove(main_pdf)
+        latex_until_converged(log, tools['pdflatex'], main_tex, latex_dir, LATEX_BUILD_DIR, args.max_passes)
+        if not os.path.exists(main_pdf):
+            log.append(f"⚠️  Warning: PDF generation may have failed (see {LATEX_BUILD_DIR}/)")
+            return False
+        shutil.copy2(main_pdf, 'docs/thesis.pdf')
+        log.append("✅ PDF generated: docs/thesis.pdf")
+        return True
+
+    return Stage('pdf', run, inputs=sources + ['build.py'],
+                 outputs=['docs/thesis.pdf'], tools=['pdflatex'])
+
+def pandoc_stage(args, tools, sources, mathjax_arg):
+    def run(log):
+        env = dict(os.environ, DIAGRAM_EMBED=args.diagram_embed)
+        with atomicfile.replacing(PANDOC_PAGE) as tmp:
+            sh(log, [tools['pandoc'], args.latex_source,
+                     '--standalone',
+                     mathjax_arg,
+                     '--toc',
+                     '--toc-depth=2',
+                     '--css=style.css',
+                     '--lua-filter=tikzcd-filter.lua',
+                     '-o', tmp], env=env)
+        return True
+
+    return Stage('pandoc', run, inputs=sources + ['build.py', 'tikzcd-filter.lua'],
+                 outputs=[PANDOC_PAGE], tools=['pandoc'],
+                 options={'mathjax': mathjax_arg, 'embed': args.diagram_embed})
+
+def postprocess_stage(args, mathjax_arg):
+    def run(log):
+        with atomicfile.replacing(SITE_PAGE) as tmp:
+            htmlpost.process(PANDOC_PAGE, tmp, htmlpost.default_rules())
+            log.append("✅ Added favicon, PWA support and the PDF download link")
+            if mathjax_arg != '--mathjax':
+                sh(log, [sys.executable, 'vendor-mathjax.py', tmp])
+            # Optionally render formulas to SVG now instead of with MathJax in the browser
+            if args.prerender_math:
+                sh(log, [sys.executable, 'prerender-math.py', tmp])
+        return True
+
+    return Stage('postprocess', run, deps=['pandoc'],
+                 inputs=[PANDOC_PAGE, 'build.py', 'htmlpost.py', 'vendor-mathjax.py',
+                         'prerender-math.py', 'svgopt.py'],
+                 outputs=[SITE_PAGE], tools=['pdflatex', 'dvisvgm'],
+                 options={'mathjax': mathjax_arg, 'prerender': str(int(args.prerender_math))})
+
+def publish_stage(args):
+    def run(log):
+        manifest = fingerprint.fingerprint('docs')
+        log.append(f"✅ Fingerprinted {len(manifest)} assets into docs/{fingerprint.ASSETS_DIR}/")
+        htmlpost.process(SITE_PAGE, 'docs/index.html', htmlpost.asset_rules(manifest))
+        log.append("✅ HTML published: docs/index.html")
+        # Optionally split the page into one page per chapter (single page kept as complete.html)
+        if args.split:
+            sh(log, [sys.executable, 'split-chapters.py', 'docs/index.html'])
+        entries = precache.write_service_worker('docs')
+        log.append(f"✅ Service worker precaches {len(entries)} files: docs/sw.js")
+        return True
+
+    # The diagrams and the PDF are only known once their stages have run
+    def inputs():
+        assets = [os.path.join('docs', path) for path in fingerprint.source_files('docs')]
+        return [SITE_PAGE, 'build.py', 'fingerprint.py', 'htmlpost.py', 'split-chapters.py',
+                'precache.py', precache.TEMPLATE] + assets
+
+    return Stage('publish', run, deps=['postprocess', 'diagrams', 'pdf'], inputs=inputs,
+                 outputs=['docs/index.html', 'docs/sw.js', os.path.join('docs', fingerprint.MANIFEST_NAME)],
+                 options={'split': str(int(args.split))})
+
+def compress_stage():
+    def run(log):
+        compressed, skipped, before, after = compress.compress_tree('docs')
+        log.append(f"✅ Compressed {compressed} files ({skipped} unchanged)"
+                   + (f", {before // 1024} KB -> {after // 1024} KB" if compressed else ""))
+        if not compress.brotli_available():
+            log.append("⚠️  Warning: no brotli module or command, wrote .gz only")
+        return True
+
+    return Stage('compress', run, deps=['publish'],
+                 inputs=lambda: ['build.py', 'compress.py'] + compress.compressible_files('docs'),
+                 options={'brotli': str(int(compress.brotli_available()))})
+
+def budget_stage():
+    def run(log):
+        report = budget.analyse('docs')
+        log.extend(budget.summary_lines(report, top=5))
+        exceeded = budget.check(report, budget.read_budget())
+        if exceeded:
+            raise StageFailed(f"{len(exceeded)} budget(s) in {budget.BUDGET_FILE} exceeded",
+                              log + budget.violation_lines(exceeded))
+        log.append(f"✅ Within budget ({budget.BUDGET_FILE})")
+        return True
+
+    return Stage('budget', run, deps=['compress'],
+                 inputs=lambda: ['build.py', 'budget.py', budget.BUDGET_FILE]
+                                + [os.path.join('docs', path) for path in budget.deployed_files('docs')])
+
+def run_stage(stage, force):
+    """Run one stage unless its stamp is current; returns (status, log)"""
+    if force:
+        up_to_date, reason = False, "--force"
+    else:
+        up_to_date, reason = stamps.check(stage.name, stage.inputs, stage.outputs,
+                                          stage.tools, stage.options)
+    if up_to_date:
+        return 'skipped', [f"⏭️  Skipping {stage.name}: {reason}"]
+    say(f"▶️  {stage.name}: {reason}")
+    log = []
+    with buildtrace.span(stage.name, 'stage', reason=reason):
+        complete = stage.run(log)
+    if complete:
+        stamps.record(stage.name, stage.inputs, stage.tools, stage.options)
+        return 'built', log
+    return 'incomplete', log
+
+def run_graph(stages, jobs, force):
+    """Run stages as their dependencies complete; returns the names that failed"""
+    pending = {stage.name: stage for stage in stages}
+    done, failed = set(), set()
+    running = {}
+    started = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if any(dep in failed for dep in stage.deps):
+                    del pending[name]
+                    failed.add(name)
+                    say(f"⏹️  {name}: not run, a stage it needs failed")
+                elif all(dep in done for dep in stage.deps):
+                    del pending[name]
+                    started[name] = time.monotonic()
+                    running[pool.submit(run_stage, stage, force)] = stage
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                elapsed = time.monotonic() - started[stage.name]
+                try:
+                    status, log = future.result()
+                except StageFailed as e:
+                    failed.add(stage.name)
+                    say('\n'.join(e.log + [f"❌ {stage.name} failed after {elapsed:.1f}s: {e}"]))
+                    continue
+                except Exception as e:
+                    failed.add(stage.name)
+                    say(f"❌ {stage.name} failed after {elapsed:.1f}s: {e}")
+                    continue
+                done.add(stage.name)
+                if status != 'skipped':
+                    log.append(f"⏱️  {stage.name}: {status} in {elapsed:.1f}s")
+                say('\n'.join(log))
+    return failed
+
+def select_stages(stages, names):
+    """The named stages and every stage they need, in build order"""
+    by_name = {stage.name: stage for stage in stages}
+    wanted, todo = set(), list(names)
+    while todo:
+        name = todo.pop()
+        if name not in wanted:
+            wanted.add(name)
+            todo.extend(by_name[name].deps)
+    return [stage for stage in stages if stage.name in wanted]
+
+def parse_args():
+    env = os.environ
+    parser = argparse.ArgumentParser(description="Build the website (diagrams, PDF and HTML)")
+    parser.add_argument('--latex-source', default=LATEX_SOURCE)
+    parser.add_argument('--jobs', '-j', type=int, default=3,
+                        help="stages run at the same time (default: 3)")
+    parser.add_argument('--max-passes', type=int, default=MAX_LATEX_PASSES,
+                        help=f"most pdflatex passes for the PDF (default: {MAX_LATEX_PASSES})")
+    parser.add_argument('--force', action='store_true', default=env.get('FORCE') == '1',
+                        help="rebuild every stage (default: $FORCE=1)")
+    parser.add_argument('--split', action='store_true', default=env.get('SPLIT_CHAPTERS') == '1',
+                        help="one page per chapter (default: $SPLIT_CHAPTERS=1)")
+    parser.add_argument('--prerender-math', action='store_true', default=env.get('PRERENDER_MATH') == '1',
+                        help="render formulas to SVG at build time (default: $PRERENDER_MATH=1)")
+    parser.add_argument('--profile', action='store_true',
+                        help="print the slowest stages and commands (always traced to build/trace/)")
+    parser.add_argument('--diagram-embed', choices=['img', 'object'], default=env.get('DIAGRAM_EMBED', 'img'),
+                        help="how pages embed diagrams (default: $DIAGRAM_EMBED or img)")
+    parser.add_argument('--stage', dest='stages', action='append', metavar='NAME',
+                        help="only build this stage and the stages it needs (repeatable)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    print("================================================")
+    print("  LaTeX to Website Builder")
+    print("================================================")
+    print()
+
+    if not os.path.isfile(args.latex_source):
+        print(f"❌ Error: LaTeX source not found at {args.latex_source}")
+        sys.exit(1)
+
+    print("Checking dependencies...")
+    toolset = toolchain.resolve()
+    tools = {name: toolchain.path(name, toolset) for name in ['pandoc', 'pdflatex']}
+    for name, path in tools.items():
+        if not path:
+            print(f"❌ Error: {name} is not installed.")
+            print(f"   Install with: {toolchain.INSTALL_HINTS[name]}")
+            sys.exit(1)
+    print("✅ All dependencies found")
+    print()
+
+    os.makedirs('docs', exist_ok=True)
+    sources = latex_inputs(os.path.dirname(args.latex_source) or '.')
+
+    # Serve a minimal local MathJax when a mathjax@3 package is available (see vendor-mathjax.py)
+    mathjax_arg = '--mathjax'
+    if subprocess.run([sys.executable, 'vendor-mathjax.py', '--check'],
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0:
+        mathjax_arg = '--mathjax=mathjax/bundle.js'
+
+    stages = [
+        diagram_stage(args, tools),
+        pdf_stage(args, tools, sources),
+        pandoc_stage(args, tools, sources, mathjax_arg),
+        postprocess_stage(args, mathjax_arg),
+        publish_stage(args),
+        compress_stage(),
+        budget_stage(),
+    ]
+    if args.stages:
+        unknown = sorted(set(args.stages) - {stage.name for stage in stages})
+        if unknown:
+            print(f"❌ Error: no stage {', '.join(unknown)} "
+                  f"(stages: {', '.join(stage.name for stage in stages)})")
+            sys.exit(1)
+        stages = select_stages(stages, args.stages)
+    buildtrace.start(TRACE_DIR)
+    start = time.monotonic()
+    failed = run_graph(stages, max(1, args.jobs), args.force)
+    elapsed = time.monotonic() - start
+    print()
+
+    profile = buildtrace.write_reports(TRACE_DIR)
+    if args.profile:
+        buildtrace.print_profile(profile)
+        print(f"Report: {TRACE_DIR}/report.json, Chrome trace: {TRACE_DIR}/trace.json")
+        print()
+
+    if failed:
+        print(f"❌ Build failed ({', '.join(sorted(failed))}) after {elapsed:.1f}s")
+        sys.exit(1)
+    if args.stages:
+        print(f"✅ Built {', '.join(stage.name for stage in stages)} ({elapsed:.1f}s)")
+        return
+
+    print("================================================")
+    print(f"  ✅ Website build complete! ({elapsed:.1f}s)")
+    print("================================================")
+    print()
+    print("Output location: docs/")
+    print("  • HTML: docs/index.html")
+    print("  • PDF:  docs/thesis.pdf")
+    print()
+    print("To preview locally, run:")
+    print("  python3 serve.py")
+    print()
+    print("Then open: http://localhost:8000")
+    print()
+
+if __name__ == '__main__':
+    main()
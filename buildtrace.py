@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Time build stages and subprocesses: wall time, CPU time and peak RSS
+
+Spans are recorded with `with buildtrace.span(name)` and subprocesses by
+calling buildtrace.run() instead of subprocess.run(); it reaps the child
+with os.wait4() to get its resource usage. Events are appended, one JSON
+object per line, to $BUILD_TRACE_DIR/events-<pid>.jsonl, so processes
+started by the build (extract-tikz.py and its workers, prerender-math.py)
+add to the same trace. Without BUILD_TRACE_DIR nothing is recorded.
+
+    python3 buildtrace.py [TRACE_DIR] [--top N]
+
+prints the slowest spans of a finished build. build.py writes report.json
+and trace.json (open it in chrome://tracing or ui.perfetto.dev) there.
+"""
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import atomicfile
+
+TRACE_DIR = 'build/trace'
+ENV_VAR = 'BUILD_TRACE_DIR'
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+write_lock = threading.Lock()
+# Usage totals of the spans open in each thread; run() adds its child's to them
+open_spans = threading.local()
+
+def trace_dir():
+    return os.environ.get(ENV_VAR)
+
+def start(directory=TRACE_DIR):
+    """Start a new trace in directory, for this process and its children"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, 'events-*.jsonl')):
+        os.remove(path)
+    os.environ[ENV_VAR] = os.path.abspath(directory)
+
+def record(event):
+    directory = trace_dir()
+    if not directory:
+        return
+    line = json.dumps(event, ensure_ascii=False) + '\n'
+    with write_lock:
+        with open(os.path.join(directory, f'events-{os.getpid()}.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(line)
+
+def thread_cpu():
+    return time.thread_time()
+
+def spans_in_thread():
+    if not hasattr(open_spans, 'usage'):
+        open_spans.usage = []
+    return open_spans.usage
+
+@contextmanager
+def span(name, category='stage', **args):
+    """Time the body: wall time, and CPU time and peak RSS of this thread
+    plus the subprocesses it ran with run().
+
+    Stages run side by side in build.py's threads, so process-wide
+    getrusage() deltas would count one stage's work in another; the peak
+    RSS of this process is a high-water mark, the largest of the span's
+    subprocesses is usually what matters."""
+    usage = {'cpu': 0.0, 'max_rss': 0}
+    spans_in_thread().append(usage)
+    begin, cpu = time.time(), thread_cpu()
+    try:
+        yield args
+    finally:
+        spans_in_thread().remove(usage)
+        own_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+        record({'name': name, 'cat': category, 'ts': begin, 'dur': time.time() - begin,
+                'cpu': thread_cpu() - cpu + usage['cpu'], 'max_rss': max(usage['max_rss'], own_rss),
+                'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args})
+
+def command_name(cmd):
+    """'pandoc', or 'extract-tikz.py' for a Python script"""
+    if os.path.basename(cmd[0]).startswith('python') and len(cmd) > 1:
+        return os.path.basename(cmd[1])
+    return os.path.basename(cmd[0])
+
+def run(cmd, name=None, category='subprocess', check=False, capture_output=False,
+        stdout=None, stderr=None, text=False, cwd=None, env=None):
+    """subprocess.run() that records the child's wall time, CPU time and peak RSS"""
+    if capture_output:
+        stdout = stderr = subprocess.PIPE
+    begin = time.time()
+    proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, text=text, cwd=cwd, env=env)
+
+    # Read the pipes ourselves: communicate() would reap the child and lose its rusage
+    outputs = {}
+    def drain(key, pipe):
+        outputs[key] = pipe.read()
+        pipe.close()
+    readers = [threading.Thread(target=drain, args=(key, pipe))
+               for key, pipe in [('stdout', proc.stdout), ('stderr', proc.stderr)] if pipe]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    cpu, max_rss = usage.ru_utime + usage.ru_stime, usage.ru_maxrss * RSS_UNIT
+    for totals in spans_in_thread():
+        totals['cpu'] += cpu
+        totals['max_rss'] = max(totals['max_rss'], max_rss)
+    record({'name': name or command_name(cmd), 'cat': category, 'ts': begin,
+            'dur': time.time() - begin, 'cpu': cpu, 'max_rss': max_rss, 'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': {'command': ' '.join(str(part) for part in cmd), 'status': proc.returncode}})
+    result = subprocess.CompletedProcess(cmd, proc.returncode, outputs.get('stdout'), outputs.get('stderr'))
+    if check:
+        result.check_returncode()
+    return result
+
+def read_events(directory=TRACE_DIR):
+    events = []
+    for path in sorted(glob.glob(os.path.join(directory, 'events-*.jsonl'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            events += [json.loads(line) for line in f if line.strip()]
+    return sorted(events, key=lambda event: event['ts'])
+
+def chrome_trace(events):
+    """Trace-event format: complete ('X') events in microseconds"""
+    origin = min((event['ts'] for event in events), default=0)
+    trace = []
+    for event in events:
+        args = dict(event.get('args', {}), cpu_s=round(event['cpu'], 3))
+        if 'max_rss' in event:
+            args['max_rss_mb'] = round(event['max_rss'] / 2**20, 1)
+        trace.append({'name': event['name'], 'cat': event['cat'], 'ph': 'X',
+                      'ts': round((event['ts'] - origin) * 1e6), 'dur': round(event['dur'] * 1e6),
+                      'pid': event['pid'], 'tid': event['tid'] % 2**31, 'args': args})
+    return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+def report(events):
+    """Totals per category and every span, slowest first"""
+    def summary(event):
+        entry = {'name': event['name'], 'wall_s': round(event['dur'], 3), 'cpu_s': round(event['cpu'], 3)}
+        if 'max_rss' in event:
+            entry['max_rss_mb'] = round(event['max_rss'] / 2**20, 1)
+        entry.update(event.get('args', {}))
+        return entry
+    categories = {}
+    for event in events:
+        totals = categories.setdefault(event['cat'], {'count': 0, 'wall_s': 0.0, 'cpu_s': 0.0})
+        totals['count'] += 1
+        totals['wall_s'] = round(totals['wall_s'] + event['dur'], 3)
+        totals['cpu_s'] = round(totals['cpu_s'] + event['cpu'], 3)
+    wall = (max(e['ts'] + e['dur'] for e in events) - min(e['ts'] for e in events)) if events else 0
+    return {
+        'wall_s': round(wall, 3),
+        'categories': categories,
+        'spans': {cat: [summary(e) for e in sorted(events, key=lambda e: -e['dur']) if e['cat'] == cat]
+                  for cat in categories},
+    }
+
+def write_reports(directory=TRACE_DIR):
+    """Write report.json and trace.json from the recorded events; returns the report"""
+    events = read_events(directory)
+    data = report(events)
+    for name, content in [('report.json', data), ('trace.json', chrome_trace(events))]:
+        atomicfile.write_json(os.path.join(directory, name), content, sort_keys=False, ensure_ascii=False)
+    return data
+
+def print_profile(data, top=10):
+    print(f"Slowest spans (build wall time {data['wall_s']:.2f}s):")
+    for category, spans in data['spans'].items():
+        totals = data['categories'][category]
+        print(f"  {category}: {totals['count']} spans, {totals['wall_s']:.2f}s wall, {totals['cpu_s']:.2f}s CPU")
+        for entry in spans[:top]:
+            rss = f", {entry['max_rss_mb']:.0f} MB peak" if 'max_rss_mb' in entry else ''
+            print(f"    {entry['wall_s']:8.3f}s wall {entry['cpu_s']:8.3f}s CPU{rss}  {entry['name']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise a build trace")
+    parser.add_argument('trace_dir', nargs='?', default=TRACE_DIR)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+    print_profile(write_reports(args.trace_dir), args.top)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Write precompressed .gz and .br siblings of the text files in docs/
+
+Every compressible file gets file.gz (gzip -9) and, when the brotli module
+or command is available, file.br (quality 11), so a server can send the
+smallest variant the browser accepts without compressing per request. A
+variant is only kept when it is smaller than the original.
+
+The hash of each source is remembered in .cache/compressed.json; files
+whose content did not change since their variants were written are skipped.
+Variants whose source is gone are removed.
+
+    python3 compress.py [DOCS_DIR]
+"""
+import gzip
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import atomicfile
+
+STATE_FILE = '.cache/compressed.json'
+
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg', '.xml', '.txt', '.map', '.webmanifest')
+VARIANTS = ('.gz', '.br')
+
+def gzip_bytes(data):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def brotli_bytes(data):
+    if brotli is not None:
+        return brotli.compress(data, quality=11)
+    command = shutil.which('brotli')
+    if command:
+        return subprocess.run([command, '-c', '-q', '11'], input=data,
+                              stdout=subprocess.PIPE, check=True).stdout
+    return None
+
+def brotli_available():
+    return brotli is not None or shutil.which('brotli') is not None
+
+def write_or_remove(path, data, limit):
+    """Write data to path if it is smaller than limit, else remove path"""
+    if data is None or len(data) >= limit:
+        if os.path.exists(path):
+            os.remove(path)
+        return 0
+    atomicfile.write_bytes(path, data)
+    return len(data)
+
+def compressible_files(docs_dir='docs'):
+    files = []
+    for root, dirs, names in os.walk(docs_dir):
+        dirs.sort()
+        for name in sorted(names):
+            if name.endswith(COMPRESSIBLE) and atomicfile.TMP_MARKER not in name:
+                files.append(os.path.join(root, name))
+    return files
+
+def compress_tree(docs_dir='docs'):
+    """Returns (files compressed, files skipped, bytes before, bytes after)"""
+    state = atomicfile.read_json(STATE_FILE)
+    with_brotli = brotli_available()
+    files = compressible_files(docs_dir)
+    compressed = skipped = before = after = 0
+    for path in files:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        key = os.path.abspath(path)
+        entry = state.get(key, {})
+        if (entry.get('sha256') == digest and entry.get('brotli') == with_brotli
+                and all(os.path.exists(path + ext) for ext in entry.get('variants', []))):
+            skipped += 1
+            continue
+        sizes = {'.gz': write_or_remove(path + '.gz', gzip_bytes(data), len(data))}
+        if with_brotli:
+            sizes['.br'] = write_or_remove(path + '.br', brotli_bytes(data), len(data))
+        written = sorted(ext for ext, size in sizes.items() if size)
+        before += len(data)
+        after += min([sizes[ext] for ext in written] or [len(data)])
+        state[key] = {'sha256': digest, 'brotli': with_brotli, 'variants': written}
+        compressed += 1
+
+    # Variants of files that no longer exist
+    current = {os.path.abspath(path) for path in files}
+    for root, _, names in os.walk(docs_dir):
+        for name in names:
+            source, ext = os.path.splitext(os.path.join(root, name))
+            if ext in VARIANTS and os.path.abspath(source) not in current:
+                os.remove(os.path.join(root, name))
+    state = {key: value for key, value in state.items()
+             if key in current or not key.startswith(os.path.abspath(docs_dir) + os.sep)}
+    atomicfile.write_json(STATE_FILE, state)
+    return compressed, skipped, before, after
+
+def main():
+    docs_dir = sys.argv[1] if len(sys.argv) > 1 else 'docs'
+    if not brotli_available():
+        print("⚠️  Warning: no brotli module or command, writing .gz only "
+              "(pip install brotli or brew install brotli)")
+    compressed, skipped, before, after = compress_tree(docs_dir)
+    saved = f", {before // 1024} KB -> {after // 1024} KB" if compressed else ""
+    print(f"✅ Compressed {compressed} files ({skipped} unchanged){saved}")
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,52 @@
 #!/usr/bin/env python3
 """Extract TikZ diagrams from LaTeX and convert to SVG"""
+import argparse
+import hashlib
 import re
+import shutil
 import subprocess
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import atomicfile
+import buildtrace
+import svgopt
+import texformat
+import toolchain
+
+# Compiled SVGs are stored here, named by a hash of everything that affects them
+CACHE_DIR = '.cache/diagrams'
+
+# TeX runs happen here, one directory per diagram (or 'batch'), kept between builds
+BUILD_DIR = 'build/diagrams'
+
+# Glyphs shared between diagrams, with --shared-glyphs
+SPRITE_NAME = 'glyphs.svg'
+
+# Fastest first: dvisvgm skips PDF generation and embeds compact WOFF2
+# fonts instead of outlining every glyph
+BACKENDS = ['dvisvgm', 'pdf2svg']
+
+# How dvisvgm draws text: embedded fonts, or glyph outlines (<path> + <use>),
+# which --shared-glyphs needs; pdf2svg always outlines
+DVISVGM_GLYPHS = {'fonts': ['--font-format=woff2'], 'outlines': ['--no-fonts']}
+
+# The dvisvgm class option selects the matching PGF driver
+PREAMBLES = {
+    'pdf2svg': r"""\documentclass[tikz,border=2pt]{standalone}
+\usepackage{tikz-cd}
+\begin{document}
+""",
+    'dvisvgm': r"""\documentclass[tikz,dvisvgm,border=2pt]{standalone}
+\usepackage{tikz-cd}
+\begin{document}
+""",
+}
+
+STANDALONE_END = r"""
+\end{document}
+"""
 
 def extract_tikzcd_diagrams(latex_file):
     """Extract all tikzcd environments from LaTeX file"""
@@ -16,14 +59,9 @@ def extract_tikzcd_diagrams(latex_file):
     
     return diagrams
 
-def create_standalone_tex(diagram, index, output_dir):
+def create_standalone_tex(diagram, index, output_dir, preamble=PREAMBLES['pdf2svg']):
     """Create a standalone LaTeX file for a single diagram"""
-    tex_content = r"""\documentclass[tikz,border=2pt]{standalone}
-\usepackage{tikz-cd}
-\begin{document}
-""" + diagram + r"""
-\end{document}
-"""
+    tex_content = preamble + diagram + STANDALONE_END
     
     tex_file = os.path.join(output_dir, f'diagram_{index}.tex')
     with open(tex_file, 'w', encoding='utf-8') as f:
@@ -31,78 +69,274 @@ def create_standalone_tex(diagram, index, output_dir):
     
     return tex_file
 
-def compile_to_svg(tex_file, pdflatex_path):
-    """Compile LaTeX to PDF then convert to SVG"""
-    base_name = tex_file.replace('.tex', '')
+def diagram_key(diagram, preamble, versions, glyphs='fonts'):
+    """Cache key: diagram body, standalone preamble, tool versions and how
+    dvisvgm draws text"""
+    h = hashlib.sha256()
+    parts = [preamble, diagram, STANDALONE_END]
+    if glyphs != 'fonts' and 'dvisvgm' in versions:
+        parts.append(f'glyphs={glyphs}')
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    for name in sorted(versions):
+        h.update(f'{name}={versions[name]}'.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+def cache_path(key):
+    return os.path.join(CACHE_DIR, key + '.svg')
+
+def choose_backend(requested, toolset):
+    """The requested backend, or the fastest one installed for 'auto'"""
+    if requested != 'auto':
+        return requested if toolchain.path(requested, toolset) else None
+    for backend in BACKENDS:
+        if toolchain.path(backend, toolset):
+            return backend
+    return None
+
+def run_tex(tex_file, tools):
+    """Compile tex_file in its own directory, from the dumped preamble format if any.
+
+    Produces a DVI for the dvisvgm backend and a PDF otherwise; returns its
+    path or None.
+    """
     work_dir = os.path.dirname(tex_file)
     tex_basename = os.path.basename(tex_file)
+    output_format = 'dvi' if tools['backend'] == 'dvisvgm' else 'pdf'
+    out_file = tex_file.replace('.tex', '.' + output_format)
+    command = [tools['pdflatex'], f'-output-format={output_format}',
+               '-interaction=nonstopmode', tex_basename]
+    
+    fmt = tools.get('fmt')
+    if fmt:
+        buildtrace.run(command[:1] + texformat.format_args(fmt) + command[1:],
+                       name=f'pdflatex {tex_basename}',
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       cwd=work_dir, env=texformat.format_env(fmt))
+        if os.path.exists(out_file):
+            return out_file
     
-    # Compile to PDF
-    subprocess.run([pdflatex_path, '-interaction=nonstopmode', tex_basename],
-                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                   cwd=work_dir)
+    buildtrace.run(command, name=f'pdflatex {tex_basename}',
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=work_dir)
+    return out_file if os.path.exists(out_file) else None
+
+def convert_command(in_file, work_dir, name, tools, all_pages=False):
+    """Converter invocation writing <name>.svg, or <name>-<page>.svg for all pages"""
+    if tools['backend'] == 'dvisvgm':
+        pattern = os.path.join(work_dir, f'{name}-%p.svg' if all_pages else f'{name}.svg')
+        pages = ['--page=1-'] if all_pages else []
+        return [tools['dvisvgm'], *DVISVGM_GLYPHS[tools['glyphs']], '--bbox=papersize',
+                *pages, '-o', pattern, in_file]
     
-    pdf_file = base_name + '.pdf'
+    pattern = os.path.join(work_dir, f'{name}-%d.svg' if all_pages else f'{name}.svg')
+    return [tools['pdf2svg'], in_file, pattern] + (['all'] if all_pages else [])
+
+def compile_to_svg(tex_file, tools):
+    """Compile LaTeX to PDF (or DVI) then convert to SVG"""
+    base_name = tex_file.replace('.tex', '')
     svg_file = base_name + '.svg'
     
-    # Convert PDF to SVG using pdf2svg or dvisvgm
-    if os.path.exists(pdf_file):
-        # Try to find pdf2svg
-        pdf2svg_cmd = None
-        for path in ['/usr/local/bin/pdf2svg', '/opt/homebrew/bin/pdf2svg', 'pdf2svg']:
-            try:
-                subprocess.run([path, '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                pdf2svg_cmd = path
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        
-        if pdf2svg_cmd:
-            try:
-                subprocess.run([pdf2svg_cmd, pdf_file, svg_file],
-                              check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except subprocess.CalledProcessError:
-                print(f"Warning: Could not convert {pdf_file} to SVG.")
-                return None
-        else:
-            print(f"Warning: pdf2svg not found. Install with: brew install pdf2svg")
+    out_file = run_tex(tex_file, tools)
+    if out_file:
+        try:
+            buildtrace.run(convert_command(out_file, os.path.dirname(tex_file),
+                                           os.path.basename(base_name), tools),
+                           name=f"{tools['backend']} {os.path.basename(out_file)}",
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except subprocess.CalledProcessError:
+            print(f"Warning: Could not convert {out_file} to SVG.")
             return None
     
     return svg_file if os.path.exists(svg_file) else None
 
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: extract-tikz.py <latex_file> <pdflatex_path>")
-        sys.exit(1)
+def work_dir_name(cached_svg):
+    return os.path.basename(cached_svg)[:16]
+
+def prepare_work_dir(work_dir):
+    """Create work_dir, removing outputs of an earlier run but keeping .aux/.log"""
+    os.makedirs(work_dir, exist_ok=True)
+    for entry in os.listdir(work_dir):
+        if entry.endswith(('.pdf', '.dvi', '.svg')):
+            os.remove(os.path.join(work_dir, entry))
+    return work_dir
+
+def build_diagram(diagram, index, cached_svg, tools):
+    """Compile one diagram in its own build directory and cache the SVG"""
+    work_dir = prepare_work_dir(os.path.join(tools['build_dir'], work_dir_name(cached_svg)))
+    tex_file = create_standalone_tex(diagram, index, work_dir, PREAMBLES[tools['backend']])
+    with buildtrace.span(f'diagram {index}', 'diagram'):
+        svg_file = compile_to_svg(tex_file, tools)
+    if not svg_file:
+        return False
+    atomicfile.copy(svg_file, cached_svg)
+    return True
+
+def create_batch_tex(diagrams, work_dir, preamble=PREAMBLES['pdf2svg']):
+    """Create one multi-page standalone document, one diagram per page"""
+    tex_content = preamble + '\n'.join(diagrams) + STANDALONE_END
+    
+    tex_file = os.path.join(work_dir, 'batch.tex')
+    with open(tex_file, 'w', encoding='utf-8') as f:
+        f.write(tex_content)
+    
+    return tex_file
+
+def build_batch(diagrams, cached_svgs, tools):
+    """Compile all diagrams in one TeX run and split the output by page.
+
+    The tikz option of standalone puts every tikzpicture (and so every
+    tikzcd) on its own page, so page N is diagrams[N-1]. Returns False if
+    the page count does not match, e.g. because one diagram failed.
+    """
+    work_dir = prepare_work_dir(os.path.join(tools['build_dir'], 'batch'))
+    tex_file = create_batch_tex(diagrams, work_dir, PREAMBLES[tools['backend']])
+    out_file = run_tex(tex_file, tools)
+    if not out_file:
+        return False
+    
+    try:
+        buildtrace.run(convert_command(out_file, work_dir, 'page', tools, all_pages=True),
+                       name=f"{tools['backend']} {os.path.basename(out_file)}",
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError:
+        return False
+    
+    page_file = lambda n: os.path.join(work_dir, f'page-{n}.svg')
+    pages = [page_file(n + 1) for n in range(len(diagrams))]
+    if not all(os.path.exists(p) for p in pages) or os.path.exists(page_file(len(diagrams) + 1)):
+        return False
+    for page, cached_svg in zip(pages, cached_svgs):
+        atomicfile.copy(page, cached_svg)
+    return True
+
+def compile_all(jobs, tools, batch, max_workers):
+    """Run build_diagram jobs (in one batch or on a pool); return the number built"""
+    if batch and len(jobs) > 1:
+        if build_batch([job[0] for job in jobs], [job[2] for job in jobs], tools):
+            return len(jobs)
+        print("Warning: batch compile failed, falling back to one diagram per run")
     
-    latex_file = sys.argv[1]
-    pdflatex_path = sys.argv[2]
+    if max_workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(build_diagram, *zip(*jobs), [tools] * len(jobs)))
+    else:
+        results = [build_diagram(*job, tools) for job in jobs]
+    return sum(results)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Extract tikzcd diagrams and convert them to SVG")
+    parser.add_argument('latex_file')
+    parser.add_argument('pdflatex_path', nargs='?',
+                        help="pdflatex to use (default: from toolchain.py)")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="number of diagrams to compile in parallel (default: CPU count)")
+    parser.add_argument('--backend', choices=['auto'] + BACKENDS, default='auto',
+                        help="SVG converter (default: fastest installed, dvisvgm before pdf2svg)")
+    parser.add_argument('--batch', action='store_true',
+                        help="compile all diagrams in a single multi-page TeX run")
+    parser.add_argument('--build-dir', default=BUILD_DIR,
+                        help="where TeX runs and keeps its files (default: %(default)s)")
+    parser.add_argument('--no-format', action='store_true',
+                        help="do not precompile the standalone preamble into a format file")
+    parser.add_argument('--precision', type=int, default=svgopt.DEFAULT_PRECISION,
+                        help="decimal places kept in SVG coordinates (default: %(default)s)")
+    parser.add_argument('--shared-glyphs', action='store_true',
+                        help=f"move glyphs used by several diagrams into {SPRITE_NAME} "
+                             "(needs DIAGRAM_EMBED=object in tikzcd-filter.lua)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    latex_file = args.latex_file
     
-    # Create output directory
+    # Create output and cache directories
     output_dir = 'docs/diagrams'
     os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    
+    toolset = toolchain.resolve()
+    pdflatex_path = toolchain.path('pdflatex', toolset)
+    if args.pdflatex_path:
+        pdflatex_path = os.path.abspath(shutil.which(args.pdflatex_path) or args.pdflatex_path)
+    if not pdflatex_path:
+        print(f"❌ Error: pdflatex not found. Install with: {toolchain.INSTALL_HINTS['pdflatex']}")
+        sys.exit(1)
+    backend = choose_backend(args.backend, toolset)
+    if not backend:
+        wanted = BACKENDS if args.backend == 'auto' else [args.backend]
+        hints = ' or '.join(toolchain.INSTALL_HINTS[name] for name in wanted)
+        print(f"❌ Error: no SVG converter found ({', '.join(wanted)}). Install with: {hints}")
+        sys.exit(1)
+    preamble = PREAMBLES[backend]
+    all_versions = toolchain.versions(toolset)
+    versions = {name: all_versions[name] for name in ['pdflatex', backend]}
+    if pdflatex_path != toolchain.path('pdflatex', toolset):
+        versions['pdflatex'] = toolchain.probe_version(pdflatex_path)
     
     # Extract diagrams
     diagrams = extract_tikzcd_diagrams(latex_file)
     print(f"Found {len(diagrams)} TikZ diagrams")
     
-    # Process each diagram
-    for i, diagram in enumerate(diagrams):
-        print(f"Processing diagram {i+1}/{len(diagrams)}...")
-        tex_file = create_standalone_tex(diagram, i, output_dir)
-        svg_file = compile_to_svg(tex_file, pdflatex_path)
-        
-        if svg_file:
-            print(f"  Created {svg_file}")
-        
-        # Clean up intermediate files
-        for ext in ['.tex', '.pdf', '.aux', '.log']:
-            try:
-                os.remove(tex_file.replace('.tex', ext))
-            except FileNotFoundError:
-                pass
-    
-    print(f"Done! Created {len(diagrams)} diagrams in {output_dir}/")
+    # Identical bodies share a key, so each missing key is compiled once
+    glyphs = 'outlines' if args.shared_glyphs else 'fonts'
+    keys = [diagram_key(diagram, preamble, versions, glyphs) for diagram in diagrams]
+    pending = {}
+    for i, key in enumerate(keys):
+        if key not in pending and not os.path.exists(cache_path(key)):
+            pending[key] = i
+    mode = ("in one batch" if args.batch else f"with {args.jobs} jobs") + f" via {backend}"
+    print(f"Compiling {len(pending)} diagrams {mode} "
+          f"({len(diagrams) - len(pending)} cached or duplicate)...")
+    
+    tools = {'pdflatex': pdflatex_path, 'backend': backend,
+             backend: toolchain.path(backend, toolset), 'fmt': None, 'glyphs': glyphs,
+             'build_dir': os.path.abspath(args.build_dir)}
+    
+    # Drop the build directories of diagrams that are no longer in the thesis
+    os.makedirs(args.build_dir, exist_ok=True)
+    current = {work_dir_name(cache_path(key)) for key in keys} | {'batch'}
+    for entry in os.listdir(args.build_dir):
+        if entry not in current:
+            shutil.rmtree(os.path.join(args.build_dir, entry), ignore_errors=True)
+    if pending and not args.no_format:
+        tools['fmt'] = texformat.ensure_format(f'tikzcd-{backend}', preamble, pdflatex_path,
+                                               versions['pdflatex'])
+        if not tools['fmt']:
+            print("Warning: could not dump the diagram preamble format, compiling without it")
+    
+    jobs = [(diagrams[i], i, cache_path(key)) for key, i in pending.items()]
+    compiled = compile_all(jobs, tools, args.batch, args.jobs)
+    
+    # Optimise the cached SVGs on their way into docs/diagrams
+    svgs = {}
+    for i, key in enumerate(keys):
+        cached_svg = cache_path(key)
+        if os.path.exists(cached_svg):
+            with open(cached_svg, 'r', encoding='utf-8') as f:
+                svgs[os.path.join(output_dir, f'diagram_{i}.svg')] = svgopt.optimize_svg(f.read(), args.precision)
+        else:
+            print(f"Warning: diagram {i} could not be compiled")
+    
+    sprite_file = os.path.join(output_dir, SPRITE_NAME)
+    if args.shared_glyphs:
+        svgs, sprite = svgopt.share_glyphs(svgs, SPRITE_NAME)
+        atomicfile.write_text(sprite_file, sprite)
+        shared = sprite.count(' id=')
+        if shared:
+            print(f"Moved {shared} glyphs shared between diagrams into {sprite_file}")
+        elif len(svgs) > 1:
+            print("Warning: --shared-glyphs found no glyph outlines shared between diagrams")
+    elif os.path.exists(sprite_file):
+        os.remove(sprite_file)
+    
+    for svg_file, svg in svgs.items():
+        atomicfile.write_text(svg_file, svg)
+    created = len(svgs)
+    
+    print(f"Done! Created {created} diagrams in {output_dir}/ "
+          f"({compiled} compiled, {len(diagrams) - len(pending)} cached or duplicate)")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Copy the site's static assets to content-addressed names
+
+Every asset in ASSETS is copied to docs/assets/ with a hash of its content
+in the name (style.css -> assets/style.3f9a0c1b2d.css), and the mapping is
+written to docs/asset-manifest.json for htmlpost.py to rewrite references
+from. A name only changes when the file does, so docs/_headers can serve
+everything under /assets/ as immutable while index.html is revalidated.
+
+Assets that point at other assets (the web manifest at the icons, diagrams
+at the shared glyph sprite) come after them in ASSETS and have those
+references rewritten before they are hashed. Files in docs/assets/ that are
+no longer in the manifest are removed.
+
+    python3 fingerprint.py [DOCS_DIR]
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+import atomicfile
+
+ASSETS_DIR = 'assets'
+MANIFEST_NAME = 'asset-manifest.json'
+HASH_LENGTH = 10
+
+# Relative to the docs directory, leaves first
+ASSETS = [
+    'favicon.ico',
+    'apple-touch-icon.png',
+    'icon-192.png',
+    'icon-512.png',
+    'icon-maskable-512.png',
+    'thesis.pdf',
+    'diagrams/glyphs.svg',
+    'diagrams/diagram_*.svg',
+    'style.css',
+    'manifest.json',
+]
+
+# Files whose references to other assets are rewritten
+TEXT_EXTENSIONS = ('.css', '.json', '.svg')
+
+# A relative URL in an attribute, url() or JSON string
+REF_RE = re.compile(r'''(?<=["'(])([^"'()#?:]+)(?=[#?"')])''')
+
+def hashed_name(path, data):
+    root, ext = os.path.splitext(path)
+    return f'{root}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}'
+
+def source_files(docs_dir):
+    """Existing assets in ASSETS order, relative to docs_dir"""
+    files = []
+    for pattern in ASSETS:
+        matches = glob.glob(os.path.join(docs_dir, pattern))
+        files += sorted(os.path.relpath(path, docs_dir) for path in matches)
+    return [path.replace(os.sep, '/') for path in files]
+
+def rewrite_refs(text, path, manifest):
+    """Point references in the asset at path to the hashed copies, relative
+    to where the hashed copy of path will live"""
+    src_dir = os.path.dirname(path)
+    dest_dir = os.path.dirname(os.path.join(ASSETS_DIR, path))
+
+    def ref(match):
+        target = os.path.normpath(os.path.join(src_dir, match.group(1))).replace(os.sep, '/')
+        if target not in manifest:
+            return match.group(0)
+        return os.path.relpath(manifest[target], dest_dir).replace(os.sep, '/')
+    return REF_RE.sub(ref, text)
+
+def write_if_missing(path, data):
+    if not os.path.exists(path):
+        atomicfile.write_bytes(path, data)
+
+def fingerprint(docs_dir='docs'):
+    """Write the hashed copies and asset-manifest.json; returns the manifest"""
+    manifest = {}
+    for path in source_files(docs_dir):
+        with open(os.path.join(docs_dir, path), 'rb') as f:
+            data = f.read()
+        if path.endswith(TEXT_EXTENSIONS):
+            data = rewrite_refs(data.decode('utf-8'), path, manifest).encode('utf-8')
+        manifest[path] = hashed_name(os.path.join(ASSETS_DIR, path), data).replace(os.sep, '/')
+        write_if_missing(os.path.join(docs_dir, manifest[path]), data)
+
+    # Copies from earlier builds (and their compress.py variants)
+    current = {os.path.normpath(os.path.join(docs_dir, name)) for name in manifest.values()}
+    for root, _, files in os.walk(os.path.join(docs_dir, ASSETS_DIR)):
+        for name in files:
+            path = os.path.normpath(os.path.join(root, name))
+            source, ext = os.path.splitext(path)
+            if path not in current and not (ext in ('.gz', '.br') and source in current):
+                os.remove(path)
+
+    atomicfile.write_json(os.path.join(docs_dir, MANIFEST_NAME), manifest)
+    return manifest
+
+def read_manifest(docs_dir='docs'):
+    try:
+        with open(os.path.join(docs_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def main():
+    docs_dir = sys.argv[1] if len(sys.argv) > 1 else 'docs'
+    manifest = fingerprint(docs_dir)
+    print(f"✅ Fingerprinted {len(manifest)} assets into {docs_dir}/{ASSETS_DIR}/ "
+          f"(see {docs_dir}/{MANIFEST_NAME})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Post-process the pandoc HTML in one streaming pass
+
+Every change made to the generated page is declared here as a rule:
+
+- Inject(name, anchor, html, where) puts html before or after the first
+  occurrence of anchor. The block is wrapped in <!-- htmlpost:name -->
+  markers; blocks from an earlier run are dropped and injected afresh, so
+  running the post-processor twice gives the same page.
+- Rewrite(name, pattern, replacement) substitutes a regular expression
+  (replacement may be a function, as for re.sub) on every line, injected
+  blocks included; applying it to its own output must change nothing.
+
+Lines are read, transformed and written one at a time, so the page is
+never held in memory or rewritten more than once.
+
+    python3 htmlpost.py INPUT [-o OUTPUT] [--assets docs/asset-manifest.json]
+"""
+import argparse
+import re
+import sys
+
+import atomicfile
+import fingerprint
+
+class Inject:
+    def __init__(self, name, anchor, html, where='before'):
+        self.name = name
+        self.anchor = anchor
+        self.html = html
+        self.where = where
+
+    def begin(self):
+        return f'<!-- htmlpost:{self.name} -->'
+
+    def end(self):
+        return f'<!-- /htmlpost:{self.name} -->'
+
+    def block(self):
+        return f'{self.begin()}\n{self.html}{self.end()}\n'
+
+class Rewrite:
+    def __init__(self, name, pattern, replacement):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.replacement = replacement
+
+MARKER_RE = re.compile(r'<!-- htmlpost:([\w-]+) -->')
+# Local references in href, src and <object data>
+ASSET_REF_RE = re.compile(r'(\b(?:href|src|data)=")([^"#?:]+)(?=["#])')
+
+def default_rules():
+    """Favicon and PWA tags, service worker and PDF link"""
+    return [
+        Inject('head', '</head>', """\
+  <!-- PWA and Favicon -->
+  <link rel="icon" href="favicon.ico" sizes="16x16 32x32 48x48">
+  <link rel="manifest" href="manifest.json">
+  <meta name="theme-color" content="#2c3e50">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <meta name="apple-mobile-web-app-capable" content="yes">
+  <meta name="apple-mobile-web-app-status-bar-style" content="default">
+  <meta name="apple-mobile-web-app-title" content="Fosile Algebrice">
+  <link rel="apple-touch-icon" href="apple-touch-icon.png">
+"""),
+        Inject('service-worker', '</body>', """\
+  <script>
+    if ("serviceWorker" in navigator) {
+      navigator.serviceWorker.register("/sw.js").then(registration => {
+        console.log("Service Worker registered:", registration);
+      }).catch(error => {
+        console.log("Service Worker registration failed:", error);
+      });
+    }
+  </script>
+"""),
+        Inject('pdf-link', '</header>', """\
+<div style="text-align: center; margin: 2em 0; padding: 1em; background-color: #f0f0f0; border-radius: 8px;">
+  <a href="thesis.pdf" download="thesis.pdf" style="display: inline-block; padding: 0.75em 1.5em; background-color: #2c3e50; color: white; text-decoration: none; border-radius: 4px; font-weight: bold; transition: background-color 0.3s;">
+    📥 Descarcă PDF (Download PDF)
+  </a>
+</div>
+""", where='after'),
+    ]
+
+def asset_rules(manifest):
+    """Point references to fingerprinted assets (see fingerprint.py) at the
+    hashed copies; the pages must sit in the docs directory itself"""
+    def ref(match):
+        return match.group(1) + manifest.get(match.group(2), match.group(2))
+    return [Rewrite('assets', ASSET_REF_RE, ref)]
+
+def strip_blocks(line, skipping, names):
+    """Drop the blocks of the named rules (which may span lines) from line;
+    returns (rest of the line, name of the block still open or None)"""
+    kept = ''
+    while line:
+        if skipping:
+            end = f'<!-- /htmlpost:{skipping} -->'
+            i = line.find(end)
+            if i < 0:
+                return kept, skipping
+            line = line[i + len(end):]
+            if line.startswith('\n'):
+                line = line[1:]
+            skipping = None
+        else:
+            m = MARKER_RE.search(line)
+            if not m:
+                return kept + line, None
+            if m.group(1) not in names:
+                kept += line[:m.end()]
+                line = line[m.end():]
+                continue
+            kept += line[:m.start()]
+            line = line[m.start():]
+            skipping = m.group(1)
+    return kept, skipping
+
+def inject(line, rule):
+    """line with rule's block at its anchor, or None if the anchor is not in it"""
+    i = line.find(rule.anchor)
+    if i < 0:
+        return None
+    if rule.where == 'after':
+        i += len(rule.anchor)
+        head, tail = line[:i], line[i:]
+        return head + '\n' + rule.block() + tail.lstrip('\n')
+    head, tail = line[:i], line[i:]
+    if head.strip():
+        head += '\n'
+    return head + rule.block() + tail
+
+def process_lines(lines, rules):
+    """Yield the transformed lines, warning about anchors that never appear"""
+    injects = [rule for rule in rules if isinstance(rule, Inject)]
+    rewrites = [rule for rule in rules if isinstance(rule, Rewrite)]
+    names = {rule.name for rule in injects}
+    pending = list(injects)
+    skipping = None
+    for line in lines:
+        line, skipping = strip_blocks(line, skipping, names)
+        if not line:
+            continue
+        for rule in list(pending):
+            injected = inject(line, rule)
+            if injected is not None:
+                line = injected
+                pending.remove(rule)
+        for rule in rewrites:
+            line = rule.pattern.sub(rule.replacement, line)
+        yield line
+    for rule in pending:
+        print(f"⚠️  Warning: {rule.anchor} not found, {rule.name} not injected", file=sys.stderr)
+
+def process(src, dest, rules):
+    """Stream src through the rules into dest (which may be src)"""
+    with atomicfile.replacing(dest) as tmp:
+        with open(src, 'r', encoding='utf-8') as fin, open(tmp, 'w', encoding='utf-8') as fout:
+            fout.writelines(process_lines(fin, rules))
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the HTML injection rules to a pandoc page")
+    parser.add_argument('input')
+    parser.add_argument('-o', '--output', help="default: rewrite INPUT in place")
+    parser.add_argument('--assets', metavar='DOCS_DIR',
+                        help=f"also rewrite asset references from DOCS_DIR/{fingerprint.MANIFEST_NAME}")
+    args = parser.parse_args()
+    rules = default_rules()
+    if args.assets:
+        rules += asset_rules(fingerprint.read_manifest(args.assets))
+    process(args.input, args.output or args.input, rules)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Render the PWA icon options described in iconspecs.py
+
+One engine for every option (it replaces generate-pwa-icons.py, -v2.py
+and -v3.py):
+
+- fonts are looked up once per style, in the macOS, Linux and Windows
+  locations, and each font is loaded once per size and process
+- options render in parallel on a process pool
+- an option is skipped when its spec, the font files it uses, Pillow and
+  this file are unchanged since docs/pwa-icon-optionN.png was written; the
+  keys are kept in .cache/icons.json
+
+    python3 icons.py [N ...] [--jobs N] [--force] [--list]
+
+--app-icons renders the chosen option (iconspecs.MASTER, or --master N)
+once at MASTER_SIZE and downsamples it into every icon the site uses:
+favicon.ico (16, 32 and 48 px), the apple-touch icon, the 192 and 512 px
+manifest icons and a maskable variant whose content is shrunk into the
+safe zone. The icon entries of docs/manifest.json are rewritten to match.
+
+    python3 icons.py --app-icons [--master N] [--force]
+"""
+import argparse
+import functools
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import PIL
+    from PIL import Image, ImageChops, ImageDraw, ImageFont
+except ImportError:
+    PIL = None
+
+import atomicfile
+import iconspecs
+
+STATE_FILE = '.cache/icons.json'
+OUTPUT = 'docs/pwa-icon-option{}.png'
+
+# --app-icons: rendered once this large, then downsampled
+MASTER_SIZE = 2048
+DOCS_DIR = 'docs'
+MANIFEST = 'manifest.json'
+FAVICON = ('favicon.ico', [16, 32, 48])
+# (file, size, purpose in manifest.json or None when not listed there)
+APP_ICONS = [
+    ('icon-192.png', 192, 'any'),
+    ('icon-512.png', 512, 'any'),
+    ('icon-maskable-512.png', 512, 'maskable'),
+    ('apple-touch-icon.png', 180, None),
+]
+# Maskable icons are cropped to as little as a circle of this diameter
+# (relative to the icon), so their content has to fit inside it
+SAFE_ZONE = 0.8
+
+# First existing file wins
+FONTS = {
+    'serif': [
+        '/System/Library/Fonts/Supplemental/Times New Roman.ttf',
+        '/System/Library/Fonts/Supplemental/Georgia.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf',
+        '/usr/share/fonts/dejavu/DejaVuSerif.ttf',
+        'C:/Windows/Fonts/times.ttf',
+    ],
+    'serif-bold': [
+        '/System/Library/Fonts/Supplemental/Times New Roman Bold.ttf',
+        '/System/Library/Fonts/Supplemental/Georgia Bold.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSerif-Bold.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSerif-Bold.ttf',
+        '/usr/share/fonts/dejavu/DejaVuSerif-Bold.ttf',
+        'C:/Windows/Fonts/timesbd.ttf',
+    ],
+}
+
+def resolve_fonts():
+    """{style: font file or None}"""
+    return {style: next((path for path in paths if os.path.isfile(path)), None)
+            for style, paths in FONTS.items()}
+
+@functools.lru_cache(maxsize=None)
+def load_font(path, size):
+    if path:
+        return ImageFont.truetype(path, size)
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+def flat(xy, scale):
+    """Coordinates as a flat list, scaled"""
+    values = []
+    for value in xy:
+        values.extend(value if isinstance(value, (list, tuple)) else [value])
+    return [value * scale for value in values]
+
+def draw_shape(img, draw, shape, fonts, scale):
+    xy = flat(shape['xy'], scale)
+    style = {key: shape[key] for key in ('fill', 'outline') if key in shape}
+    if 'width' in shape:
+        style['width'] = max(1, round(shape['width'] * scale))
+
+    if shape['shape'] == 'text':
+        font = load_font(fonts[shape['font']], max(1, round(shape['size'] * scale)))
+        anchor = shape.get('anchor', 'mm')
+        if not shape.get('angle'):
+            draw.text(tuple(xy), shape['text'], fill=shape['fill'], font=font, anchor=anchor)
+            return
+        # Draw on a transparent layer and turn it around the anchor point
+        layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).text(tuple(xy), shape['text'], fill=shape['fill'], font=font, anchor=anchor)
+        layer = layer.rotate(shape['angle'], center=tuple(xy), resample=Image.BICUBIC)
+        img.paste(layer, (0, 0), layer)
+    elif shape['shape'] == 'arc':
+        draw.arc(xy, shape['start'], shape['end'], **style)
+    else:
+        getattr(draw, shape['shape'])(xy, **style)
+
+def render(spec, fonts, size=iconspecs.SIZE):
+    """The option as a size x size RGB image"""
+    img = Image.new('RGB', (size, size), color=spec['background'])
+    draw = ImageDraw.Draw(img)
+    scale = size / iconspecs.SIZE
+    for shape in spec['shapes']:
+        draw_shape(img, draw, shape, fonts, scale)
+    return img
+
+@functools.lru_cache(maxsize=None)
+def engine_digest():
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def spec_key(spec, fonts, size=iconspecs.SIZE):
+    """Changes with the spec, the font files it uses, Pillow or this engine"""
+    h = hashlib.sha256()
+    h.update(json.dumps(spec, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    for style in sorted({shape['font'] for shape in spec['shapes'] if shape['shape'] == 'text'}):
+        path = fonts.get(style)
+        st = os.stat(path) if path else None
+        h.update(f'\0{style}={path}:{st and st.st_size}:{st and st.st_mtime_ns}'.encode('utf-8'))
+    h.update(f'\0{PIL.__version__}\0{size}\0{engine_digest()}'.encode('utf-8'))
+    return h.hexdigest()
+
+def save_png(img, path):
+    with atomicfile.replacing(path) as tmp:
+        img.save(tmp, 'PNG', optimize=True)
+
+def render_option(number, fonts, path):
+    save_png(render(iconspecs.OPTIONS[number], fonts), path)
+    return number
+
+def downsample(img, size):
+    return img.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+def maskable(img, background):
+    """img shrunk until everything that differs from the background lies in
+    the safe-zone circle, centred on a full-bleed background"""
+    size = img.width
+    box = ImageChops.difference(img, Image.new('RGB', img.size, background)).getbbox()
+    if not box:
+        return img
+    centre = size / 2
+    reach = max(math.hypot(x - centre, y - centre) for x in box[::2] for y in box[1::2])
+    scale = min(1.0, SAFE_ZONE * size / 2 / reach)
+    inner = round(size * scale)
+    canvas = Image.new('RGB', img.size, background)
+    canvas.paste(downsample(img, inner), ((size - inner) // 2, (size - inner) // 2))
+    return canvas
+
+def manifest_icons():
+    return [{'src': name, 'sizes': f'{size}x{size}', 'type': 'image/png', 'purpose': purpose}
+            for name, size, purpose in APP_ICONS if purpose]
+
+def write_manifest_icons(docs_dir):
+    """Point the icons of the web manifest at what --app-icons produced"""
+    path = os.path.join(docs_dir, MANIFEST)
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('icons') == manifest_icons():
+        return False
+    manifest['icons'] = manifest_icons()
+    atomicfile.write_text(path, json.dumps(manifest, indent=2, ensure_ascii=False) + '\n')
+    return True
+
+def app_icon_files(docs_dir):
+    return [os.path.join(docs_dir, name) for name in [FAVICON[0]] + [icon[0] for icon in APP_ICONS]]
+
+def render_app_icons(number, fonts, docs_dir):
+    """Render option number once and write every derived icon"""
+    spec = iconspecs.OPTIONS[number]
+    master = render(spec, fonts, MASTER_SIZE)
+    for name, size, purpose in APP_ICONS:
+        source = maskable(master, spec['background']) if purpose == 'maskable' else master
+        save_png(downsample(source, size), os.path.join(docs_dir, name))
+
+    # One .ico holding every favicon size, each downsampled from the master
+    name, sizes = FAVICON
+    frames = [downsample(master, size) for size in sizes]
+    with atomicfile.replacing(os.path.join(docs_dir, name)) as tmp:
+        frames[-1].save(tmp, 'ICO', sizes=[(size, size) for size in sizes], append_images=frames[:-1])
+
+def app_icons(number, fonts, force, docs_dir=DOCS_DIR):
+    """--app-icons; returns False when everything was up to date"""
+    state = atomicfile.read_json(STATE_FILE)
+    key = hashlib.sha256(json.dumps([spec_key(iconspecs.OPTIONS[number], fonts, MASTER_SIZE),
+                                     FAVICON, APP_ICONS, SAFE_ZONE]).encode('utf-8')).hexdigest()
+    state_key = os.path.abspath(os.path.join(docs_dir, 'app-icons'))
+    rendered = False
+    if force or state.get(state_key) != key or not all(map(os.path.exists, app_icon_files(docs_dir))):
+        render_app_icons(number, fonts, docs_dir)
+        state[state_key] = key
+        atomicfile.write_json(STATE_FILE, state)
+        rendered = True
+    return write_manifest_icons(docs_dir) or rendered
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the PWA icon options (512x512)")
+    parser.add_argument('options', nargs='*', type=int, help="option numbers (default: all)")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="options rendered in parallel (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="render even unchanged options")
+    parser.add_argument('--list', action='store_true', help="list the options and exit")
+    parser.add_argument('--app-icons', action='store_true',
+                        help="make the site's favicon, app icons and manifest entries from one option")
+    parser.add_argument('--master', type=int, default=iconspecs.MASTER,
+                        help="option used by --app-icons (default: %(default)s)")
+    args = parser.parse_args()
+
+    numbers = [args.master] if args.app_icons else args.options or sorted(iconspecs.OPTIONS)
+    unknown = [n for n in numbers if n not in iconspecs.OPTIONS]
+    if unknown:
+        print(f"❌ Error: no option {', '.join(map(str, unknown))} in iconspecs.py")
+        sys.exit(1)
+    if args.list:
+        for n in numbers:
+            print(f"{n:>3}. {iconspecs.OPTIONS[n]['title']}")
+        return
+    if PIL is None:
+        print("⚠️  PIL/Pillow not available")
+        print("   Install with: pip install Pillow")
+        sys.exit(1)
+
+    fonts = resolve_fonts()
+    for style, path in fonts.items():
+        if not path:
+            print(f"⚠️  Warning: no TrueType font for {style}, using Pillow's default font")
+
+    if args.app_icons:
+        if not app_icons(args.master, fonts, args.force):
+            print(f"⏭️  App icons unchanged (option {args.master})")
+            return
+        print(f"✅ App icons from option {args.master}: {iconspecs.OPTIONS[args.master]['title']}")
+        for path in app_icon_files(DOCS_DIR):
+            print(f"   {path}")
+        print(f"✅ Updated the icons in {DOCS_DIR}/{MANIFEST}")
+        return
+
+    state = atomicfile.read_json(STATE_FILE)
+    keys, pending = {}, []
+    for n in numbers:
+        path = OUTPUT.format(n)
+        keys[n] = spec_key(iconspecs.OPTIONS[n], fonts)
+        if args.force or state.get(os.path.abspath(path)) != keys[n] or not os.path.exists(path):
+            pending.append(n)
+    print(f"Rendering {len(pending)} icon options ({len(numbers) - len(pending)} unchanged)...\n")
+
+    os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
+    paths = [OUTPUT.format(n) for n in pending]
+    if args.jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as pool:
+            done = pool.map(render_option, pending, [fonts] * len(pending), paths)
+            for n in done:
+                print(f"✅ Option {n}: {iconspecs.OPTIONS[n]['title']}")
+    else:
+        for n, path in zip(pending, paths):
+            render_option(n, fonts, path)
+            print(f"✅ Option {n}: {iconspecs.OPTIONS[n]['title']}")
+    for n in pending:
+        state[os.path.abspath(OUTPUT.format(n))] = keys[n]
+    atomicfile.write_json(STATE_FILE, state)
+
+    if pending:
+        print("\nPreview them (docs/pwa-icons-preview.html) and choose your favorite, then set")
+        print("MASTER in iconspecs.py and run: python3 icons.py --app-icons")
+
+if __name__ == '__main__':
+    main()
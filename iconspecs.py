@@ -0,0 +1,391 @@
+"""The PWA icon options, as data for icons.py
+
+Each option has a title, a background colour and a list of shapes drawn in
+order on a SIZE x SIZE canvas. A shape names the ImageDraw method and its
+arguments ('xy', 'fill', 'outline', 'width', 'start'/'end' for arcs);
+text shapes give a font style from icons.FONTS and a size in pixels, and
+may be rotated by 'angle' degrees around their anchor point.
+"""
+
+SIZE = 512
+C = SIZE // 2
+
+# The option the site's icons are made from (python3 icons.py --app-icons)
+MASTER = 27
+
+def text(xy, string, fill, size, font='serif-bold', **extra):
+    return dict(shape='text', xy=xy, text=string, fill=fill, font=font, size=size, **extra)
+
+def label(string, y, fill='#95a5a6', size=60):
+    """The small caption under options 11-30"""
+    return text((C, y), string, fill, size, font='serif')
+
+def circle(x, y, r, **style):
+    return dict(shape='ellipse', xy=[x - r, y - r, x + r, y + r], **style)
+
+def line(xy, fill, width):
+    return dict(shape='line', xy=xy, fill=fill, width=width)
+
+def arc(xy, start, end, fill, width):
+    return dict(shape='arc', xy=xy, start=start, end=end, fill=fill, width=width)
+
+def polygon(xy, **style):
+    return dict(shape='polygon', xy=xy, **style)
+
+def rectangle(xy, **style):
+    return dict(shape='rectangle', xy=xy, **style)
+
+def corners(strings, fill, size, inset=100, font='serif'):
+    """One string in each corner: top left, top right, bottom left, bottom right"""
+    spots = [(inset, inset), (SIZE - inset, inset), (inset, SIZE - inset), (SIZE - inset, SIZE - inset)]
+    return [text(xy, string, fill, size, font=font) for xy, string in zip(spots, strings)]
+
+# Options 1-10: the thesis' own notation
+OPTIONS = {
+    1: {
+        'title': 'Large ℤₙ with gradient',
+        'background': '#1a1a2e',
+        'shapes': [circle(C, C, C - i * 40, fill=f'#{30 + i * 5:02x}{50 + i * 10:02x}{70 + i * 15:02x}')
+                   for i in range(5)] + [
+            text((C, C + 20), 'ℤ', '#ECF0F1', 320),
+            text((400, 360), 'n', '#3498DB', 100, font='serif'),
+        ],
+    },
+    2: {
+        'title': 'ℤ̂ₙ with prominent hat',
+        'background': '#2C3E50',
+        'shapes': [
+            dict(shape='ellipse', xy=[50, 50, SIZE - 50, SIZE - 50], outline='#34495E', width=8),
+            line([120, 120, C, 60, SIZE - 120, 120], '#E74C3C', 18),
+            text((C, C + 50), 'ℤ', '#ECF0F1', 300),
+            text((390, 370), 'n', '#16C79A', 90, font='serif'),
+        ],
+    },
+    3: {
+        'title': 'Module diagram',
+        'background': '#1e2761',
+        'shapes': [circle(x, y, 50, fill='#f9a826', outline='#f39c12', width=6)
+                   for x, y in [(128, 128), (384, 128), (256, 384)]] + [
+            line([168, 128, 344, 128], '#5d5fef', 12),
+            line([148, 168, 226, 344], '#5d5fef', 12),
+            line([364, 168, 286, 344], '#5d5fef', 12),
+            text((C, C), 'M', '#ffffff', 120),
+        ],
+    },
+    4: {
+        'title': 'Ring with ⊕',
+        'background': '#0f3460',
+        'shapes': [
+            dict(shape='ellipse', xy=[80, 80, SIZE - 80, SIZE - 80], outline='#ea5455', width=20),
+            line([C, 180, C, SIZE - 180], '#f07b3f', 25),
+            line([180, C, SIZE - 180, C], '#f07b3f', 25),
+        ] + corners(['M1', 'M2', 'M3', 'M4'], '#16c79a', 60, inset=140),
+    },
+    5: {
+        'title': 'Dimension D with arrows',
+        'background': '#34495e',
+        'shapes': [
+            text((C, C), 'D', '#ecf0f1', 350),
+            text((380, 380), 'u', '#3498db', 80, font='serif'),
+            line([80, 100, SIZE - 120, 100], '#e74c3c', 15),
+            polygon([(SIZE - 120, 80), (SIZE - 120, 120), (SIZE - 80, 100)], fill='#e74c3c'),
+            line([SIZE - 80, SIZE - 100, 120, SIZE - 100], '#2ecc71', 15),
+            polygon([(120, SIZE - 120), (120, SIZE - 80), (80, SIZE - 100)], fill='#2ecc71'),
+        ],
+    },
+    6: {
+        'title': 'Nested ring structure',
+        'background': '#2d4059',
+        'shapes': [circle(C, C, 200 - i * 40, outline='#ea5455', width=8) for i in range(4)] + [
+            text((C, C), 'R', '#f9f9f9', 200),
+        ] + corners(['∈', '⊆', '⊕', '∩'], '#f07b3f', 70),
+    },
+    7: {
+        'title': 'Infinity dimension',
+        'background': '#0f3460',
+        'shapes': [
+            arc([60, C - 120, 220, C + 120], 90, 270, '#16c79a', 35),
+            arc([SIZE - 220, C - 120, SIZE - 60, C + 120], 270, 90, '#16c79a', 35),
+            line([220, C - 80, SIZE - 220, C + 80], '#16c79a', 35),
+            line([220, C + 80, SIZE - 220, C - 80], '#16c79a', 35),
+            text((C, SIZE - 100), 'dim', '#f9a826', 100),
+        ],
+    },
+    8: {
+        'title': 'Commutative square',
+        'background': '#1a1a2e',
+        'shapes': [circle(x, y, 35, fill='#3498db', outline='#2980b9', width=4)
+                   for x, y in [(140, 140), (372, 140), (372, 372), (140, 372)]] + [
+            line([170, 140, 342, 140], '#e74c3c', 12),
+            line([372, 170, 372, 342], '#e74c3c', 12),
+            line([170, 372, 342, 372], '#e74c3c', 12),
+            line([140, 170, 140, 342], '#e74c3c', 12),
+        ] + [circle(int(140 + 232 * i / 7), int(140 + 232 * i / 7), 8, fill='#f39c12') for i in range(8)] + [
+            text((C, C), '□', '#ecf0f1', 100),
+        ],
+    },
+    9: {
+        'title': 'Matrix brackets',
+        'background': '#2c3e50',
+        'shapes': [line(xy, '#f39c12', 25) for xy in [
+            [130, 80, 80, 80], [80, 80, 80, 432], [80, 432, 130, 432],
+            [382, 80, 432, 80], [432, 80, 432, 432], [432, 432, 382, 432],
+        ]] + [text(xy, letter, '#ecf0f1', 150)
+              for xy, letter in zip([(170, 170), (341, 170), (170, 341), (341, 341)], 'MNPQ')],
+    },
+    10: {
+        'title': 'Uniform dimension badge',
+        'background': '#16202c',
+        'shapes': [
+            polygon([(C, 50), (432, 170), (432, 341), (C, 462), (80, 341), (80, 170)],
+                    fill='#34495e', outline='#2c3e50', width=8),
+            polygon([(C, 70), (432, 190), (432, 361), (C, 482), (80, 361), (80, 170)],
+                    fill='#2c3e50', outline='#34495e', width=4),
+            text((C, C - 30), 'U', '#3498db', 200),
+            text((C, C + 120), 'dim', '#e74c3c', 80),
+        ],
+    },
+}
+
+# Options 11-20: algebraic structures
+OPTIONS.update({
+    11: {
+        'title': 'N ⊆ M submodule',
+        'background': '#1a1a2e',
+        'shapes': [
+            arc([100, 140, SIZE - 100, SIZE - 140], 90, 270, '#3498db', 35),
+            line([150, SIZE - 140, SIZE - 150, SIZE - 140], '#3498db', 35),
+            text((170, 200), 'N', '#e74c3c', 140),
+            text((SIZE - 170, 200), 'M', '#2ecc71', 180),
+            label('submodule', SIZE - 80),
+        ],
+    },
+    12: {
+        'title': 'I ◁ R ideal',
+        'background': '#2c3e50',
+        'shapes': [
+            polygon([(C + 80, C - 100), (C + 80, C + 100), (C - 120, C)], outline='#f39c12', width=30),
+            line([C - 120, C - 120, C - 120, C + 120], '#f39c12', 30),
+            text((140, 120), 'I', '#e67e22', 150),
+            text((SIZE - 120, 120), 'R', '#9b59b6', 200),
+            label('ideal', SIZE - 80, fill='#bdc3c7'),
+        ],
+    },
+    13: {
+        'title': 'R/I quotient',
+        'background': '#0f3460',
+        'shapes': [
+            text((C, 150), 'R', '#ecf0f1', 220),
+            line([80, C, SIZE - 80, C], '#e74c3c', 25),
+            text((C, SIZE - 150), 'I', '#3498db', 180),
+            text((100, 100), '~', '#f39c12', 70, font='serif'),
+            text((SIZE - 100, 100), '~', '#f39c12', 70, font='serif'),
+            text((100, SIZE - 100), '≡', '#16c79a', 70, font='serif'),
+            text((SIZE - 100, SIZE - 100), '≡', '#16c79a', 70, font='serif'),
+        ],
+    },
+    14: {
+        'title': 'φ: R → S homomorphism',
+        'background': '#16202c',
+        'shapes': [
+            text((130, C), 'R', '#3498db', 200),
+            text((SIZE - 130, C), 'S', '#2ecc71', 200),
+            line([210, C, SIZE - 210, C], '#e74c3c', 20),
+            polygon([(SIZE - 210, C - 25), (SIZE - 210, C + 25), (SIZE - 170, C)], fill='#e74c3c'),
+            text((C, C - 100), 'φ', '#f39c12', 140),
+            label('homomorphism', SIZE - 70, size=55),
+        ],
+    },
+    15: {
+        'title': 'R ≅ S isomorphism',
+        'background': '#1e2761',
+        'shapes': [
+            text((120, C), 'R', '#e74c3c', 220),
+            text((SIZE - 120, C), 'S', '#e74c3c', 220),
+        ] + [arc([C + dx, y - 15, C + dx + 40, y + 15], start, end, '#16c79a', 12)
+             for y in (C - 50, C + 50)
+             for dx, start, end in [(-80, 180, 0), (-40, 0, 180), (0, 180, 0), (40, 0, 180)]] + [
+            line([C - 80, C, C + 80, C], '#16c79a', 12),
+            label('isomorphism', SIZE - 70, size=55),
+        ],
+    },
+    16: {
+        'title': 'M₁⊕M₂⊕M₃⊕M₄ direct sum',
+        'background': '#2d4059',
+        'shapes': [
+            dict(shape='ellipse', xy=[100, 100, SIZE - 100, SIZE - 100], outline='#ea5455', width=18),
+            line([C, 160, C, SIZE - 160], '#f9a826', 30),
+            line([160, C, SIZE - 160, C], '#f9a826', 30),
+        ] + corners(['M'] * 4, '#3498db', 110, inset=110, font='serif-bold') + [
+            label('direct sum', SIZE - 60, fill='#bdc3c7'),
+        ],
+    },
+    17: {
+        'title': 'M ⊗ N tensor product',
+        'background': '#0f3460',
+        'shapes': [
+            dict(shape='ellipse', xy=[100, 100, SIZE - 100, SIZE - 100], outline='#16c79a', width=18),
+            line([180, 180, SIZE - 180, SIZE - 180], '#f39c12', 30),
+            line([180, SIZE - 180, SIZE - 180, 180], '#f39c12', 30),
+            text((150, 140), 'M', '#e74c3c', 140),
+            text((SIZE - 150, 140), 'N', '#3498db', 140),
+            label('tensor product', SIZE - 60),
+        ],
+    },
+    18: {
+        'title': 'ker(φ) → 0 kernel',
+        'background': '#1a1a2e',
+        'shapes': [
+            text((C, 120), 'ker', '#e74c3c', 140),
+            line([C, 200, C, 340], '#3498db', 20),
+            polygon([(C - 25, 340), (C + 25, 340), (C, 380)], fill='#3498db'),
+            text((C, SIZE - 90), '0', '#2ecc71', 180),
+            dict(shape='ellipse', xy=[C - 60, SIZE - 150, C + 60, SIZE - 30], outline='#f39c12', width=8),
+        ],
+    },
+    19: {
+        'title': '0→A→B→C→0 exact sequence',
+        'background': '#2c3e50',
+        'shapes': [text((C, y), string, fill, 120) for y, string, fill in zip(
+            [80, 160, 280, 400, 480], '0ABC0', ['#2ecc71', '#e74c3c', '#3498db', '#f39c12', '#2ecc71'])
+        ] + [shape for y, next_y in [(80, 160), (160, 280), (280, 400), (400, 480)] for shape in [
+            line([C, y + 40, C, next_y - 40], '#16c79a', 15),
+            polygon([(C - 20, next_y - 40), (C + 20, next_y - 40), (C, next_y - 10)], fill='#16c79a'),
+        ]] + [
+            text((SIZE - 80, C), 'exact', '#95a5a6', 55, font='serif', angle=90),
+        ],
+    },
+    20: {
+        'title': '⟨g⟩ generator',
+        'background': '#16202c',
+        'shapes': [line(xy, '#3498db', 25) for xy in [
+            [100, C - 150, 160, C], [160, C, 100, C + 150],
+            [SIZE - 100, C - 150, SIZE - 160, C], [SIZE - 160, C, SIZE - 100, C + 150],
+        ]] + [
+            text((C, C), 'g', '#e74c3c', 280),
+            label('generator', SIZE - 70),
+        ],
+    },
+})
+
+# Options 21-30: symbols anyone reads as mathematics
+OPTIONS.update({
+    21: {
+        'title': 'π (Pi)',
+        'background': '#2c3e50',
+        'shapes': [circle(C, C, C - i * 35, fill=f'#{30 + i * 15:02x}{50 + i * 10:02x}{70 + i * 15:02x}')
+                   for i in range(6)] + [
+            text((C, C + 30), 'π', '#ecf0f1', 400),
+            label('mathematics', SIZE - 60, size=50),
+        ],
+    },
+    22: {
+        'title': 'Σ (Sigma summation)',
+        'background': '#16202c',
+        'shapes': [
+            dict(shape='ellipse', xy=[60, 60, SIZE - 60, SIZE - 60], fill='#34495e', outline='#2ecc71', width=12),
+            text((C, C + 20), 'Σ', '#2ecc71', 380),
+            text((SIZE - 140, SIZE - 120), '∞', '#e74c3c', 70, font='serif'),
+            text((SIZE - 140, 120), 'n=1', '#3498db', 70, font='serif'),
+        ],
+    },
+    23: {
+        'title': '∞ (Infinity)',
+        'background': '#1a1a2e',
+        'shapes': [shape for i in range(4) for shape in [
+            arc([60 + i * 10, C - 140 + i * 10, 240 - i * 10, C + 140 - i * 10], 90, 270, '#e74c3c', 40 - i * 8),
+            arc([SIZE - 240 + i * 10, C - 140 + i * 10, SIZE - 60 - i * 10, C + 140 - i * 10], 270, 90,
+                '#3498db', 40 - i * 8),
+            line([240 - i * 10, C - 90, SIZE - 240 + i * 10, C + 90], '#f39c12', 40 - i * 8),
+            line([240 - i * 10, C + 90, SIZE - 240 + i * 10, C - 90], '#f39c12', 40 - i * 8),
+        ]] + [
+            text((C, SIZE - 70), 'INFINITE', '#16c79a', 60),
+        ],
+    },
+    24: {
+        'title': '√(x² + y²)',
+        'background': '#0f3460',
+        'shapes': [
+            line([100, C, 140, C + 60], '#16c79a', 30),
+            line([140, C + 60, 180, 100], '#16c79a', 30),
+            line([180, 100, SIZE - 80, 100], '#16c79a', 30),
+            text((C + 20, C + 40), 'x² + y²', '#ecf0f1', 150),
+        ],
+    },
+    25: {
+        'title': 'x² + y = z (blackboard)',
+        'background': '#2d4059',
+        'shapes': [
+            rectangle([40, 40, SIZE - 40, SIZE - 40], fill='#1e2f3e', outline='#95a5a6', width=8),
+            text((C, 150), 'x² + y = z', '#ecf0f1', 140),
+            text((C, 320), 'a³ + b³ = c³', '#3498db', 140),
+            text((100, SIZE - 100), 'π', '#e74c3c', 100, font='serif'),
+            text((SIZE - 100, SIZE - 100), '∞', '#f39c12', 100, font='serif'),
+        ],
+    },
+    26: {
+        'title': '∫ (Integral)',
+        'background': '#34495e',
+        'shapes': [
+            arc([C - 60, 60, C + 60, 180], 180, 0, '#3498db', 35),
+            line([C, 120, C, SIZE - 120], '#3498db', 35),
+            arc([C - 60, SIZE - 180, C + 60, SIZE - 60], 0, 180, '#3498db', 35),
+            text((C + 140, C), 'f(x)dx', '#ecf0f1', 120),
+            text((C + 90, 100), '∞', '#e74c3c', 70, font='serif'),
+            text((C + 90, SIZE - 100), '0', '#2ecc71', 70, font='serif'),
+        ],
+    },
+    27: {
+        'title': '+−×÷ (Operations)',
+        'background': '#1a1a2e',
+        'shapes': [text(xy, op, fill, 200) for xy, op, fill in [
+            ((SIZE // 4, SIZE // 4), '+', '#e74c3c'),
+            ((3 * SIZE // 4, SIZE // 4), '−', '#3498db'),
+            ((SIZE // 4, 3 * SIZE // 4), '×', '#2ecc71'),
+            ((3 * SIZE // 4, 3 * SIZE // 4), '÷', '#f39c12'),
+        ]] + [
+            circle(C, C, 80, fill='#2c3e50', outline='#ecf0f1', width=8),
+            text((C, C), '=', '#ecf0f1', 100),
+        ],
+    },
+    28: {
+        'title': '△○□ (Geometry)',
+        'background': '#16202c',
+        'shapes': [
+            polygon([(C, 100), (140, 220), (SIZE - 140, 220)], fill='#e74c3c', outline='#c0392b', width=6),
+            dict(shape='ellipse', xy=[80, 280, 240, 440], fill='#3498db', outline='#2980b9', width=6),
+            rectangle([SIZE - 240, 280, SIZE - 80, 440], fill='#2ecc71', outline='#27ae60', width=6),
+            text((C, SIZE - 50), 'GEOMETRY', '#ecf0f1', 55, font='serif'),
+        ],
+    },
+    29: {
+        'title': 'Calculator',
+        'background': '#2c3e50',
+        'shapes': [
+            rectangle([60, 60, SIZE - 60, 180], fill='#1a1a2e', outline='#34495e', width=6),
+            text((C, 120), '123.456', '#2ecc71', 80),
+        ] + [shape for y, row in [(250, '789'), (350, '456'), (450, '123')]
+             for x, digit in zip([100, 220, 340], row) for shape in [
+            rectangle([x - 40, y - 40, x + 40, y + 40], fill='#34495e', outline='#7f8c8d', width=4),
+            text((x, y), digit, '#ecf0f1', 90),
+        ]] + [
+            rectangle([SIZE - 140, 310, SIZE - 60, 390], fill='#e74c3c', outline='#c0392b', width=4),
+            text((SIZE - 100, 350), '=', '#ecf0f1', 90),
+        ],
+    },
+    30: {
+        'title': 'y=x² (Graph)',
+        'background': '#0f3460',
+        'shapes': [
+            line([C, 60, C, SIZE - 60], '#ecf0f1', 8),
+            line([60, C, SIZE - 60, C], '#ecf0f1', 8),
+            polygon([(C - 15, 70), (C + 15, 70), (C, 50)], fill='#ecf0f1'),
+            polygon([(SIZE - 70, C - 15), (SIZE - 70, C + 15), (SIZE - 50, C)], fill='#ecf0f1'),
+        ] + [line([C + i * 30, C - i * i * 5, C + (i + 1) * 30, C - (i + 1) * (i + 1) * 5], '#e74c3c', 10)
+             for i in range(-6, 6)] + [
+            text((SIZE - 80, C - 50), 'x', '#3498db', 60),
+            text((C + 50, 70), 'y', '#2ecc71', 60),
+            text((C + 150, 150), 'y=x²', '#f39c12', 80),
+        ],
+    },
+})
@@ -16,6 +16,9 @@ if [ ! -f "docs/index.html" ]; then
 fi
 
 echo "✅ Pre-built website found in docs/"
+
+# Fail the deploy when docs/ grew past the budgets in budget.json
+python3 budget.py docs
 echo "✅ Ready to deploy!"
 echo ""
 echo "================================================"
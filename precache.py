@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Generate docs/sw.js with the build's precache manifest
+
+The service worker source lives in sw-template.js. This fills its
+PRECACHE_MANIFEST with one {url, revision} entry per published file: the
+pages, everything fingerprint.py put in docs/assets/ and the vendored
+MathJax, with a hash of the content as revision. Because the manifest is
+part of sw.js, any content change also changes sw.js, and browsers install
+the new worker, which downloads only the entries whose revision changed.
+
+    python3 precache.py [DOCS_DIR]
+"""
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import atomicfile
+import fingerprint
+
+TEMPLATE = 'sw-template.js'
+PLACEHOLDER = '/* PRECACHE_MANIFEST */ []'
+
+# Relative to the docs directory
+PRECACHE = [
+    'index.html',
+    'complete.html',
+    '[0-9][0-9]-*.html',
+    fingerprint.ASSETS_DIR + '/**/*',
+    'mathjax/**/*',
+]
+
+def revision(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()[:fingerprint.HASH_LENGTH]
+
+def precache_entries(docs_dir='docs'):
+    paths = set()
+    for pattern in PRECACHE:
+        paths.update(path for path in glob.glob(os.path.join(docs_dir, pattern), recursive=True)
+                     if os.path.isfile(path) and atomicfile.TMP_MARKER not in path
+                     and not path.endswith(('.gz', '.br')))
+    entries = []
+    for path in sorted(paths):
+        url = '/' + os.path.relpath(path, docs_dir).replace(os.sep, '/')
+        entries.append({'url': url, 'revision': revision(path)})
+    return entries
+
+def write_service_worker(docs_dir='docs', template=TEMPLATE):
+    """Write docs_dir/sw.js; returns the manifest entries"""
+    with open(template, 'r', encoding='utf-8') as f:
+        source = f.read()
+    entries = precache_entries(docs_dir)
+    manifest = json.dumps(entries, indent=2)
+    atomicfile.write_text(os.path.join(docs_dir, 'sw.js'), source.replace(PLACEHOLDER, manifest))
+    return entries
+
+def main():
+    docs_dir = sys.argv[1] if len(sys.argv) > 1 else 'docs'
+    entries = write_service_worker(docs_dir)
+    print(f"✅ Service worker precaches {len(entries)} files: {docs_dir}/sw.js")
+
+if __name__ == '__main__':
+    main()
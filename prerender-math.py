@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Render the page's TeX formulas to inline SVG at build time
+
+pandoc leaves every formula as <span class="math inline">\\(...\\)</span>
+for MathJax to typeset in the browser. This renders each distinct formula
+once with pdflatex + dvisvgm, caches the SVG by a hash of the formula,
+and swaps it into the page. Formulas TeX reports errors for are left to
+MathJax (and remembered, so they are not retried until the tools change);
+when every formula renders, the MathJax <script> is removed.
+
+    python3 prerender-math.py [docs/index.html ...]
+"""
+import argparse
+import hashlib
+import html
+import os
+import re
+import subprocess
+import tempfile
+
+import atomicfile
+import buildtrace
+import svgopt
+import toolchain
+
+CACHE_DIR = '.cache/math'
+# Part of every cache key; bump it when the way formulas are typeset changes
+CACHE_FORMAT = 2
+
+# Font size of the TeX document; SVG sizes are converted to em against it
+# so formulas scale with the surrounding text
+TEX_FONT_PT = 10.0
+
+MATH_PREAMBLE = r"""\documentclass{article}
+\usepackage{amsmath,amssymb}
+\usepackage[active,tightpage,dvips]{preview}
+\begin{document}
+"""
+
+MATH_END = r"""
+\end{document}
+"""
+
+# Only spans still holding TeX, so pages can be processed again
+MATH_RE = re.compile(r'<span\s+class="math (inline|display)">(\\[(\[].*?)</span>', re.DOTALL)
+MATHJAX_RE = re.compile(r'\s*<script\s+src="[^"]*mathjax[^"]*"[^>]*>\s*</script>', re.IGNORECASE)
+DELIMITERS = {'inline': (r'\(', r'\)'), 'display': (r'\[', r'\]')}
+
+# Display environments pandoc passes through; they can't go inside $...$
+DISPLAY_ENV_RE = re.compile(r'\\begin\{(?:equation|align|alignat|flalign|gather|multline|eqnarray)\*?\}')
+# MathJax numbers nothing but \tag, so neither do we
+NUMBERED_ENV_RE = re.compile(r'(\\(?:begin|end)\{(?:equation|align|alignat|flalign|gather|multline|eqnarray))\}')
+# With -file-line-error TeX reports errors as "./math.tex:12: message";
+# "! message" is an error outside the file (e.g. a run that never ended)
+ERROR_RE = re.compile(r'^(?:(?:\./)?math\.tex:(\d+):|!) (.*)$', re.MULTILINE)
+
+def strip_delimiters(mode, tex):
+    start, end = DELIMITERS[mode]
+    tex = tex.strip()
+    if tex.startswith(start) and tex.endswith(end):
+        tex = tex[len(start):-len(end)]
+    return tex.strip()
+
+def extract_math(page):
+    """[(mode, tex)] for every math span, in page order"""
+    return [(mode, strip_delimiters(mode, html.unescape(body)))
+            for mode, body in MATH_RE.findall(page)]
+
+def math_key(mode, tex, versions):
+    h = hashlib.sha256()
+    parts = [str(CACHE_FORMAT), MATH_PREAMBLE, mode, tex]
+    for part in parts + [f'{k}={versions[k]}' for k in sorted(versions)]:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+def cache_path(key):
+    return os.path.join(CACHE_DIR, key + '.svg')
+
+def failed_path(key):
+    """Marker holding TeX's errors for a formula left to MathJax"""
+    return os.path.join(CACHE_DIR, key + '.failed')
+
+def preview_body(mode, tex):
+    if mode == 'display' and DISPLAY_ENV_RE.match(tex):
+        tex = NUMBERED_ENV_RE.sub(r'\1*}', tex)
+        return f'\\begin{{preview}}\n{tex}\n\\end{{preview}}'
+    style = r'\displaystyle ' if mode == 'display' else ''
+    return f'\\begin{{preview}}${style}{tex}$\\end{{preview}}'
+
+def blame(log, line_ranges):
+    """{formula index: [errors]} from a TeX log, given the first and last
+    line of each formula in math.tex; None if an error is outside them"""
+    errors = {}
+    for line, message in ERROR_RE.findall(log):
+        index = next((i for i, (first, last) in enumerate(line_ranges)
+                      if line and first <= int(line) <= last), None)
+        if index is None:
+            return None
+        errors.setdefault(index, []).append(message.strip())
+    return errors
+
+def to_em(match):
+    name, quote, points = match.groups()
+    return f'{name}={quote}{float(points) / TEX_FONT_PT:.4g}em{quote}'
+
+def finish_svg(svg, depth_pt):
+    """Sizes in em, baseline aligned with the text via vertical-align"""
+    svg = svg[svg.index('<svg'):]
+    head_end = svg.index('>')
+    head = re.sub(r'\b(width|height)=(["\'])([\d.]+)pt\2', to_em, svg[:head_end])
+    head += f' style="vertical-align: -{depth_pt / TEX_FONT_PT:.4g}em"'
+    return svgopt.optimize_svg(head + svg[head_end:])
+
+def render(items, tools):
+    """Render [(key, mode, tex)] in one TeX run; returns ({key: svg},
+    {key: errors}, whether the pages lined up with the formulas).
+
+    The preview package puts every formula on its own page and reports its
+    depth below the baseline, which dvisvgm prints per page. Errors in the
+    log are traced back to their formula by line number and those pages are
+    dropped. When an error swallowed pages or stopped the run, nothing is
+    rendered: the line it was reported at may be a later formula's.
+    """
+    bodies = [preview_body(mode, tex) for _, mode, tex in items]
+    line_ranges, first = [], MATH_PREAMBLE.count('\n') + 1
+    for body in bodies:
+        line_ranges.append((first, first + body.count('\n')))
+        first += body.count('\n') + 1
+    
+    with tempfile.TemporaryDirectory(prefix='math-') as work_dir:
+        tex_file = os.path.join(work_dir, 'math.tex')
+        with open(tex_file, 'w', encoding='utf-8') as f:
+            f.write(MATH_PREAMBLE + '\n'.join(bodies) + MATH_END)
+        
+        buildtrace.run([tools['pdflatex'], '-output-format=dvi', '-interaction=nonstopmode',
+                        '-file-line-error', 'math.tex'],
+                       name=f'pdflatex math ({len(items)} formulas)',
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=work_dir)
+        try:
+            with open(os.path.join(work_dir, 'math.log'), 'r', encoding='utf-8', errors='replace') as f:
+                errors = blame(f.read(), line_ranges)
+        except OSError:
+            errors = None
+        if errors is None:
+            return {}, {}, False
+        failed = {items[i][0]: messages for i, messages in errors.items()}
+        dvi_file = os.path.join(work_dir, 'math.dvi')
+        if not os.path.exists(dvi_file):
+            return {}, failed, False
+        
+        result = buildtrace.run([tools['dvisvgm'], '--no-fonts', '--bbox=preview', '--page=1-',
+                                 '-o', 'math-%p.svg', 'math.dvi'],
+                                name=f'dvisvgm math ({len(items)} formulas)',
+                                capture_output=True, text=True, cwd=work_dir)
+        log = result.stdout + result.stderr
+        depths = [float(d) for d in re.findall(r'depth=(-?[\d.]+)pt', log)]
+        
+        pages = [os.path.join(work_dir, f'math-{n + 1}.svg') for n in range(len(items))]
+        if len(depths) != len(items) or not all(os.path.exists(p) for p in pages):
+            return {}, failed, False
+        
+        rendered = {}
+        for (key, _, _), page, depth in zip(items, pages, depths):
+            if key not in failed:
+                with open(page, 'r', encoding='utf-8') as f:
+                    rendered[key] = finish_svg(f.read(), depth)
+        return rendered, failed, True
+
+def render_batch(items, tools):
+    """({key: svg}, {key: errors}) for every formula in items. A run whose
+    pages don't line up with its formulas is split in half until they do,
+    so a broken formula costs a couple of runs per halving, not one run
+    per formula."""
+    rendered, failed, lined_up = render(items, tools)
+    if lined_up:
+        return rendered, failed
+    if len(items) == 1:
+        return {}, {items[0][0]: failed.get(items[0][0]) or ["the run produced no page"]}
+    
+    half = len(items) // 2
+    rendered, failed = {}, {}
+    for part in [items[:half], items[half:]]:
+        more_rendered, more_failed = render_batch(part, tools)
+        rendered.update(more_rendered)
+        failed.update(more_failed)
+    return rendered, failed
+
+def render_missing(items, tools):
+    """Render and cache formulas; returns (rendered, failed) counts.
+
+    Failures are only remembered when other formulas rendered: if none did,
+    the preamble or the tools are at fault and the next build tries again.
+    """
+    rendered, failed = render_batch(items, tools)
+    
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for key, svg in rendered.items():
+        atomicfile.write_text(cache_path(key), svg)
+    formulas = {key: tex for key, _, tex in items}
+    for key, messages in failed.items():
+        if rendered:
+            atomicfile.write_text(failed_path(key), '\n'.join(messages) + '\n')
+        print(f"  ⚠️  Left to MathJax: {formulas[key][:60]!r}: {messages[0]}")
+    return len(rendered), len(failed)
+
+def inline_svg(svg, key, occurrence, mode, tex):
+    """SVG ready to inline: ids made unique per formula and per occurrence
+    of it on the page, labelled for screen readers"""
+    prefix = f'm{key[:10]}-{occurrence}-'
+    svg = re.sub(r'\bid=(["\'])(.+?)\1', lambda m: f'id={m.group(1)}{prefix}{m.group(2)}{m.group(1)}', svg)
+    svg = re.sub(r'(href=["\']#|url\(#)([^"\')]+)', lambda m: m.group(1) + prefix + m.group(2), svg)
+    label = html.escape(tex, quote=True)
+    return svg.replace('<svg', f'<svg role="img" aria-label="{label}"', 1).strip()
+
+def prerender_page(page, versions):
+    """Replace math spans with cached SVGs; returns (page, number left for MathJax)"""
+    left = 0
+    occurrences = {}
+    
+    def replace(match):
+        nonlocal left
+        mode = match.group(1)
+        tex = strip_delimiters(mode, html.unescape(match.group(2)))
+        key = math_key(mode, tex, versions)
+        if not os.path.exists(cache_path(key)):
+            left += 1
+            return match.group(0)
+        with open(cache_path(key), 'r', encoding='utf-8') as f:
+            svg = f.read()
+        occurrences[key] = occurrences.get(key, -1) + 1
+        return f'<span class="math {mode}">{inline_svg(svg, key, occurrences[key], mode, tex)}</span>'
+    
+    page = MATH_RE.sub(replace, page)
+    if left == 0:
+        page = MATHJAX_RE.sub('', page)
+    return page, left
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render TeX formulas in HTML pages to inline SVG")
+    parser.add_argument('pages', nargs='*', default=['docs/index.html'])
+    args = parser.parse_args()
+    
+    toolset = toolchain.resolve()
+    tools = {name: toolchain.path(name, toolset) for name in ['pdflatex', 'dvisvgm']}
+    if not all(tools.values()):
+        print("⚠️  Warning: pre-rendering math needs pdflatex and dvisvgm; keeping MathJax")
+        return
+    all_versions = toolchain.versions(toolset)
+    versions = {name: all_versions[name] for name in tools}
+    
+    pages = {}
+    for path in args.pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages[path] = f.read()
+    
+    formulas = {}
+    total = 0
+    for page in pages.values():
+        for mode, tex in extract_math(page):
+            formulas[math_key(mode, tex, versions)] = (mode, tex)
+            total += 1
+    missing = [(key, mode, tex) for key, (mode, tex) in formulas.items()
+               if not os.path.exists(cache_path(key)) and not os.path.exists(failed_path(key))]
+    print(f"Found {total} formulas ({len(formulas)} distinct, {len(missing)} to render)")
+    if missing:
+        rendered, failed = render_missing(missing, tools)
+        print(f"  Rendered {rendered}/{len(missing)}" + (f", {failed} left to MathJax" if failed else ""))
+    
+    for path, page in pages.items():
+        page, left = prerender_page(page, versions)
+        atomicfile.write_text(path, page)
+        if left:
+            print(f"⚠️  {path}: {left} formulas could not be rendered; keeping MathJax for them")
+        else:
+            print(f"✅ {path}: all formulas pre-rendered, MathJax removed")
+
+if __name__ == '__main__':
+    main()
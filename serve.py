@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Preview docs/ the way it is served in production
+
+Unlike python3 -m http.server this answers requests on a thread pool and
+supports what browsers rely on in production:
+
+- strong ETags and Last-Modified, answered with 304 on If-None-Match and
+  If-Modified-Since
+- single byte ranges (206/416), with If-Range
+- the .br/.gz siblings written by compress.py, chosen from Accept-Encoding
+- Cache-Control and other headers from docs/_headers (the Netlify file),
+  or no-cache everywhere with --no-cache
+
+Every request is logged with its status, bytes sent, encoding and latency.
+
+    python3 serve.py [--port 8000] [--bind 127.0.0.1] [--root docs] [--no-cache]
+"""
+import argparse
+import email.utils
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Preferred first
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+mimetypes.add_type('image/svg+xml', '.svg')
+mimetypes.add_type('application/javascript', '.js')
+
+def parse_headers_file(path):
+    """[(path pattern regex, [(header, value)])] from a Netlify _headers file"""
+    rules = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return rules
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if not line[0].isspace():
+            pattern = '^' + re.escape(line.strip()).replace(r'\*', '.*') + '$'
+            rules.append((re.compile(pattern), []))
+        elif rules and ':' in line:
+            name, value = line.split(':', 1)
+            rules[-1][1].append((name.strip(), value.strip()))
+    return rules
+
+def accepted_encodings(header):
+    """Content codings the client accepts (q > 0)"""
+    accepted = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        match = re.search(r'q=([\d.]+)', params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+def byte_range(header, size):
+    """(start, end) of a single-range header, None to ignore it, or
+    'unsatisfiable'"""
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if first == '':
+        if last == '':
+            return None
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        return 'unsatisfiable'
+    return start, end
+
+class ETagCache:
+    """Strong ETags by file, recomputed only when size or mtime change"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, path, st):
+        stamp = (st.st_size, st.st_mtime_ns)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry[0] == stamp:
+                return entry[1]
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        etag = f'"{h.hexdigest()[:32]}"'
+        with self.lock:
+            self.entries[path] = (stamp, etag)
+        return etag
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    server_version = 'FosilePreview/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def log_message(self, format, *args):
+        pass
+
+    def resolve(self):
+        """File for the request path, 'redirect' for a directory without
+        its trailing slash, or None"""
+        url_path = urllib.parse.urlsplit(self.path).path
+        path = posixpath.normpath(urllib.parse.unquote(url_path))
+        parts = [part for part in path.split('/') if part and part not in ('.', '..')]
+        file_path = os.path.join(self.server.root, *parts)
+        if os.path.isdir(file_path):
+            if not url_path.endswith('/'):
+                return 'redirect'
+            file_path = os.path.join(file_path, 'index.html')
+        return file_path if os.path.isfile(file_path) else None
+
+    def policy_headers(self):
+        if self.server.no_cache:
+            return [('Cache-Control', 'no-cache')]
+        path = urllib.parse.urlsplit(self.path).path
+        headers = {}
+        for pattern, values in self.server.header_rules:
+            if pattern.match(path):
+                headers.update(values)
+        headers.setdefault('Cache-Control', 'no-cache')
+        return list(headers.items())
+
+    def serve(self, send_body):
+        start = time.perf_counter()
+        self.sent = 0
+        self.encoding = '-'
+        status = self.respond(send_body)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{int(status)} {self.command} {self.path} {self.sent} B {self.encoding} {elapsed:.1f} ms",
+              flush=True)
+
+    def finish_headers(self, status, headers, length=None):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if length is not None:
+            self.send_header('Content-Length', str(length))
+        self.end_headers()
+
+    def respond(self, send_body):
+        source = self.resolve()
+        if source == 'redirect':
+            parts = urllib.parse.urlsplit(self.path)
+            location = urllib.parse.urlunsplit(parts._replace(path=parts.path + '/'))
+            self.finish_headers(HTTPStatus.MOVED_PERMANENTLY, [('Location', location)], 0)
+            return HTTPStatus.MOVED_PERMANENTLY
+        if source is None:
+            body = b'404 Not Found\n'
+            self.finish_headers(HTTPStatus.NOT_FOUND, [('Content-Type', 'text/plain')], len(body))
+            if send_body:
+                self.wfile.write(body)
+                self.sent = len(body)
+            return HTTPStatus.NOT_FOUND
+
+        content_type = mimetypes.guess_type(source)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'image/svg+xml'):
+            content_type += '; charset=utf-8'
+
+        # Ranges are cut from the uncompressed file
+        file_path, coding = source, None
+        if 'Range' not in self.headers:
+            accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+            for name, suffix in ENCODINGS:
+                if name in accepted and os.path.isfile(source + suffix):
+                    file_path, coding = source + suffix, name
+                    break
+
+        st = os.stat(file_path)
+        etag = self.server.etags.get(file_path, st)
+        last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        headers = [('Content-Type', content_type), ('ETag', etag), ('Last-Modified', last_modified),
+                   ('Accept-Ranges', 'bytes'), ('Vary', 'Accept-Encoding')] + self.policy_headers()
+        if coding:
+            headers.append(('Content-Encoding', coding))
+            self.encoding = coding
+
+        if self.not_modified(etag, st):
+            self.finish_headers(HTTPStatus.NOT_MODIFIED, [h for h in headers if h[0] != 'Content-Type'])
+            return HTTPStatus.NOT_MODIFIED
+
+        start, end, status = 0, st.st_size - 1, HTTPStatus.OK
+        if 'Range' in self.headers and self.headers.get('If-Range', etag) in (etag, last_modified):
+            requested = byte_range(self.headers['Range'], st.st_size)
+            if requested == 'unsatisfiable':
+                headers = [('Content-Range', f'bytes */{st.st_size}')]
+                self.finish_headers(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers, 0)
+                return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            if requested:
+                start, end = requested
+                status = HTTPStatus.PARTIAL_CONTENT
+                headers.append(('Content-Range', f'bytes {start}-{end}/{st.st_size}'))
+
+        length = end - start + 1 if st.st_size else 0
+        self.finish_headers(status, headers, length)
+        if send_body:
+            with open(file_path, 'rb') as f:
+                f.seek(start)
+                remaining = length
+                while remaining > 0:
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    self.sent += len(chunk)
+                    remaining -= len(chunk)
+        return status
+
+    def not_modified(self, etag, st):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(st.st_mtime) <= since
+        return False
+
+class PreviewServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, root, no_cache):
+        super().__init__(address, PreviewHandler)
+        self.root = os.path.abspath(root)
+        self.no_cache = no_cache
+        self.header_rules = parse_headers_file(os.path.join(self.root, '_headers'))
+        self.etags = ETagCache()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve docs/ with production caching and compression")
+    parser.add_argument('--port', '-p', type=int, default=8000)
+    parser.add_argument('--bind', '-b', default='127.0.0.1')
+    parser.add_argument('--root', default='docs')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="send Cache-Control: no-cache for everything instead of the _headers rules")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.root):
+        print(f"❌ Error: {args.root}/ not found. Build the website first.")
+        sys.exit(1)
+    server = PreviewServer((args.bind, args.port), args.root, args.no_cache)
+    print(f"Serving {args.root}/ at http://{args.bind}:{args.port}/ "
+          f"({len(server.header_rules)} header rules from _headers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Split the single-page thesis into one page per chapter
+
+docs/index.html holds the whole thesis. This turns every top-level <h1>
+chapter into its own page (01-generalitati.html, ...), makes index.html a
+light landing page with the title block and table of contents, and keeps
+the full single page as complete.html. Links to anchors in other chapters
+are rewritten to point at the right page, and each page prefetches the
+next chapter.
+
+    python3 split-chapters.py [docs/index.html]
+"""
+import html
+import os
+import re
+import sys
+import unicodedata
+
+import atomicfile
+
+SINGLE_PAGE = 'complete.html'
+CHAPTER_FILE_RE = re.compile(r'^\d{2}-[a-z0-9-]+\.html$')
+
+CHAPTER_RE = re.compile(r'<h1\b[^>]*\bid="([^"]+)"[^>]*>(.*?)</h1>', re.DOTALL)
+ID_RE = re.compile(r'\bid="([^"]+)"')
+HREF_RE = re.compile(r'\bhref="#([^"]+)"')
+# Consecutive <script> blocks (and htmlpost.py markers) right before </body>,
+# which every page keeps
+TAIL_RE = re.compile(r'(?:\s*(?:<script\b(?:(?!</script>).)*</script>|<!--(?:(?!-->).)*-->))*'
+                     r'\s*</body>\s*</html>\s*\Z', re.DOTALL)
+
+def slugify(text):
+    """ASCII file-name slug: 'Generalităţi' -> 'generalitati'"""
+    text = html.unescape(re.sub(r'<[^>]+>', '', text)).replace('–', '-').replace('—', '-')
+    text = unicodedata.normalize('NFKD', text)
+    text = text.encode('ascii', 'ignore').decode('ascii').lower()
+    return re.sub(r'[^a-z0-9]+', '-', text).strip('-') or 'capitol'
+
+def split_page(page):
+    """(head, front matter, [(id, title, body)], tail) of a pandoc page.
+
+    The front matter is everything between <body> and the first chapter
+    (title block, PDF link, TOC); the tail is the trailing <script> blocks
+    and </body></html>.
+    """
+    body_start = page.index('<body>') + len('<body>')
+    tail_start = TAIL_RE.search(page, body_start).start()
+    
+    content = page[body_start:tail_start]
+    headings = list(CHAPTER_RE.finditer(content))
+    if not headings:
+        return page[:body_start], content, [], page[tail_start:]
+    
+    chapters = []
+    for n, heading in enumerate(headings):
+        end = headings[n + 1].start() if n + 1 < len(headings) else len(content)
+        chapters.append((heading.group(1), heading.group(2), content[heading.start():end]))
+    return page[:body_start], content[:headings[0].start()], chapters, page[tail_start:]
+
+def rewrite_links(text, own_file, targets):
+    """Point #anchors that live on another page at that page"""
+    def link(match):
+        target = targets.get(html.unescape(match.group(1)))
+        if target is None or target == own_file:
+            return match.group(0)
+        return f'href="{target}#{match.group(1)}"'
+    return HREF_RE.sub(link, text)
+
+def page_head(head, title, prefetch):
+    """The original <head> with a chapter title and a prefetch hint"""
+    head = re.sub(r'<title>.*?</title>', lambda m: f'<title>{title}</title>', head, count=1, flags=re.DOTALL)
+    if prefetch:
+        head = head.replace('</head>', f'  <link rel="prefetch" href="{prefetch}">\n</head>', 1)
+    return head
+
+def chapter_nav(prev_link, next_link):
+    links = ['<a href="index.html">Cuprins</a>']
+    if prev_link:
+        links.insert(0, f'<a href="{prev_link[0]}" rel="prev">← {prev_link[1]}</a>')
+    if next_link:
+        links.append(f'<a href="{next_link[0]}" rel="next">{next_link[1]} →</a>')
+    return '<nav class="chapter-nav">\n' + '\n'.join(links) + '\n</nav>\n'
+
+def split(page):
+    """{file name: html} for the landing page, chapter pages and the single page"""
+    head, front, chapters, tail = split_page(page)
+    if not chapters:
+        return {}
+    
+    files = [f'{n + 1:02d}-{slugify(title)}.html' for n, (_, title, _) in enumerate(chapters)]
+    targets = {}
+    for file_name, (_, _, body) in zip(files, chapters):
+        for ident in ID_RE.findall(body):
+            targets.setdefault(html.unescape(ident), file_name)
+    
+    title = re.search(r'<title>(.*?)</title>', head, re.DOTALL)
+    doc_title = title.group(1).strip() if title else ''
+    plain_titles = [re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', '', t)).strip() for _, t, _ in chapters]
+    
+    pages = {}
+    landing_front = rewrite_links(front, 'index.html', targets)
+    landing_front += f'<p class="single-page-link"><a href="{SINGLE_PAGE}">Versiunea completă pe o singură pagină</a></p>\n'
+    pages['index.html'] = page_head(head, doc_title, files[0]) + landing_front + tail
+    
+    for n, (file_name, (_, _, body)) in enumerate(zip(files, chapters)):
+        prev_link = (files[n - 1], plain_titles[n - 1]) if n > 0 else None
+        next_link = (files[n + 1], plain_titles[n + 1]) if n + 1 < len(files) else None
+        nav = chapter_nav(prev_link, next_link)
+        title = f'{plain_titles[n]} – {doc_title}' if doc_title else plain_titles[n]
+        pages[file_name] = (page_head(head, title, next_link[0] if next_link else None)
+                            + nav + rewrite_links(body, file_name, targets) + nav + tail)
+    
+    pages[SINGLE_PAGE] = page
+    return pages
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else 'docs/index.html'
+    output_dir = os.path.dirname(source) or '.'
+    with open(source, 'r', encoding='utf-8') as f:
+        page = f.read()
+    
+    pages = split(page)
+    if not pages:
+        print(f"⚠️  No chapters found in {source}; leaving it as a single page")
+        return
+    
+    # Chapter pages from an earlier build may have different names
+    for entry in os.listdir(output_dir):
+        if CHAPTER_FILE_RE.match(entry) and entry not in pages:
+            os.remove(os.path.join(output_dir, entry))
+    
+    for name, text in pages.items():
+        atomicfile.write_text(os.path.join(output_dir, name), text)
+    print(f"✅ Split into {len(pages) - 2} chapter pages + index.html "
+          f"(single page kept as {SINGLE_PAGE})")
+
+if __name__ == '__main__':
+    main()
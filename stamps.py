@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Record what each build stage was built from, to skip unchanged stages
+
+A stage's stamp (.cache/stamps/<stage>.json) holds the content hash of
+every input file, the versions of the tools it used and its options. The
+stage is up to date when all outputs exist and none of those changed.
+Hashes are memoised by size and mtime, so an unchanged tree costs only a
+stat per file.
+
+    python3 stamps.py check  STAGE --in FILE... --out FILE... [--tool NAME...] [--opt K=V...]
+    python3 stamps.py record STAGE (same arguments)
+
+`check` exits 0 when the stage can be skipped, printing why either way.
+"""
+import argparse
+import hashlib
+import os
+import sys
+import threading
+
+import atomicfile
+import toolchain
+
+STAMP_DIR = '.cache/stamps'
+DIGEST_MEMO = os.path.join(STAMP_DIR, 'digests.json')
+
+# build.py checks and records stages from several threads
+memo_lock = threading.Lock()
+
+def file_digest(path, memo):
+    """SHA-256 of a file, reusing the memo entry while size and mtime match"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = os.path.abspath(path)
+    entry = memo.get(key)
+    if entry and entry[:2] == [st.st_size, st.st_mtime_ns]:
+        return entry[2]
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    memo[key] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+    return h.hexdigest()
+
+def fingerprint(inputs, tools=(), options=None):
+    """Everything a stage depends on: input hashes, tool versions, options"""
+    with memo_lock:
+        memo = atomicfile.read_json(DIGEST_MEMO)
+        before = dict(memo)
+        digests = {path: file_digest(path, memo) for path in inputs}
+        if memo != before:
+            atomicfile.write_json(DIGEST_MEMO, memo)
+    versions = toolchain.versions() if tools else {}
+    return {
+        'inputs': digests,
+        'tools': {name: versions.get(name, 'missing') for name in tools},
+        'options': dict(options or {}),
+    }
+
+def stamp_path(stage):
+    return os.path.join(STAMP_DIR, stage + '.json')
+
+def check(stage, inputs, outputs, tools=(), options=None):
+    """(up_to_date, reason)"""
+    for path in outputs:
+        if not os.path.exists(path):
+            return False, f"{path} is missing"
+    stored = atomicfile.read_json(stamp_path(stage))
+    if not stored:
+        return False, "no record of a previous build"
+    
+    current = fingerprint(inputs, tools, options)
+    changed = [path for path, digest in current['inputs'].items()
+               if stored.get('inputs', {}).get(path) != digest]
+    changed += [path for path in stored.get('inputs', {}) if path not in current['inputs']]
+    if changed:
+        return False, f"{', '.join(changed)} changed"
+    tools_changed = [name for name, version in current['tools'].items()
+                     if stored.get('tools', {}).get(name) != version]
+    if tools_changed:
+        return False, f"{', '.join(tools_changed)} version changed"
+    if current['options'] != stored.get('options', {}):
+        return False, "options changed"
+    return True, "inputs, tools and options unchanged"
+
+def record(stage, inputs, tools=(), options=None):
+    atomicfile.write_json(stamp_path(stage), fingerprint(inputs, tools, options))
+
+def parse_options(pairs):
+    return dict(pair.split('=', 1) if '=' in pair else (pair, '') for pair in pairs)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or record build stage stamps")
+    parser.add_argument('action', choices=['check', 'record'])
+    parser.add_argument('stage')
+    parser.add_argument('--in', dest='inputs', nargs='*', default=[])
+    parser.add_argument('--out', dest='outputs', nargs='*', default=[])
+    parser.add_argument('--tool', dest='tools', nargs='*', default=[])
+    parser.add_argument('--opt', dest='options', nargs='*', default=[])
+    args = parser.parse_args()
+    options = parse_options(args.options)
+    
+    if args.action == 'record':
+        record(args.stage, args.inputs, args.tools, options)
+        return
+    
+    if os.environ.get('FORCE') == '1':
+        print(f"▶️  {args.stage}: FORCE=1")
+        sys.exit(1)
+    up_to_date, reason = check(args.stage, args.inputs, args.outputs, args.tools, options)
+    if up_to_date:
+        print(f"⏭️  Skipping {args.stage}: {reason}")
+        sys.exit(0)
+    print(f"▶️  {args.stage}: {reason}")
+    sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Shrink the SVGs produced by pdf2svg/dvisvgm
+
+pdf2svg prints coordinates with six decimals and every diagram carries its
+own copy of the Computer Modern glyph outlines. This rounds coordinates,
+drops <defs> entries nothing references, and can move glyphs shared by
+several diagrams into one sprite file that diagrams point at with <use>.
+
+The SVGs are regular machine output, so plain regular expressions are
+enough and keep the rest of the markup byte-for-byte. pdf2svg (cairo)
+quotes attributes with " and dvisvgm with ', so every pattern takes both.
+
+    python3 svgopt.py [--precision N] [--sprite docs/diagrams/glyphs.svg] FILE...
+"""
+import argparse
+import hashlib
+import os
+import re
+
+import atomicfile
+
+DEFAULT_PRECISION = 3
+
+# Attributes whose values are lists of coordinates or lengths
+NUMERIC_ATTRS = ['d', 'transform', 'x', 'y', 'width', 'height', 'viewBox',
+                 'points', 'stroke-width', 'x1', 'y1', 'x2', 'y2']
+
+ATTR_RE = re.compile(r'\b(%s)=(["\'])(.*?)\2' % '|'.join(re.escape(a) for a in NUMERIC_ATTRS))
+NUMBER_RE = re.compile(r'-?\d*\.\d+')
+DEFS_RE = re.compile(r'<defs>(.*?)</defs>', re.DOTALL)
+DEF_RE = re.compile(r'<(\w+)\b[^>]*?\bid=(["\'])(.+?)\2[^>]*?(?:/>|>(.*?)</\1>)\s*', re.DOTALL)
+REF_RE = re.compile(r'(?:href=["\']|url\()#([^"\')]+)')
+ID_ATTR_RE = re.compile(r'\s*\bid=(["\']).+?\1')
+# Glyph outlines: glyph-0-12 from pdf2svg, g0-12 from dvisvgm --no-fonts
+GLYPH_ID_RE = re.compile(r'(?:glyph-|g)\d+-\d+')
+
+def round_number(match, precision):
+    text = f'{float(match.group(0)):.{precision}f}'.rstrip('0').rstrip('.')
+    text = '0' if text in ('', '-0') else text
+    # dvisvgm runs numbers together ("1.5.25" is 1.5 and .25) and leaves out
+    # the 0 before the point; keep it out, and keep a number that lost its
+    # point from merging with its neighbours
+    if match.group(0).lstrip('-').startswith('.'):
+        text = re.sub(r'^(-?)0\.', r'\1.', text)
+    if '.' not in text:
+        if match.string[match.start() - 1:match.start()].isdigit() and not text.startswith('-'):
+            text = ' ' + text
+        if match.string[match.end():match.end() + 1] == '.':
+            text += ' '
+    return text
+
+def round_coordinates(svg, precision=DEFAULT_PRECISION):
+    """Round every decimal in coordinate-like attributes to `precision` places"""
+    def attr(match):
+        name, quote, value = match.groups()
+        value = NUMBER_RE.sub(lambda m: round_number(m, precision), value)
+        return f'{name}={quote}{value}{quote}'
+    return ATTR_RE.sub(attr, svg)
+
+def defined_ids(svg):
+    """{id: (tag, whole element text)} for the top-level entries in <defs>"""
+    found = {}
+    for defs in DEFS_RE.finditer(svg):
+        body = defs.group(1)
+        # pdf2svg wraps all glyphs in one anonymous <g>; look inside it
+        inner = re.fullmatch(r'\s*<g>(.*)</g>\s*', body, re.DOTALL)
+        for match in DEF_RE.finditer(inner.group(1) if inner else body):
+            tag, _, ident, content = match.groups()
+            if content and f'<{tag}' in content:
+                continue  # nested element of the same kind, not a simple def
+            found[ident] = (tag, match.group(0))
+    return found
+
+def remove_unused_defs(svg):
+    """Drop <defs> entries that are never referenced"""
+    referenced = set(REF_RE.findall(svg))
+    for ident, (_, element) in defined_ids(svg).items():
+        if ident not in referenced:
+            svg = svg.replace(element, '', 1)
+    return re.sub(r'<defs>\s*(?:<g>\s*</g>\s*)?</defs>\s*', '', svg)
+
+def optimize_svg(svg, precision=DEFAULT_PRECISION):
+    return remove_unused_defs(round_coordinates(svg, precision))
+
+def glyph_body(element):
+    """An element without its id, used to recognise the same glyph across files"""
+    return ID_ATTR_RE.sub('', element, count=1).strip()
+
+def share_glyphs(svgs, sprite_href):
+    """Move glyphs used by two or more SVGs into a shared sprite.
+
+    svgs maps a name to optimised SVG text. Returns (new svgs, sprite text).
+    Glyph ids are per file (glyph-0-0 from pdf2svg, g0-0 from dvisvgm mean
+    different things in different diagrams), so glyphs are matched by their
+    outline and renamed after its hash. References become
+    `<use xlink:href="<sprite_href>#g-<hash>">`. Only outlined glyphs can
+    be shared, not glyphs drawn from embedded fonts.
+
+    SVGs that reference an external sprite only render when the diagram is
+    embedded with <object> or inline; browsers block external resources in
+    SVGs loaded through <img> (see DIAGRAM_EMBED in tikzcd-filter.lua).
+    """
+    glyphs = {}
+    users = {}
+    per_file = {}
+    for name, svg in svgs.items():
+        per_file[name] = {}
+        for ident, (tag, element) in defined_ids(svg).items():
+            if not GLYPH_ID_RE.fullmatch(ident):
+                continue
+            body = glyph_body(element)
+            shared_id = 'g-' + hashlib.sha256(body.encode('utf-8')).hexdigest()[:10]
+            glyphs[shared_id] = body
+            users.setdefault(shared_id, set()).add(name)
+            per_file[name][ident] = (shared_id, element)
+    
+    common = {shared_id for shared_id, names in users.items() if len(names) > 1}
+    result = {}
+    for name, svg in svgs.items():
+        for ident, (shared_id, element) in per_file[name].items():
+            if shared_id not in common:
+                continue
+            svg = svg.replace(element, '', 1)
+            svg = re.sub(r'href=(["\'])#%s\1' % re.escape(ident),
+                         lambda m: f'href={m.group(1)}{sprite_href}#{shared_id}{m.group(1)}', svg)
+        result[name] = re.sub(r'<defs>\s*(?:<g>\s*</g>\s*)?</defs>\s*', '', svg)
+    
+    sprite = ['<?xml version="1.0" encoding="UTF-8"?>',
+              '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">',
+              '<defs>']
+    for shared_id in sorted(common):
+        tag_end = glyphs[shared_id].index('>')
+        open_tag = glyphs[shared_id][:tag_end].rstrip('/')
+        sprite.append(f'{open_tag} id="{shared_id}"{glyphs[shared_id][len(open_tag):]}')
+    sprite += ['</defs>', '</svg>', '']
+    return result, '\n'.join(sprite)
+
+def main():
+    parser = argparse.ArgumentParser(description="Round coordinates and drop unused defs in SVG files")
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION)
+    parser.add_argument('--sprite', help="write glyphs shared between files to this SVG")
+    args = parser.parse_args()
+    
+    svgs = {}
+    for path in args.files:
+        with open(path, 'r', encoding='utf-8') as f:
+            svgs[path] = optimize_svg(f.read(), args.precision)
+    if args.sprite:
+        sprite_dir = os.path.dirname(os.path.abspath(args.sprite))
+        hrefs = {os.path.relpath(args.sprite, os.path.dirname(path) or '.') for path in svgs}
+        if len(hrefs) > 1 or any(os.path.dirname(os.path.abspath(p)) != sprite_dir for p in svgs):
+            parser.error("--sprite must be in the same directory as the SVG files")
+        svgs, sprite = share_glyphs(svgs, os.path.basename(args.sprite))
+        atomicfile.write_text(args.sprite, sprite)
+    
+    before = sum(os.path.getsize(path) for path in svgs)
+    for path, svg in svgs.items():
+        atomicfile.write_text(path, svg)
+    after = sum(os.path.getsize(path) for path in svgs)
+    print(f"Optimized {len(svgs)} SVGs: {before} -> {after} bytes")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+// Service Worker for Fosile Algebrice PWA
+//
+// docs/sw.js is generated from this file by precache.py, which fills in
+// PRECACHE_MANIFEST with every page and asset of the build and a hash of
+// its content. An update only downloads the entries whose hash changed.
+const CACHE_PREFIX = "fosile-algebrice";
+const PRECACHE = `${CACHE_PREFIX}-precache`;
+const STAGING = `${CACHE_PREFIX}-precache-staging`;
+const RUNTIME = `${CACHE_PREFIX}-runtime`;
+// Where the hashes of the cached entries are kept, inside PRECACHE
+const REVISIONS_URL = "/__precache-revisions";
+
+const PRECACHE_MANIFEST = /* PRECACHE_MANIFEST */ [];
+
+// The page for "/" is cached as /index.html
+function cacheKey(url) {
+  const { pathname } = new URL(url, self.location.origin);
+  return pathname.endsWith("/") ? `${pathname}index.html` : pathname;
+}
+
+async function cachedRevisions() {
+  const cache = await caches.open(PRECACHE);
+  const response = await cache.match(REVISIONS_URL);
+  return response ? response.json() : {};
+}
+
+// Install event - download new and changed entries into the staging cache
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    (async () => {
+      const revisions = await cachedRevisions();
+      const precache = await caches.open(PRECACHE);
+      await caches.delete(STAGING);
+      const staging = await caches.open(STAGING);
+      const changed = [];
+      for (const { url, revision } of PRECACHE_MANIFEST) {
+        if (revisions[url] !== revision || !(await precache.match(url))) {
+          changed.push(url);
+        }
+      }
+      console.log(`Precaching ${changed.length} of ${PRECACHE_MANIFEST.length} entries`);
+      await Promise.all(
+        changed.map(async (url) => {
+          const response = await fetch(url, { cache: "reload" });
+          if (!response.ok) {
+            throw new Error(`Precaching ${url} failed: ${response.status}`);
+          }
+          await staging.put(url, response);
+        })
+      );
+    })()
+  );
+});
+
+// Activate event - move the staged entries in, drop removed entries and old caches
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    (async () => {
+      const precache = await caches.open(PRECACHE);
+      const staging = await caches.open(STAGING);
+      for (const request of await staging.keys()) {
+        await precache.put(request, await staging.match(request));
+      }
+      await caches.delete(STAGING);
+
+      const revisions = {};
+      for (const { url, revision } of PRECACHE_MANIFEST) {
+        revisions[url] = revision;
+      }
+      for (const request of await precache.keys()) {
+        const url = cacheKey(request.url);
+        if (url !== REVISIONS_URL && !(url in revisions)) {
+          await precache.delete(request);
+        }
+      }
+      await precache.put(
+        REVISIONS_URL,
+        new Response(JSON.stringify(revisions), {
+          headers: { "Content-Type": "application/json" },
+        })
+      );
+
+      const cacheWhitelist = [PRECACHE, RUNTIME];
+      const cacheNames = await caches.keys();
+      await Promise.all(
+        cacheNames.map((cacheName) => {
+          if (cacheWhitelist.indexOf(cacheName) === -1) {
+            return caches.delete(cacheName);
+          }
+        })
+      );
+    })()
+  );
+});
+
+// Cached copy of a request, from the precache first
+async function cachedResponse(request) {
+  const precache = await caches.open(PRECACHE);
+  const sameOrigin = new URL(request.url).origin === self.location.origin;
+  return (
+    (sameOrigin && (await precache.match(cacheKey(request.url)))) ||
+    (await caches.match(request, { ignoreVary: true }))
+  );
+}
+
+// Store complete, same-origin responses only (never a 206 part)
+function cacheable(response) {
+  return response && response.status === 200 && response.type === "basic";
+}
+
+async function fetchAndCache(request, cacheName) {
+  const response = await fetch(request);
+  if (cacheable(response)) {
+    const responseToCache = response.clone();
+    const cache = await caches.open(cacheName);
+    await cache.put(cacheName === PRECACHE ? cacheKey(request.url) : request, responseToCache);
+  }
+  return response;
+}
+
+// Fingerprinted assets never change under the same URL
+async function cacheFirst(event) {
+  return (await cachedResponse(event.request)) || fetchAndCache(event.request, RUNTIME);
+}
+
+// Pages: answer from the cache at once and refresh it in the background
+async function staleWhileRevalidate(event) {
+  const cached = await cachedResponse(event.request);
+  const refresh = fetchAndCache(event.request, cached ? PRECACHE : RUNTIME);
+  if (cached) {
+    event.waitUntil(refresh.catch(() => {}));
+    return cached;
+  }
+  return refresh;
+}
+
+// PDF viewers ask for byte ranges; cut them from the cached full response
+async function rangeFromCache(event) {
+  const cached = await cachedResponse(event.request);
+  if (!cached) {
+    return fetch(event.request);
+  }
+  const match = /^bytes=(\d*)-(\d*)$/.exec(event.request.headers.get("range").trim());
+  if (!match) {
+    // Several ranges at once: let the server answer
+    return fetch(event.request);
+  }
+  const body = await cached.arrayBuffer();
+  let start = match[1] !== "" ? Number(match[1]) : null;
+  let end = match[2] !== "" ? Number(match[2]) : body.byteLength - 1;
+  if (start === null && match[2] !== "") {
+    // bytes=-N is the last N bytes
+    start = Math.max(body.byteLength - Number(match[2]), 0);
+    end = body.byteLength - 1;
+  }
+  end = Math.min(end, body.byteLength - 1);
+  if (start === null || start > end) {
+    return new Response(null, {
+      status: 416,
+      headers: { "Content-Range": `bytes */${body.byteLength}` },
+    });
+  }
+  const headers = new Headers(cached.headers);
+  headers.set("Content-Range", `bytes ${start}-${end}/${body.byteLength}`);
+  headers.set("Content-Length", String(end - start + 1));
+  return new Response(body.slice(start, end + 1), {
+    status: 206,
+    statusText: "Partial Content",
+    headers,
+  });
+}
+
+function isPage(request) {
+  const { pathname } = new URL(request.url);
+  return request.mode === "navigate" || pathname.endsWith("/") || pathname.endsWith(".html");
+}
+
+// First matching strategy wins; anything else is cache first
+const STRATEGIES = [
+  { match: (request) => request.headers.has("range"), handle: rangeFromCache },
+  { match: isPage, handle: staleWhileRevalidate },
+  { match: (request) => new URL(request.url).pathname.startsWith("/assets/"), handle: cacheFirst },
+];
+
+self.addEventListener("fetch", (event) => {
+  if (event.request.method !== "GET") {
+    return;
+  }
+  const strategy = STRATEGIES.find(({ match }) => match(event.request));
+  event.respondWith((strategy ? strategy.handle : cacheFirst)(event));
+});
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Dump a LaTeX preamble into a precompiled format file
+
+Loading tikz/tikz-cd (or the whole thesis preamble) dominates a short
+pdflatex run. mylatexformat.ltx dumps everything up to \\begin{document}
+into a .fmt file; later runs start from that format and skip the preamble.
+Formats are named by a hash of the preamble and the engine version, so an
+edit to either produces a fresh one.
+"""
+import hashlib
+import os
+import subprocess
+import sys
+
+import buildtrace
+import toolchain
+
+FORMAT_DIR = '.cache/formats'
+
+def preamble_of(tex_content):
+    """Everything before \\begin{document}"""
+    end = tex_content.find('\\begin{document}')
+    return tex_content if end < 0 else tex_content[:end]
+
+def format_key(preamble, engine_version):
+    h = hashlib.sha256()
+    h.update(preamble.encode('utf-8'))
+    h.update(b'\0')
+    h.update(engine_version.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+def format_env(fmt_file):
+    """Environment that lets the engine find fmt_file by name"""
+    env = dict(os.environ)
+    fmt_dir = os.path.abspath(os.path.dirname(fmt_file))
+    env['TEXFORMATS'] = fmt_dir + os.pathsep + env.get('TEXFORMATS', '')
+    return env
+
+def format_args(fmt_file):
+    """Command-line switch that selects fmt_file"""
+    return [f'-fmt={os.path.splitext(os.path.basename(fmt_file))[0]}']
+
+def ensure_format(name, preamble, engine_path, engine_version, cwd=None, fmt_dir=FORMAT_DIR):
+    """Return the .fmt path for preamble, dumping it first if needed.
+
+    cwd is where the preamble's relative \\input and \\usepackage paths are
+    resolved (the thesis source directory for main.tex). Returns None when
+    the format cannot be built (e.g. mylatexformat is not installed);
+    callers then compile without it.
+    """
+    fmt_dir = os.path.abspath(fmt_dir)
+    os.makedirs(fmt_dir, exist_ok=True)
+    jobname = f'{name}-{format_key(preamble, engine_version)}'
+    fmt_file = os.path.join(fmt_dir, jobname + '.fmt')
+    if os.path.exists(fmt_file):
+        return fmt_file
+    
+    tex_file = os.path.join(fmt_dir, jobname + '.tex')
+    with open(tex_file, 'w', encoding='utf-8') as f:
+        f.write(preamble_of(preamble) + '\\begin{document}\n\\end{document}\n')
+    
+    # Dump into a temporary job name, then rename, so concurrent builds
+    # never pick up a half-written format
+    tmp_job = f'{jobname}-tmp{os.getpid()}'
+    buildtrace.run([engine_path, '-ini', '-interaction=nonstopmode',
+                    f'-jobname={tmp_job}', f'-output-directory={fmt_dir}',
+                    '&pdflatex', 'mylatexformat.ltx', tex_file],
+                   name=f'pdflatex -ini {jobname}',
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                   cwd=cwd or fmt_dir)
+    tmp_fmt = os.path.join(fmt_dir, tmp_job + '.fmt')
+    try:
+        os.remove(os.path.join(fmt_dir, tmp_job + '.log'))
+    except FileNotFoundError:
+        pass
+    if not os.path.exists(tmp_fmt):
+        return None
+    os.replace(tmp_fmt, fmt_file)
+    
+    # Drop formats for older versions of the same preamble
+    for entry in os.listdir(fmt_dir):
+        stale = os.path.join(fmt_dir, entry)
+        if entry.startswith(name + '-') and entry.endswith('.fmt') and stale != fmt_file:
+            os.remove(stale)
+    return fmt_file
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: texformat.py <tex_file> <pdflatex_path> [name]")
+        sys.exit(1)
+    
+    tex_file = sys.argv[1]
+    engine_path = sys.argv[2]
+    name = sys.argv[3] if len(sys.argv) > 3 else os.path.splitext(os.path.basename(tex_file))[0]
+    
+    with open(tex_file, 'r', encoding='utf-8') as f:
+        preamble = preamble_of(f.read())
+    version = toolchain.probe_version(engine_path)
+    
+    fmt_file = ensure_format(name, preamble, engine_path, version,
+                             cwd=os.path.dirname(os.path.abspath(tex_file)))
+    if not fmt_file:
+        print("❌ Error: could not build format (is mylatexformat installed?)")
+        sys.exit(1)
+    print(fmt_file)
+    print(f"Compile with: TEXFORMATS={os.path.dirname(fmt_file)}: "
+          f"{engine_path} {format_args(fmt_file)[0]} {os.path.basename(tex_file)}")
+
+if __name__ == '__main__':
+    main()
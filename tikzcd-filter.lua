@@ -1,6 +1,18 @@
 -- Lua filter to replace tikzcd environments with SVG images
 local diagram_counter = 0
 
+-- DIAGRAM_EMBED=object embeds diagrams with <object> instead of <img>.
+-- Needed when extract-tikz.py --shared-glyphs points diagrams at a shared
+-- glyph sprite, since SVGs loaded through <img> cannot reference other files.
+local embed = os.getenv("DIAGRAM_EMBED") or "img"
+
+local function diagram_html(img_path)
+  if embed == "object" then
+    return string.format('<object data="%s" type="image/svg+xml" aria-label="Commutative diagram" style="max-width: 100%%; height: auto; display: block; margin: 1em auto;"></object>', img_path)
+  end
+  return string.format('<img src="%s" alt="Commutative diagram" style="max-width: 100%%; height: auto; display: block; margin: 1em auto;">', img_path)
+end
+
 -- Handle display math that contains tikzcd
 function Para(para)
   local result = {}
@@ -12,7 +24,7 @@ function Para(para)
         local img_path = string.format("diagrams/diagram_%d.svg", diagram_counter)
         diagram_counter = diagram_counter + 1
         
-        local html = string.format('<img src="%s" alt="Commutative diagram" style="max-width: 100%%; height: auto; display: block; margin: 1em auto;">', img_path)
+        local html = diagram_html(img_path)
         table.insert(result, pandoc.RawInline("html", html))
         modified = true
       else
@@ -36,7 +48,7 @@ function RawBlock(el)
       local img_path = string.format("diagrams/diagram_%d.svg", diagram_counter)
       diagram_counter = diagram_counter + 1
       
-      local html = string.format('<p><img src="%s" alt="Commutative diagram" style="max-width: 100%%; height: auto; display: block; margin: 1em auto;"></p>', img_path)
+      local html = '<p>' .. diagram_html(img_path) .. '</p>'
       return pandoc.RawBlock("html", html)
     end
   end
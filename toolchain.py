@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Locate the build tools once and cache their paths and versions
+
+Both build-website.sh and the Python scripts need pandoc, pdflatex,
+pdf2svg and dvisvgm. They are looked up in the environment (PANDOC_PATH,
+PDFLATEX_PATH, ...), then on PATH, then in the usual MacTeX/Homebrew
+locations. The result is kept in .cache/toolchain.json together with each
+binary's size and mtime, so later runs only re-probe a tool when it moved
+or was upgraded. The recorded versions feed the build caches; a tool that
+prints no version (pdf2svg) is identified by a hash of its binary.
+
+    python3 toolchain.py            # show the resolved toolchain
+    python3 toolchain.py --shell    # PANDOC_PATH=... lines for eval
+"""
+import hashlib
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+
+import atomicfile
+
+MANIFEST = '.cache/toolchain.json'
+
+# What a --version line has to contain to count as one
+VERSION_RE = re.compile(r'\d+\.\d+')
+
+TOOLS = {
+    'pandoc': ['/usr/local/bin/pandoc', '/opt/homebrew/bin/pandoc'],
+    'pdflatex': ['/usr/local/texlive/2025/bin/universal-darwin/pdflatex',
+                 '/Library/TeX/texbin/pdflatex'],
+    'pdf2svg': ['/usr/local/bin/pdf2svg', '/opt/homebrew/bin/pdf2svg'],
+    'dvisvgm': ['/usr/local/texlive/2025/bin/universal-darwin/dvisvgm',
+                '/Library/TeX/texbin/dvisvgm'],
+}
+
+INSTALL_HINTS = {
+    'pandoc': 'brew install pandoc',
+    'pdflatex': 'brew install --cask mactex',
+    'pdf2svg': 'brew install pdf2svg',
+    'dvisvgm': 'brew install --cask mactex',
+}
+
+def env_var(name):
+    return name.upper() + '_PATH'
+
+def find(name):
+    """Absolute path of a tool, or None"""
+    override = os.environ.get(env_var(name))
+    candidates = [override] if override else [name] + TOOLS[name]
+    for candidate in candidates:
+        found = shutil.which(candidate)
+        if found:
+            return os.path.abspath(found)
+    return None
+
+def stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+def binary_digest(path):
+    """'sha256:...' of the file path resolves to"""
+    h = hashlib.sha256()
+    with open(os.path.realpath(path), 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return 'sha256:' + h.hexdigest()[:16]
+
+def probe_version(path):
+    """First line printed by `path --version`, or the binary's digest when
+    that is not a version (pdf2svg only prints its usage and fails)"""
+    try:
+        result = subprocess.run([path, '--version'], capture_output=True, text=True)
+        lines = [line.strip() for line in (result.stdout + result.stderr).splitlines() if line.strip()]
+        if result.returncode == 0 and lines and VERSION_RE.search(lines[0]):
+            return lines[0]
+        return binary_digest(path)
+    except OSError:
+        return 'unknown'
+
+def resolve(refresh=False):
+    """Return {name: {'path': ..., 'version': ...}}; path is None if missing"""
+    cached = {} if refresh else atomicfile.read_json(MANIFEST)
+    tools = {}
+    for name in TOOLS:
+        path = find(name)
+        entry = cached.get(name, {})
+        if path is None:
+            tools[name] = {'path': None, 'version': 'missing'}
+        elif entry.get('path') == path and entry.get('stamp') == stamp(path):
+            tools[name] = entry
+        else:
+            tools[name] = {'path': path, 'version': probe_version(path), 'stamp': stamp(path)}
+    if tools != cached:
+        atomicfile.write_json(MANIFEST, tools)
+    return tools
+
+def path(name, tools=None):
+    return (tools or resolve())[name]['path']
+
+def versions(tools=None):
+    """{name: version} for cache keys"""
+    return {name: entry['version'] for name, entry in (tools or resolve()).items()}
+
+def main():
+    args = sys.argv[1:]
+    tools = resolve(refresh='--refresh' in args)
+    
+    if '--shell' in args:
+        for name, entry in tools.items():
+            print(f"{env_var(name)}={shlex.quote(entry['path'] or '')}")
+            print(f"{name.upper()}_VERSION={shlex.quote(entry['version'])}")
+        return
+    
+    for name, entry in tools.items():
+        if entry['path']:
+            print(f"✅ {name}: {entry['path']} ({entry['version']})")
+        else:
+            print(f"⚠️  {name}: not found (install with: {INSTALL_HINTS[name]})")
+
+if __name__ == '__main__':
+    main()
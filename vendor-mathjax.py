@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Vendor a minimal MathJax build under docs/mathjax
+
+pandoc's --mathjax default loads tex-chtml-full.js (every TeX extension)
+from jsDelivr. This scans the generated pages for the TeX commands and
+environments they actually use and writes docs/mathjax/bundle.js: a
+configuration that preloads only the needed extensions, followed by the
+plain tex-chtml component. All extension files and the CHTML fonts are
+copied next to it, so the site needs no CDN: a command the scan missed is
+still typeset, its extension fetched on demand by MathJax's autoload.
+Build pages with --mathjax=mathjax/bundle.js.
+
+The MathJax files come from an unpacked mathjax@3 npm package
+(`npm install mathjax@3`), found at $MATHJAX_DIR or node_modules/mathjax.
+
+    python3 vendor-mathjax.py [docs/index.html ...]
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import sys
+
+OUTPUT_DIR = 'docs/mathjax'
+BUNDLE_URL = 'mathjax/bundle.js'
+DEFAULT_SOURCE = 'node_modules/mathjax'
+
+# tex-chtml.js already contains these TeX packages
+BUILTIN_PACKAGES = ['base', 'ams', 'newcommand', 'noundefined', 'require', 'autoload', 'configmacros']
+
+# Commands and environments that live in an extension outside the component
+COMMAND_EXTENSIONS = {
+    'boldsymbol': 'boldsymbol',
+    'cancel': 'cancel', 'bcancel': 'cancel', 'xcancel': 'cancel', 'cancelto': 'cancel',
+    'color': 'color', 'textcolor': 'color', 'colorbox': 'color', 'fcolorbox': 'color',
+    'definecolor': 'color',
+    'bbox': 'bbox',
+    'enclose': 'enclose',
+    'mathtip': 'action', 'texttip': 'action', 'toggle': 'action',
+    'ce': 'mhchem', 'pu': 'mhchem',
+    'unicode': 'unicode',
+    'verb': 'verb',
+    'href': 'html', 'class': 'html', 'cssId': 'html', 'style': 'html',
+    'bra': 'braket', 'ket': 'braket', 'braket': 'braket', 'Bra': 'braket', 'Ket': 'braket',
+    'Braket': 'braket', 'set': 'braket', 'Set': 'braket',
+    'coloneqq': 'mathtools', 'eqqcolon': 'mathtools', 'mathclap': 'mathtools',
+    'mathllap': 'mathtools', 'mathrlap': 'mathtools', 'prescript': 'mathtools',
+    'upalpha': 'upgreek', 'upbeta': 'upgreek', 'upgamma': 'upgreek', 'updelta': 'upgreek',
+    'begingroup': 'begingroup', 'endgroup': 'begingroup',
+}
+ENVIRONMENT_EXTENSIONS = {
+    'CD': 'amscd',
+}
+
+MATH_RE = re.compile(r'<span\s+class="math (?:inline|display)">(.*?)</span>', re.DOTALL)
+
+def find_source(path=None):
+    """The es5/ directory of a mathjax@3 package, or None"""
+    path = path or os.environ.get('MATHJAX_DIR') or DEFAULT_SOURCE
+    for candidate in [os.path.join(path, 'es5'), path]:
+        if os.path.exists(os.path.join(candidate, 'tex-chtml.js')):
+            return candidate
+    return None
+
+def used_tex(pages):
+    """(commands, environments) used inside math spans"""
+    commands, environments = set(), set()
+    for page in pages:
+        for body in MATH_RE.findall(page):
+            tex = html.unescape(body)
+            commands.update(re.findall(r'\\([A-Za-z]+)', tex))
+            environments.update(re.findall(r'\\begin\{([^}]+)\}', tex))
+    return commands, environments
+
+def needed_extensions(commands, environments):
+    extensions = {COMMAND_EXTENSIONS[c] for c in commands if c in COMMAND_EXTENSIONS}
+    extensions |= {ENVIRONMENT_EXTENSIONS[e] for e in environments if e in ENVIRONMENT_EXTENSIONS}
+    return sorted(extensions)
+
+def config_js(extensions):
+    """MathJax configuration preloading the extensions; autoload stays for the rest"""
+    config = {
+        'loader': {'load': [f'[tex]/{ext}' for ext in extensions]},
+        'tex': {'packages': {'[+]': extensions}},
+    }
+    return 'window.MathJax = ' + json.dumps(config, indent=2) + ';\n'
+
+def vendor(source, extensions, output_dir=OUTPUT_DIR):
+    """Write bundle.js plus the extension and font files into output_dir"""
+    staging = output_dir + '.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    
+    with open(os.path.join(source, 'tex-chtml.js'), 'r', encoding='utf-8') as f:
+        component = f.read()
+    with open(os.path.join(staging, 'bundle.js'), 'w', encoding='utf-8') as f:
+        f.write(config_js(extensions) + component)
+    
+    extension_dir = os.path.join('input', 'tex', 'extensions')
+    shutil.copytree(os.path.join(source, extension_dir), os.path.join(staging, extension_dir))
+    
+    fonts = os.path.join('output', 'chtml', 'fonts', 'woff-v2')
+    shutil.copytree(os.path.join(source, fonts), os.path.join(staging, fonts))
+    
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.replace(staging, output_dir)
+
+def tree_size(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+def main():
+    parser = argparse.ArgumentParser(description="Vendor a minimal MathJax bundle for the generated pages")
+    parser.add_argument('pages', nargs='*', default=['docs/index.html'])
+    parser.add_argument('--mathjax-dir', help=f"mathjax@3 package (default: $MATHJAX_DIR or {DEFAULT_SOURCE})")
+    parser.add_argument('--check', action='store_true',
+                        help="only report whether a MathJax package is available (exit status)")
+    args = parser.parse_args()
+    
+    source = find_source(args.mathjax_dir)
+    if args.check:
+        sys.exit(0 if source else 1)
+    if not source:
+        print("❌ Error: MathJax package not found. Install with: npm install mathjax@3")
+        sys.exit(1)
+    
+    pages = []
+    for path in args.pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    commands, environments = used_tex(pages)
+    extensions = needed_extensions(commands, environments)
+    
+    vendor(source, extensions)
+    print(f"Found {len(commands)} TeX commands and {len(environments)} environments; "
+          f"extra extensions: {', '.join(extensions) or 'none'}")
+    print(f"✅ MathJax vendored in {OUTPUT_DIR}/ ({tree_size(OUTPUT_DIR) // 1024} KB, "
+          f"bundle.js {os.path.getsize(os.path.join(OUTPUT_DIR, 'bundle.js')) // 1024} KB)")
+
+if __name__ == '__main__':
+    main()